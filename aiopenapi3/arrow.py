@@ -0,0 +1,324 @@
+"""
+columnar results - the data of responses of arrays of objects as Apache Arrow record batches
+
+the Arrow schema is derived from the Schema of the items of the array,
+the JSON document is decoded by the Arrow JSON reader without creating an object per row
+
+pyarrow is optional - imported once columnar results are used
+"""
+
+import dataclasses
+import logging
+import re
+from typing import TYPE_CHECKING, Any, Optional, Union
+from collections.abc import Callable, Iterable, Iterator
+
+from .base import ReferenceBase
+from .lazy import LazyModule, loaded
+from .model import Model
+
+if TYPE_CHECKING:
+    import pyarrow
+    from ._types import SchemaType, ReferenceType
+
+
+log = logging.getLogger("aiopenapi3.arrow")
+
+pa = LazyModule("pyarrow")
+pc = LazyModule("pyarrow.compute")
+pj = LazyModule("pyarrow.json")
+
+_TOKENS = re.compile(rb'["\[\]{}]')
+_STRING = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+@dataclasses.dataclass
+class _Check:
+    """
+    a constraint of a column
+    """
+
+    path: tuple[str, ...]
+    """the path of the column - [] for the items of lists"""
+    constraint: str
+    value: Any
+    violates: Callable[["pyarrow.Array"], "pyarrow.Array"]
+    """returns True for the values violating the constraint"""
+
+
+def _resolve(schema: Union["SchemaType", "ReferenceType"]) -> "SchemaType":
+    while isinstance(schema, ReferenceBase):
+        schema = schema._target
+    return schema
+
+
+class Columnar:
+    """
+    the Arrow schema of the items of an array Schema - decodes JSON documents into record batches
+
+    supports primitive types, formats (date-time, date), enums, nullable, objects as structs and arrays as lists
+    """
+
+    def __init__(self, schema: "SchemaType") -> None:
+        if (schema := _resolve(schema)) is None:
+            raise TypeError("the response has no Schema")
+        if "array" not in Model.types(schema) or (items := schema.items) is None or isinstance(items, list):
+            raise TypeError(f"{schema._get_identity('L8')} is not an array")
+        items = _resolve(items)
+        if "object" not in Model.types(items):
+            raise TypeError(f"{schema._get_identity('L8')} is not an array of objects")
+
+        self.checks: list[_Check] = list()
+        """the constraints validated column-wise"""
+        self._active: set[int] = set()
+        fields = self._fields(items, ())
+        self.schema: "pyarrow.Schema" = pa.schema([f for f, _ in fields])
+        """the Arrow schema of the record batches"""
+        self._parse: "pyarrow.Schema" = pa.schema([pa.field("rows", pa.list_(pa.struct([p for _, p in fields])))])
+        """the Arrow schema for the JSON reader - a document of the rows, formats the reader can not decode as string"""
+
+    def _fields(self, schema: "SchemaType", path: tuple[str, ...]) -> list[tuple["pyarrow.Field", "pyarrow.Field"]]:
+        if id(schema) in self._active:
+            raise NotImplementedError("recursive Schema")
+        if getattr(schema, "anyOf", None) or getattr(schema, "oneOf", None) or getattr(schema, "not_", None):
+            raise NotImplementedError("anyOf/oneOf/not")
+        self._active.add(id(schema))
+        properties: dict[str, tuple["SchemaType", bool]] = dict()
+        self._properties(schema, properties)
+        r = list()
+        for name, (f, required) in properties.items():
+            f = _resolve(f)
+            nullable = not required or Model.is_nullable(f)
+            t, p = self._type(f, path + (name,))
+            if path and not nullable:
+                # the children of null structs are null - required properties of nested objects are checked instead
+                self.checks.append(
+                    _Check(
+                        path,
+                        "required",
+                        name,
+                        lambda a, name=name: pc.and_(pc.is_valid(a), pc.is_null(pc.struct_field(a, name))),
+                    )
+                )
+                nullable = True
+            r.append((pa.field(name, t, nullable=nullable), pa.field(name, p)))
+        self._active.discard(id(schema))
+        if not r:
+            raise NotImplementedError("object without properties")
+        return r
+
+    def _properties(self, schema: "SchemaType", r: dict[str, tuple["SchemaType", bool]]) -> None:
+        """
+        the properties of the Schema and its allOf - the properties of the Schema take precedence
+        """
+        for name, f in (schema.properties or dict()).items():
+            r.setdefault(name, (f, name in (schema.required or [])))
+        for i in schema.allOf or []:
+            self._properties(_resolve(i), r)
+
+    def _type(self, schema: "SchemaType", path: tuple[str, ...]) -> tuple["pyarrow.DataType", "pyarrow.DataType"]:
+        """
+        the type of the column and the type for the JSON reader
+        """
+        types = [i for i in Model.types(schema) if i != "null"]
+        if len(types) != 1:
+            raise NotImplementedError(f"{'.'.join(path)} types {types}")
+        type_ = types[0]
+        if schema.enum:
+            values = [i for i in schema.enum if i is not None]
+            self.checks.append(
+                _Check(
+                    path,
+                    "enum",
+                    values,
+                    lambda a: pc.and_(pc.is_valid(a), pc.invert(pc.is_in(a, value_set=pa.array(values)))),
+                )
+            )
+
+        if type_ == "string":
+            self._constraints(schema, path, "string")
+            if schema.format == "date-time":
+                return (t := pa.timestamp("us", tz="UTC")), t
+            elif schema.format == "date":
+                return pa.date32(), pa.string()
+            return pa.string(), pa.string()
+        elif type_ == "integer":
+            self._constraints(schema, path, type_)
+            return (t := pa.int32() if schema.format == "int32" else pa.int64()), t
+        elif type_ == "number":
+            self._constraints(schema, path, type_)
+            return (t := pa.float32() if schema.format == "float" else pa.float64()), t
+        elif type_ == "boolean":
+            return pa.bool_(), pa.bool_()
+        elif type_ == "array":
+            if schema.items is None or isinstance(schema.items, list):
+                raise NotImplementedError(f"{'.'.join(path)} array items")
+            for k, c, op in [("minItems", "min_length", pc.less), ("maxItems", "max_length", pc.greater)]:
+                if (v := getattr(schema, k, None)) is not None:
+                    self.checks.append(_Check(path, c, v, lambda a, op=op, v=v: op(pc.list_value_length(a), v)))
+            t, p = self._type(_resolve(schema.items), path + ("[]",))
+            return pa.list_(t), pa.list_(p)
+        elif type_ == "object":
+            fields = self._fields(schema, path)
+            return pa.struct([f for f, _ in fields]), pa.struct([p for _, p in fields])
+        raise NotImplementedError(type_)
+
+    def _constraints(self, schema: "SchemaType", path: tuple[str, ...], type_: str) -> None:
+        checks: list[tuple[str, Any, Callable[["pyarrow.Array"], "pyarrow.Array"]]] = list()
+        if type_ == "string":
+            if (v := getattr(schema, "minLength", None)) is not None:
+                checks.append(("min_length", v, lambda a, v=v: pc.less(pc.utf8_length(a), v)))
+            if (v := getattr(schema, "maxLength", None)) is not None:
+                checks.append(("max_length", v, lambda a, v=v: pc.greater(pc.utf8_length(a), v)))
+            if (v := getattr(schema, "pattern", None)) is not None:
+                try:
+                    pc.match_substring_regex(pa.array([], pa.string()), v)
+                except pa.ArrowInvalid as e:
+                    log.debug("%s pattern %s is not supported - %s", ".".join(path), v, e)
+                else:
+                    checks.append(("pattern", v, lambda a, v=v: pc.invert(pc.match_substring_regex(a, v))))
+        else:
+            if isinstance(schema, loaded("v20.Schema", "v30.Schema")):
+                bounds = [
+                    ("maximum", pc.greater_equal if schema.exclusiveMaximum else pc.greater),
+                    ("minimum", pc.less_equal if schema.exclusiveMinimum else pc.less),
+                ]
+            else:
+                bounds = [
+                    ("maximum", pc.greater),
+                    ("exclusiveMaximum", pc.greater_equal),
+                    ("minimum", pc.less),
+                    ("exclusiveMinimum", pc.less_equal),
+                ]
+            for k, op in bounds:
+                if (v := getattr(schema, k, None)) is not None and not isinstance(v, bool):
+                    checks.append((k, v, lambda a, op=op, v=v: op(a, v)))
+        self.checks.extend(_Check(path, c, v, f) for c, v, f in checks)
+
+    @staticmethod
+    def invalid_json(e: Exception) -> bool:
+        """
+        the exception was raised for an invalid JSON document - not data not matching the Arrow schema
+        """
+        if isinstance(e, pa.ArrowInvalid):
+            return (m := str(e)).startswith("JSON parse error") and not ("Column(" in m or "required field" in m)
+        return isinstance(e, ValueError) and str(e) == "incomplete JSON document"
+
+    def read(self, data: bytes) -> "pyarrow.RecordBatch":
+        """
+        decode the JSON document of the array
+
+        :param data: the JSON document
+        """
+        return self._read(b'{"rows":' + data + b"}")
+
+    def batches(self, chunks: Iterable[bytes], block_size: int = 1 << 20) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        decode the JSON document of the array in chunks - a record batch per block of block_size bytes
+
+        the items of the array are split incrementally, the JSON document is not required to be in memory at once
+
+        :param chunks: the chunks of the JSON document, e.g. httpx.Response.iter_bytes()
+        :param block_size: the size of the blocks decoded at once
+        """
+        splitter = Splitter(block_size)
+        for chunk in chunks:
+            for block in splitter.feed(chunk):
+                yield self.block(block)
+        splitter.close()
+
+    def block(self, block: bytes) -> "pyarrow.RecordBatch":
+        """
+        decode a block of items of the array - c.f. :class:`Splitter`
+        """
+        return self._read(b'{"rows":[' + block + b"]}")
+
+    def _read(self, document: bytes) -> "pyarrow.RecordBatch":
+        table = pj.read_json(
+            pa.py_buffer(document),
+            read_options=pj.ReadOptions(block_size=len(document) + 1, use_threads=False),
+            parse_options=pj.ParseOptions(
+                explicit_schema=self._parse, newlines_in_values=True, unexpected_field_behavior="ignore"
+            ),
+        )
+        rows = table.column("rows").combine_chunks()
+        return pa.RecordBatch.from_struct_array(rows.values).cast(self.schema)
+
+    def validate(self, batch: "pyarrow.RecordBatch") -> None:
+        """
+        validate the constraints of the columns of the batch
+
+        :raises ValueError: values violate a constraint
+        """
+        for check in self.checks:
+            a = batch.column(check.path[0])
+            for name in check.path[1:]:
+                a = pc.list_flatten(a) if name == "[]" else pc.struct_field(a, name)
+            if (n := pc.sum(check.violates(a)).as_py()) is not None and n > 0:
+                raise ValueError(f"{'.'.join(check.path)}: {n} values violate {check.constraint} {check.value!r}")
+
+
+class Splitter:
+    """
+    split the items of the top level JSON array of a JSON document received in chunks into blocks of block_size bytes
+    """
+
+    def __init__(self, block_size: int) -> None:
+        self.block_size = block_size
+        self._buf = b""
+        self._pos = 0
+        self._depth = 0
+        self._begin: Optional[int] = None
+        """the begin of the items not yielded yet"""
+        self._end: Optional[int] = None
+        """the end of the last complete item"""
+        self.done = False
+        """the end of the array was received"""
+
+    def feed(self, chunk: bytes) -> Iterator[bytes]:
+        """
+        the blocks of items completed by the chunk
+        """
+        if self.done:
+            return
+        buf, pos, depth, begin, end = self._buf + chunk, self._pos, self._depth, self._begin, self._end
+        while (m := _TOKENS.search(buf, pos)) is not None:
+            if (c := buf[m.start()]) == 0x22:  # "
+                if (s := _STRING.match(buf, m.end())) is None:
+                    # the string continues in the next chunk
+                    pos = m.start()
+                    break
+                pos = s.end()
+                continue
+            pos = m.end()
+            if c in b"[{":
+                depth += 1
+                if depth == 1:
+                    begin = pos
+            else:
+                depth -= 1
+                if depth == 1:
+                    end = pos
+                    if end - begin >= self.block_size:
+                        yield buf[begin:end].lstrip(b", \t\r\n")
+                        begin, end = end, None
+                elif depth == 0:
+                    self.done = True
+                    if end is not None:
+                        yield buf[begin:end].lstrip(b", \t\r\n")
+                    return
+        else:
+            pos = len(buf)
+
+        # keep the items not yielded yet
+        if begin is not None:
+            buf, pos, end = buf[begin:], pos - begin, None if end is None else end - begin
+            begin = 0
+        self._buf, self._pos, self._depth, self._begin, self._end = buf, pos, depth, begin, end
+
+    def close(self) -> None:
+        """
+        :raises ValueError: the JSON document is incomplete
+        """
+        if not self.done:
+            raise ValueError("incomplete JSON document")
@@ -0,0 +1,148 @@
+"""
+refreshing the OAuth2 tokens of httpx-auth in the background
+
+httpx-auth requests a token once the token cached is about to expire - the request waits for the token endpoint
+"""
+
+import logging
+import threading
+import time
+from typing import Optional, Union
+
+import httpx
+
+try:
+    import httpx_auth
+except ImportError:
+    httpx_auth = None
+
+
+log = logging.getLogger("aiopenapi3.auth")
+
+
+class TokenRefresh:
+    """
+    renew the OAuth2 tokens of the authorizations used before they expire, requests do not wait for the token endpoint
+
+    supports the flows which do not require user interaction - client credentials & resource owner password
+    the tokens are refreshed until closed
+
+    .. code:: python
+
+        api.token_refresh = TokenRefresh(margin=60)
+        api.authenticate(oauth2={"client_id": "…", "client_secret": "…"})
+        …
+        api.token_refresh.close()
+    """
+
+    def __init__(self, margin: float = 60.0, retry: float = 10.0) -> None:
+        if httpx_auth is None:
+            raise ImportError("refreshing OAuth2 tokens requires httpx-auth")
+        if not all(hasattr(httpx_auth.OAuth2.token_cache, i) for i in ("_add_bearer_token", "_add_access_token")):
+            raise ImportError(
+                f"refreshing OAuth2 tokens is not supported by httpx-auth {getattr(httpx_auth, '__version__', '')}"
+                " - the token cache does not provide _add_bearer_token/_add_access_token"
+            )
+
+        self.margin: float = margin
+        """
+        renew tokens margin seconds before they expire - exceeding the early_expiry of httpx-auth (30s by default)
+        """
+
+        self.retry: float = retry
+        """
+        the delay to retry after requesting a token failed
+        """
+
+        self._timers: dict[str, threading.Timer] = dict()
+        """the timer per token - the state of the authorization"""
+        self._lock = threading.Lock()
+        self._closed: bool = False
+
+    def __enter__(self) -> "TokenRefresh":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def register(self, auth: httpx.Auth) -> None:
+        """
+        refresh the tokens of the authorization - called for each request
+
+        :param auth: the authorization, possibly combining multiple authentication methods
+        """
+        for i in getattr(auth, "authentication_modes", (auth,)):
+            if not isinstance(
+                i, (httpx_auth.OAuth2ClientCredentials, httpx_auth.OAuth2ResourceOwnerPasswordCredentials)
+            ):
+                continue
+            if i.state in self._timers or self._closed:
+                continue
+            with self._lock:
+                if i.state not in self._timers and not self._closed:
+                    self._schedule(i, None)
+
+    def cancel(self) -> None:
+        """
+        stop refreshing the tokens registered
+        """
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+
+    def close(self) -> None:
+        """
+        stop refreshing the tokens - the tokens of authorizations registered later are not refreshed either
+        """
+        with self._lock:
+            self._closed = True
+        self.cancel()
+
+    @staticmethod
+    def _expiry(state: str) -> Optional[float]:
+        if (token := httpx_auth.OAuth2.token_cache.tokens.get(state, None)) is None:
+            return None
+        return token[1]
+
+    def _schedule(self, auth: httpx.Auth, delay: Optional[float]) -> None:
+        if delay is None:
+            if (expiry := self._expiry(auth.state)) is None:
+                # the token is requested by the first request
+                delay = self.retry
+            else:
+                delay = max(0.0, expiry - self.margin - time.time())
+        timer = self._timers[auth.state] = threading.Timer(delay, self._refresh, (auth,))
+        timer.daemon = True
+        timer.start()
+
+    def _refresh(self, auth: httpx.Auth) -> None:
+        delay: Optional[float] = None
+        if (expiry := self._expiry(auth.state)) is None or expiry - self.margin <= time.time():
+            try:
+                self._store(auth.request_new_token())
+                log.debug("refreshed the OAuth2 token %s…", auth.state[:8])
+            except Exception as e:
+                log.warning("refreshing the OAuth2 token %s… failed - %r", auth.state[:8], e)
+                delay = self.retry
+
+        with self._lock:
+            if self._timers.get(auth.state, None) is not threading.current_thread():
+                # cancelled
+                return
+            self._schedule(auth, delay)
+
+    @staticmethod
+    def _store(token: Union[tuple[str, str], tuple[str, str, int], tuple[str, str, int, str]]) -> None:
+        """
+        replace the token cached - the token expiring remains in use until the new token is stored
+        c.f. httpx_auth.TokenMemoryCache.get_token
+
+        the public interface of httpx-auth removes the token expiring before requesting a new one,
+        the private interface used is checked when creating the TokenRefresh
+        """
+        cache = httpx_auth.OAuth2.token_cache
+        if len(token) == 2:
+            cache._add_bearer_token(*token)
+        else:
+            cache._add_access_token(*token)
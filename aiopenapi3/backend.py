@@ -0,0 +1,487 @@
+"""
+the backend creating the data of responses from the Schemas
+
+  * pydantic - the models created for the Schemas (default)
+  * msgspec - msgspec Structs, decoding & validating JSON documents in a single pass,
+    Schemas using constructs msgspec can not represent fall back to pydantic
+"""
+
+import abc
+import datetime
+import importlib.util
+import logging
+import re
+import typing
+import uuid
+from typing import TYPE_CHECKING, Any, ClassVar, ForwardRef, Literal, Optional, Union, Annotated
+from collections.abc import Callable, Sequence
+
+import pydantic
+
+from .base import ReferenceBase
+from .lazy import LazyModule, loaded
+from .model import Model, class_from_schema, type_format_to_class, generate_type_format_to_class, SCHEMA_TYPES
+from . import me
+
+if TYPE_CHECKING:
+    from ._types import SchemaType, ReferenceType
+
+
+log = logging.getLogger("aiopenapi3.backend")
+
+msgspec = LazyModule("msgspec")
+"""
+msgspec is optional - imported once the backend is used
+"""
+
+
+class Backend(abc.ABC):
+    """
+    the interface of the backends
+    """
+
+    name: str
+    """the name of the backend"""
+
+    errors: tuple[type[Exception], ...]
+    """the exceptions raised for data not matching the Schema or invalid JSON documents"""
+
+    @abc.abstractmethod
+    def get_type(self, schema: "SchemaType") -> Any:
+        """
+        the type created for the Schema by this backend
+        """
+
+    @abc.abstractmethod
+    def model(
+        self,
+        schema: "SchemaType",
+        data: Any,
+        json: bool = False,
+        trusted: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+    ) -> Any:
+        """
+        create the data of the type of the Schema - c.f. :meth:`aiopenapi3.base.SchemaBase.model`
+
+        :param schema: the Schema
+        :param data: the data - or the JSON document if json
+        :param json: data is a JSON document
+        """
+
+    @abc.abstractmethod
+    def invalid_json(self, e: Exception) -> bool:
+        """
+        the exception was raised for an invalid JSON document - not data not matching the Schema
+        """
+
+
+class PydanticBackend(Backend):
+    """
+    the pydantic models created for the Schemas
+    """
+
+    name = "pydantic"
+    errors = (pydantic.ValidationError,)
+
+    def get_type(self, schema: "SchemaType") -> Any:
+        return schema.get_type()
+
+    def model(
+        self,
+        schema: "SchemaType",
+        data: Any,
+        json: bool = False,
+        trusted: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+    ) -> Any:
+        validate = schema.model_json if json else schema.model
+        return validate(data, trusted=trusted, fields=fields, plain=plain)
+
+    def invalid_json(self, e: Exception) -> bool:
+        return isinstance(e, pydantic.ValidationError) and any(
+            i["type"] == "json_invalid" for i in e.errors(include_url=False)
+        )
+
+
+class MsgspecBackend(PydanticBackend):
+    """
+    msgspec Structs created for the Schemas
+
+    supports objects, arrays, enums/const, nullable, allOf and unions - discriminated unions require a mapping
+    Schemas using other constructs (not, patternProperties, properties and additionalProperties Schemas, formats msgspec
+    can not decode alike pydantic …) are created using the pydantic backend - per Schema, the Struct of the parent
+    uses the pydantic model for the value, if the Schema of the response itself or a union member is not supported
+    the response is created using pydantic
+
+    properties not described in the Schema are not retained, the data of responses are validated
+    even if the validation policy is trusted, selecting fields and plain results use the pydantic backend
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if importlib.util.find_spec("msgspec") is None:
+            raise ImportError("the msgspec backend requires msgspec - pip install aiopenapi3[msgspec]")
+        self.errors = (pydantic.ValidationError, msgspec.DecodeError)
+        self._types: dict[int, tuple["SchemaType", Optional[tuple[Any, "msgspec.json.Decoder"]]]] = dict()
+
+    def __getstate__(self):
+        return {"errors": self.errors, "_types": dict()}
+
+    def get_type(self, schema: "SchemaType") -> Any:
+        if (r := self._get_decoder(schema)) is None:
+            return super().get_type(schema)
+        return r[0]
+
+    def supports(self, schema: "SchemaType") -> bool:
+        """
+        the Schema can be created as msgspec type - does not fall back to pydantic
+        """
+        return self._get_decoder(schema) is not None
+
+    def model(
+        self,
+        schema: "SchemaType",
+        data: Any,
+        json: bool = False,
+        trusted: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+    ) -> Any:
+        if fields or plain or (r := self._get_decoder(schema)) is None:
+            return super().model(schema, data, json=json, trusted=trusted, fields=fields, plain=plain)
+        if json:
+            value = r[1].decode(data)
+        else:
+            value = msgspec.convert(data, r[0], dec_hook=_Pydantic.decode)
+        # the values of Structs are unwrapped by the Structs
+        return _unwrap(value) if r[2] else value
+
+    def invalid_json(self, e: Exception) -> bool:
+        if isinstance(e, msgspec.DecodeError):
+            return not isinstance(e, msgspec.ValidationError)
+        return super().invalid_json(e)
+
+    def _get_decoder(self, schema: "SchemaType") -> Optional[tuple[Any, "msgspec.json.Decoder", bool]]:
+        """
+        the type, the decoder & if the values decoded contain _Pydantic values to unwrap
+        """
+        schema = _resolve(schema)
+        if (e := self._types.get(id(schema), None)) is None:
+            try:
+                type_ = _Structs().annotation(schema)
+                r = (type_, msgspec.json.Decoder(type_, dec_hook=_Pydantic.decode), _wrapped(type_))
+            except (NotImplementedError, TypeError) as exc:
+                log.debug("%s uses pydantic - %s", schema._get_identity("L8"), exc)
+                r = None
+            e = self._types[id(schema)] = (schema, r)
+        return e[1]
+
+
+def _resolve(schema: Union["SchemaType", "ReferenceType"]) -> "SchemaType":
+    while isinstance(schema, ReferenceBase):
+        schema = schema._target
+    return schema
+
+
+_FORMATS: dict[str, dict[Optional[str], type]] = {
+    "string": {
+        None: str,
+        "date-time": datetime.datetime,
+        "date": datetime.date,
+        "time": datetime.time,
+        "duration": datetime.timedelta,
+        "uuid": uuid.UUID,
+    },
+    "integer": {None: int},
+    "number": {None: float},
+}
+"""
+the formats msgspec decodes alike pydantic, other formats known to pydantic are not supported
+"""
+
+
+class _Pydantic:
+    """
+    the type of the values of Schemas not supported by msgspec - holding the value created using the pydantic model
+
+    msgspec requires the value returned by dec_hook to be an instance of the type,
+    the Structs & MsgspecBackend.model unwrap the values
+    """
+
+    __slots__ = ("value",)
+
+    schema: ClassVar["SchemaType"]
+
+    def __init__(self, value: Any) -> None:
+        self.value: Any = value
+
+    @staticmethod
+    def decode(type_: type, obj: Any) -> Any:
+        if isinstance(type_, type) and issubclass(type_, _Pydantic):
+            return type_(type_.schema.model(obj))
+        raise NotImplementedError(type_)
+
+
+def _wrapped(annotation: Any) -> bool:
+    """
+    the values of the annotation contain _Pydantic values - Structs unwrap their values
+    """
+    if typing.get_origin(annotation) is None and isinstance(annotation, type):
+        return issubclass(annotation, _Pydantic)
+    return any(_wrapped(i) for i in typing.get_args(annotation))
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, _Pydantic):
+        return value.value
+    elif isinstance(value, list):
+        return [_unwrap(i) for i in value]
+    elif isinstance(value, tuple):
+        return tuple(_unwrap(i) for i in value)
+    elif isinstance(value, dict):
+        return {k: _unwrap(v) for k, v in value.items()}
+    return value
+
+
+def _unwrapping(names: tuple[str, ...]) -> Callable[[Any], None]:
+    """
+    the __post_init__ of Structs with values of Schemas not supported by msgspec
+    """
+
+    def __post_init__(self) -> None:
+        for name in names:
+            setattr(self, name, _unwrap(getattr(self, name)))
+
+    return __post_init__
+
+
+class _Structs:
+    """
+    create the msgspec types for a Schema
+    """
+
+    def __init__(self) -> None:
+        self.types: dict[tuple[int, Optional[tuple[str, str]]], Any] = dict()
+        """the types created - by Schema & tag"""
+        self.pending: dict[tuple[int, Optional[tuple[str, str]]], tuple[str, list[bool]]] = dict()
+        """the Structs being created - the name of the forward reference and if it was used"""
+        self.active: set[int] = set()
+        """the Schemas being created"""
+
+    def annotation(self, schema: Union["SchemaType", "ReferenceType", None]) -> Any:
+        if schema is None:
+            return Any
+        schema = _resolve(schema)
+        if (r := self.types.get((id(schema), None), None)) is not None:
+            return r
+        if (p := self.pending.get((id(schema), None), None)) is not None:
+            p[1][0] = True
+            return Optional[ForwardRef(p[0])] if Model.is_nullable(schema) else ForwardRef(p[0])
+        if id(schema) in self.active:
+            return self.fallback(schema, "recursive Schema")
+        root = not self.active
+        self.active.add(id(schema))
+        try:
+            r = self._annotation(schema)
+        except NotImplementedError as e:
+            if root:
+                raise
+            r = self.fallback(schema, e)
+        finally:
+            self.active.discard(id(schema))
+        self.types[(id(schema), None)] = r
+        return r
+
+    def fallback(self, schema: "SchemaType", reason: Any) -> Any:
+        """
+        the values of the Schema are created using the pydantic model
+        """
+        log.debug("%s uses pydantic - %s", schema._get_identity("L8"), reason)
+        return type(schema._get_identity("L8"), (_Pydantic,), dict(schema=schema, __module__=me.__name__))
+
+    def _annotation(self, schema: "SchemaType") -> Any:
+        if getattr(schema, "not_", None) is not None or getattr(schema, "patternProperties", None):
+            raise NotImplementedError("not/patternProperties")
+
+        nullable = Model.is_nullable(schema)
+        if (v := getattr(schema, "const", None)) is not None:
+            r, nullable = Literal[v], False
+        elif schema.enum:
+            if None in schema.enum:
+                nullable = True
+            r = Literal[tuple(i for i in schema.enum if i is not None)]
+        elif getattr(schema, "anyOf", None) or getattr(schema, "oneOf", None):
+            r = self.union(schema)
+        else:
+            types = [i for i in Model.types(schema) if i != "null"]
+            if "null" in Model.types(schema):
+                nullable = True
+            if set(types) | {"null"} == SCHEMA_TYPES and not schema.properties and not schema.allOf:
+                # {} - any value
+                return Any
+            if len(types) == 0:
+                r = None
+            else:
+                members = tuple(self.typed(schema, i) for i in types)
+                r = Union[members] if len(members) > 1 else members[0]
+        if nullable:
+            r = Optional[r]
+        return r
+
+    def typed(self, schema: "SchemaType", type_: str) -> Any:
+        if type_ in ("string", "integer", "number"):
+            if schema.allOf:
+                raise NotImplementedError(f"allOf {type_}")
+            if len(type_format_to_class) == 0:
+                generate_type_format_to_class()
+            if (r := _FORMATS[type_].get(schema.format, None)) is None:
+                if schema.format in type_format_to_class[type_]:
+                    raise NotImplementedError(f"format {schema.format}")
+                r = class_from_schema(schema, type_)
+            if meta := self.constraints(schema, type_):
+                r = Annotated[r, msgspec.Meta(**meta)]
+            return r
+        elif type_ == "boolean":
+            return bool
+        elif type_ == "array":
+            if isinstance(schema.items, list):
+                return tuple[tuple(self.annotation(i) for i in schema.items)]
+            elif schema.items is None:
+                return list[Any]
+            return list[self.annotation(schema.items)]  # type: ignore[misc]
+        elif type_ == "object":
+            return self.struct(schema)
+        raise NotImplementedError(type_)
+
+    @staticmethod
+    def constraints(schema: "SchemaType", type_: str) -> dict[str, Any]:
+        r: dict[str, Any] = dict()
+        if type_ == "string":
+            for k, m in {"maxLength": "max_length", "minLength": "min_length", "pattern": "pattern"}.items():
+                if (v := getattr(schema, k, None)) is not None:
+                    r[m] = v
+        elif isinstance(schema, loaded("v20.Schema", "v30.Schema")):
+            if (v := getattr(schema, "multipleOf", None)) is not None:
+                r["multiple_of"] = v
+            for v0, v1, t0, t1 in [
+                ("maximum", "exclusiveMaximum", "le", "lt"),
+                ("minimum", "exclusiveMinimum", "ge", "gt"),
+            ]:
+                if (v := getattr(schema, v0, None)) is not None:
+                    r[t1 if getattr(schema, v1, False) else t0] = v
+        else:
+            for k, m in {
+                "multipleOf": "multiple_of",
+                "exclusiveMaximum": "lt",
+                "maximum": "le",
+                "exclusiveMinimum": "gt",
+                "minimum": "ge",
+            }.items():
+                if (v := getattr(schema, k, None)) is not None:
+                    r[m] = v
+        return r
+
+    def properties(self, schema: "SchemaType", r: dict[str, tuple["SchemaType", bool]]) -> None:
+        """
+        the properties of the Schema and its allOf - the properties of the Schema take precedence
+        """
+        for name, f in (schema.properties or dict()).items():
+            r.setdefault(name, (f, name in (schema.required or [])))
+        for i in schema.allOf or []:
+            if getattr((i := _resolve(i)), "anyOf", None) or getattr(i, "oneOf", None):
+                raise NotImplementedError("allOf anyOf/oneOf")
+            self.properties(i, r)
+
+    def struct(self, schema: "SchemaType", tag: Optional[tuple[str, str]] = None) -> Any:
+        key = (id(schema), tag)
+        if tag is not None and (r := self.types.get(key, None)) is not None:
+            return r
+
+        properties: dict[str, tuple["SchemaType", bool]] = dict()
+        self.properties(schema, properties)
+        additionalProperties = schema.additionalProperties
+        if not properties and tag is None:
+            if Model.booleanFalse(additionalProperties):
+                pass
+            elif Model.booleanTrue(additionalProperties):
+                return dict[str, Any]
+            else:
+                return dict[str, self.annotation(additionalProperties)]  # type: ignore[misc]
+        elif not (Model.booleanTrue(additionalProperties) or Model.booleanFalse(additionalProperties)):
+            raise NotImplementedError("properties & additionalProperties")
+
+        identity = schema._get_identity("L8")
+        name = re.sub(r"\W", "_", f"{identity}_{tag[1] if tag else ''}_{id(schema):x}", flags=re.ASCII)
+        self.pending[key] = (name, used := [False])
+        try:
+            r = self._struct(schema, tag, identity, properties, additionalProperties)
+        finally:
+            del self.pending[key]
+        if used[0]:
+            setattr(me, name, r)
+        self.types[key] = r
+        return r
+
+    def _struct(
+        self,
+        schema: "SchemaType",
+        tag: Optional[tuple[str, str]],
+        identity: str,
+        properties: dict[str, tuple["SchemaType", bool]],
+        additionalProperties: Any,
+    ) -> Any:
+        fields: list[tuple[str, Any, Any]] = list()
+        rename: dict[str, str] = dict()
+        namespace: dict[str, Any] = dict()
+        for pname, (f, required) in properties.items():
+            attr = Model.nameof(pname)
+            if attr != pname:
+                rename[attr] = pname
+            if tag is not None and pname == tag[0]:
+                namespace[attr] = tag[1]
+                continue
+            a = self.annotation(f)
+            if (default := getattr(_resolve(f), "default", None)) is not None:
+                fields.append((attr, a, default))
+            elif not required:
+                fields.append((attr, Optional[a], None))
+            else:
+                fields.append((attr, a))
+
+        if wrapped := tuple(i[0] for i in fields if _wrapped(i[1])):
+            namespace["__post_init__"] = _unwrapping(wrapped)
+
+        return msgspec.defstruct(
+            identity,
+            fields,
+            module=me.__name__,
+            namespace=namespace,
+            kw_only=True,
+            rename=rename or None,
+            forbid_unknown_fields=Model.booleanFalse(additionalProperties),
+            **(dict(tag_field=tag[0], tag=tag[1]) if tag else dict()),
+        )
+
+    def union(self, schema: "SchemaType") -> Any:
+        if schema.properties or schema.allOf:
+            raise NotImplementedError("anyOf/oneOf & properties")
+        members = schema.anyOf or schema.oneOf
+        discriminator = getattr(schema, "discriminator", None)
+        if discriminator is None or not discriminator.mapping:
+            return Union[tuple(self.annotation(i) for i in members)]
+
+        r = list()
+        for i in members:
+            values = [
+                k
+                for k, v in discriminator.mapping.items()
+                if isinstance(i, ReferenceBase) and getattr(v, "ref", v) == i.ref
+            ]
+            if len(values) != 1 or "object" not in Model.types(target := _resolve(i)):
+                raise NotImplementedError("discriminator mapping")
+            r.append(self.struct(target, tag=(discriminator.propertyName, values[0])))
+        return Union[tuple(r)]
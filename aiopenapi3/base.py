@@ -1,12 +1,12 @@
 import typing
 import warnings
 from typing import Optional, Any, ForwardRef, Union, cast
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 import re
 import builtins
+import hashlib
 import keyword
-import uuid
 import sys
 
 from pathlib import Path
@@ -17,6 +17,7 @@ else:
     from typing_extensions import TypeGuard
 
 from pydantic import RootModel, BaseModel, TypeAdapter, Field, AnyUrl, model_validator, PrivateAttr, ConfigDict
+from pydantic_core import SchemaValidator
 
 from .json import JSONPointer, JSONReference
 from .errors import ReferenceResolutionError, OperationParameterValidationError
@@ -24,6 +25,7 @@ from .errors import ReferenceResolutionError, OperationParameterValidationError
 if typing.TYPE_CHECKING:
     from aiopenapi3 import OpenAPI
     from ._types import SchemaType, JSON, PathItemType, ParameterType, ReferenceType, DiscriminatorType
+    from .backend import Backend
 
 HTTP_METHODS = frozenset(["get", "delete", "head", "post", "put", "patch", "trace"])
 
@@ -92,7 +94,7 @@ class PathItemBase:
 class RootBase:
     @staticmethod
     def resolve(api: "OpenAPI", root: "RootBase", obj, _PathItem, _Reference):
-        from . import v20, v30, v31
+        from .lazy import loaded
 
         def replaceSchemaReference(data):
             def replace(ivalue):
@@ -128,14 +130,14 @@ class RootBase:
                     continue
 
                 # v3.1 - Schema $ref
-                if isinstance(root, (v20.root.Root, v30.root.Root, v31.root.Root)):
+                if isinstance(root, loaded("v20.Root", "v30.Root", "v31.Root")):
                     if isinstance(value, SchemaBase):
                         if (r := getattr(value, "ref", None)) and not isinstance(r, ReferenceBase):
                             value = _Reference.model_construct(ref=r)
                             setattr(obj, slot, value)
 
-                if isinstance(root, (v30.root.Root, v31.root.Root)):
-                    if isinstance(value, (v30.Discriminator, v31.Discriminator)):
+                if isinstance(root, loaded("v30.Root", "v31.Root")):
+                    if isinstance(value, loaded("v30.Discriminator", "v31.Discriminator")):
                         """
                         Discriminated Unions - implementing undefined behavior
                         sub-schemas not having the discriminated property "const" or enum or mismatching the mapping
@@ -199,7 +201,7 @@ class RootBase:
                     PathItem Ref is ambiguous
                     https://github.com/OAI/OpenAPI-Specification/issues/2635
                     """
-                    if isinstance(root, (v20.root.Root, v30.root.Root, v31.root.Root)):
+                    if isinstance(root, loaded("v20.Root", "v30.Root", "v31.Root")):
                         if isinstance(obj, _PathItem) and slot == "ref":
                             ref = _Reference.model_construct(ref=value)
                             ref._target = api.resolve_jr(root, obj, ref)
@@ -223,7 +225,7 @@ class RootBase:
                 else:
                     raise TypeError(type(value), value)
         elif isinstance(obj, dict):
-            if isinstance(root, (v20.root.Root, v31.root.Root)):
+            if isinstance(root, loaded("v20.Root", "v31.Root")):
                 """
                 Resolving/Replacing Swagger 2.0 nested Schema.ref
                 Schema.properties[name] -> Schema.ref ==> Schema.properties[name] -> Reference
@@ -238,7 +240,7 @@ class RootBase:
                     RootBase.resolve(api, root, v, _PathItem, _Reference)
 
         elif isinstance(obj, list):
-            if isinstance(root, (v20.root.Root, v31.root.Root)):
+            if isinstance(root, loaded("v20.Root", "v31.Root")):
                 replaceSchemaReference(obj)
 
             # if it's a list, resolve its item's references
@@ -305,6 +307,49 @@ class ParameterBase:
     pass
 
 
+class ParameterCodecBase(BaseModel):
+    """
+    The Base for encoding & decoding the values of Parameters & Headers - the codecs are compiled once
+    """
+
+    _encoder: Optional[Callable[..., Any]] = PrivateAttr(default=None)
+    """
+    the encoder compiled, c.f. _compile_encoder()
+    """
+
+    _decoder: Optional[Callable[[str], Any]] = PrivateAttr(default=None)
+    """
+    the decoder compiled, c.f. _compile_decoder()
+    """
+
+    def __getstate__(self):
+        """
+        pickle can't do the compiled codecs - remove from pydantic's __getstate__
+        """
+        r = BaseModel.__getstate__(self)
+        if (private := r.get("__pydantic_private__", None)) is not None:
+            r["__pydantic_private__"] = dict(private, _encoder=None, _decoder=None)
+        return r
+
+    def _encode(self, name: Optional[str], value: Any) -> Any:
+        # pydantic's __getattr__ for private attributes is slow - use the storage
+        if (encoder := self.__pydantic_private__.get("_encoder")) is None:
+            encoder = self._encoder = self._compile_encoder()
+        return encoder(name, value)
+
+    def _compile_encoder(self) -> Callable[..., Any]:
+        raise NotImplementedError("specific")
+
+    def _decode(self, value: str) -> Any:
+        # pydantic's __getattr__ for private attributes is slow - use the storage
+        if (decoder := self.__pydantic_private__.get("_decoder")) is None:
+            decoder = self._decoder = self._compile_decoder()
+        return decoder(value)
+
+    def _compile_decoder(self) -> Callable[[str], Any]:
+        raise NotImplementedError("specific")
+
+
 class DiscriminatorBase:
     pass
 
@@ -350,6 +395,29 @@ class SchemaBase(BaseModel):
     The _identity attribute is set during OpenAPI.__init__ and used to create the class name in get_type()
     """
 
+    _location: Optional[str] = PrivateAttr(default=None)
+    """
+    the JSON Reference of component schemas - set during OpenAPI.__init__, None for inline schemas
+    """
+
+    _model_validator: Optional[tuple[type["BaseModel"], Optional[SchemaValidator]]] = PrivateAttr(default=None)
+    """
+    the validator of the root type of _the_ model if it is a RootModel, cached for the model, c.f. model()
+    """
+
+    _model_validator_trusted: Optional[tuple[type["BaseModel"], Optional[SchemaValidator]]] = PrivateAttr(default=None)
+    """
+    the validator of _the_ model not checking the constraints, cached for the model, c.f. model(trusted=True)
+    """
+
+    _model_adapters: dict[
+        tuple[tuple[str, ...], bool, bool], tuple[type["BaseModel"], Union[TypeAdapter, SchemaValidator]]
+    ] = PrivateAttr(default_factory=dict)
+    """
+    the validators of _the_ model reduced to the fields selected and/or as plain dicts & lists,
+    c.f. model(fields=…, plain=…, trusted=…)
+    """
+
     #    items: Optional[Union["SchemaType", List["SchemaType"]]]
 
     def __getstate__(self):
@@ -359,7 +427,13 @@ class SchemaBase(BaseModel):
         """
         r = BaseModel.__getstate__(self)
         try:
-            for k, v in {"_model_type": None, "_model_types": list()}.items():
+            for k, v in {
+                "_model_type": None,
+                "_model_types": list(),
+                "_model_validator": None,
+                "_model_validator_trusted": None,
+                "_model_adapters": dict(),
+            }.items():
                 if k in r["__pydantic_private__"]:
                     r["__pydantic_private__"] = r["__pydantic_private__"].copy()
                     r["__pydantic_private__"][k] = v
@@ -375,7 +449,8 @@ class SchemaBase(BaseModel):
             if name:
                 n = re.sub(r"\W", "_", name, flags=re.ASCII)
             else:
-                n = str(uuid.uuid4()).replace("-", "_")
+                # anonymous schemas are named by content, the name is the same across processes
+                n = self._get_structure(stable=True)[:32]
 
             try:
                 # n = re.sub(r"^([0-9]+)(.*)", r"CLS\1\2", n)
@@ -393,6 +468,75 @@ class SchemaBase(BaseModel):
                 self._identity = name
         return self._identity
 
+    def _get_structure(self, stable: bool = False, hashes: Optional[dict[int, str]] = None) -> str:
+        """
+        A canonical hash of the content of the schema, structurally identical schemas share a single model.
+
+        Inline schemas are hashed by content, references by the model of the target - or the target if the model was
+        not created yet.
+
+        :param stable: hash references by the location or content of the target instead, the hash is the same across
+            processes
+        :param hashes: the hashes of the schemas hashed already - shared across calls, each schema is hashed once
+        """
+        if hashes is None:
+            hashes = dict()
+        stack: list[int] = list()
+        """the schemas being hashed"""
+        low: list[int] = list()
+        """the lowest position on the stack a schema being hashed refers to"""
+
+        def schema(value: "SchemaBase") -> str:
+            if (r := hashes.get(id(value), None)) is not None:
+                return r
+            if id(value) in stack:
+                # a schema embedding itself is a cycle - named by the distance on the stack
+                idx = stack.index(id(value))
+                low[-1] = min(low[-1], idx)
+                return f"cycle:{len(stack) - idx}"
+            stack.append(id(value))
+            low.append(len(stack) - 1)
+            try:
+                r = hashlib.sha256(
+                    repr(
+                        tuple((k, canonical(getattr(value, k))) for k in sorted(type(value).model_fields.keys()))
+                    ).encode()
+                ).hexdigest()
+            finally:
+                stack.pop()
+                lowest = low.pop()
+            if low:
+                low[-1] = min(low[-1], lowest)
+            if lowest >= len(stack):
+                # no cycle to the schemas embedding the schema - the hash does not depend on them
+                hashes[id(value)] = r
+            return r
+
+        def canonical(value: Any) -> Any:
+            if isinstance(value, ReferenceBase):
+                target = value._target
+                if stable:
+                    # the same $ref may refer to different targets in different documents
+                    if (location := getattr(target, "_location", None)) is not None:
+                        return ("$ref", location)
+                    if isinstance(target, SchemaBase):
+                        return ("$ref", schema(target))
+                    return ("$ref", value.ref)
+                if (m := getattr(target, "_model_type", None)) is not None:
+                    return ("$ref", id(m))
+                return ("$ref", id(target))
+            elif isinstance(value, SchemaBase):
+                return ("schema", schema(value))
+            elif isinstance(value, BaseModel):
+                return tuple((k, canonical(getattr(value, k))) for k in sorted(type(value).model_fields.keys()))
+            elif isinstance(value, dict):
+                return tuple(sorted((str(k), canonical(v)) for k, v in value.items()))
+            elif isinstance(value, (list, tuple)):
+                return tuple(canonical(i) for i in value)
+            return (type(value).__name__, value)
+
+        return schema(self)
+
     def set_type(
         self,
         names: Optional[list[str]] = None,
@@ -422,8 +566,14 @@ class SchemaBase(BaseModel):
         discriminators: Optional[Sequence[DiscriminatorBase]] = None,
         extra: Optional[list["SchemaBase"]] = None,
         fwdref: bool = False,
+        backend: Optional["Backend"] = None,
     ) -> Union[type[BaseModel], type[TypeAdapter], ForwardRef]:
+        if backend is not None:
+            return backend.get_type(self)
         if fwdref:
+            if self._model_type is not None:
+                # the model was created already, no need for a forward reference
+                return self._model_type
             if "module" in ForwardRef.__init__.__code__.co_varnames:
                 # FIXME Python < 3.9 compat
                 return ForwardRef(f'__types["{self._get_identity("FWD")}"]', module="aiopenapi3.me")
@@ -436,23 +586,220 @@ class SchemaBase(BaseModel):
         else:
             return self.set_type(names, discriminators, extra)
 
-    def model(self, data: "JSON") -> Union[BaseModel, list[BaseModel]]:
+    def model(
+        self,
+        data: "JSON",
+        trusted: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+        backend: Optional["Backend"] = None,
+    ) -> Union[BaseModel, list[BaseModel], "JSON"]:
         """
         Generates a model representing this schema from the given data.
 
         :param data: The data to create the model from.  Should match this schema.
         :type data: dict
+        :param trusted: The data is trusted, do not check the constraints (pattern, minLength, maximum …)
+        :param fields: Only validate & return the properties of the paths given, e.g. ["id", "owner.name"]
+        :param plain: Return plain dicts & lists instead of Models - validated using TypedDicts
+        :param backend: The backend creating the data - e.g. :class:`aiopenapi3.backend.MsgspecBackend`
 
         :returns: A new :any:`Model` created in this Schema's type from the data.
         :rtype: self.get_type()
         """
-
-        type_ = cast("SchemaType", self.get_type())
+        if backend is not None:
+            return backend.model(self, data, trusted=trusted, fields=fields, plain=plain)
+        if fields or plain:
+            return self._get_adapter(fields, plain, trusted).validate_python(data)
+
+        type_, validator = self._get_validator(trusted)
+        if validator is not None:
+            return validator.validate_python(data)
         r = type_.model_validate(data)
         if isinstance(r, RootModel):
             return r.root
         return r
 
+    def model_json(
+        self,
+        data: Union[str, bytes],
+        trusted: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+        backend: Optional["Backend"] = None,
+    ) -> Union[BaseModel, list[BaseModel], "JSON"]:
+        """
+        Generates a model representing this schema from the given JSON document - c.f. :meth:`model`
+
+        :param data: The JSON document to create the model from.
+        :param trusted: The data is trusted, do not check the constraints
+        :param fields: Only validate & return the properties of the paths given
+        :param plain: Return plain dicts & lists instead of Models
+        :param backend: The backend creating the data
+        """
+        if backend is not None:
+            return backend.model(self, data, json=True, trusted=trusted, fields=fields, plain=plain)
+        if fields or plain:
+            return self._get_adapter(fields, plain, trusted).validate_json(data)
+
+        type_, validator = self._get_validator(trusted)
+        if validator is not None:
+            return validator.validate_json(data)
+        r = type_.model_validate_json(data)
+        if isinstance(r, RootModel):
+            return r.root
+        return r
+
+    def _get_adapter(
+        self, fields: Optional[Sequence[str]], plain: bool, trusted: bool = False
+    ) -> Union[TypeAdapter, SchemaValidator]:
+        """
+        the validator for the model reduced to the fields given and/or using TypedDicts instead of models
+
+        :param trusted: the validator does not check the constraints
+        """
+        from .model import Model
+
+        key = (tuple(sorted(fields or [])), plain, trusted)
+        type_ = cast(type[BaseModel], self.get_type())
+        if (r := self._model_adapters.get(key, None)) is None or r[0] is not type_:
+            t = Model.project(type_, key[0]) if key[0] else type_
+            namespace: dict[str, Any] = dict()
+            if plain:
+                t, namespace = Model.plain(t)
+            adapter: Union[TypeAdapter, SchemaValidator] = TypeAdapter(t)
+            if namespace:
+                # recursive TypedDicts refer to each other by name
+                adapter.rebuild(_types_namespace=namespace)
+            if trusted:
+                adapter = SchemaValidator(_unconstrained(adapter.core_schema, dict()))
+            r = self._model_adapters[key] = (type_, adapter)
+        return r[1]
+
+    def _get_validator(self, trusted: bool = False) -> tuple[type[BaseModel], Optional[SchemaValidator]]:
+        """
+        the model and - for RootModels - the validator of the root type
+
+        the root of a RootModel (arrays, primitive types, unions …) is validated directly,
+        without creating the RootModel to unwrap it
+        """
+        key = "_model_validator_trusted" if trusted else "_model_validator"
+        # private attributes are looked up by BaseModel.__getattr__, use __pydantic_private__ directly
+        private = cast(dict[str, Any], self.__pydantic_private__)
+        if (r := private[key]) is not None and r[0] is private["_model_type"]:
+            return r
+        type_ = cast(type[BaseModel], self.get_type())
+        if not type_.__pydantic_complete__:
+            return type_, None
+        r = private[key] = (type_, _root_validator(type_, trusted))
+        return r
+
+
+_CONSTRAINTS = frozenset(
+    ["pattern", "min_length", "max_length", "gt", "ge", "lt", "le", "multiple_of", "max_digits", "decimal_places"]
+)
+"""
+the keys of the constraints in pydantic core schemas
+"""
+
+_CONSTRAINED = frozenset(
+    ["str", "bytes", "int", "float", "decimal", "date", "time", "datetime", "timedelta", "list", "set", "tuple", "dict"]
+)
+"""
+the types of pydantic core schemas with constraints
+"""
+
+
+def _unconstrained(schema: Any, memo: dict[int, Any]) -> Any:
+    """
+    a copy of the core schema without constraints
+
+    pydantic-core uses the validator of a model class for a model schema - including the constraints,
+    model schemas are replaced with the fields and a function to create the model
+    """
+    if isinstance(schema, dict):
+        if (r := memo.get(id(schema), None)) is not None:
+            return r
+        if not isinstance(type_ := schema.get("type", None), str):
+            r = {k: _unconstrained(v, memo) for k, v in schema.items()}
+        elif type_ == "model":
+            r = {
+                "type": "function-after",
+                "function": {
+                    "type": "no-info",
+                    "function": _constructor(schema["cls"], schema.get("root_model", False)),
+                },
+                "schema": (inner := _unconstrained(schema["schema"], memo)),
+            }
+            if "ref" in schema:
+                r["ref"] = schema["ref"]
+            if inner.get("type", None) == "model-fields" and "extra_behavior" not in inner:
+                inner["extra_behavior"] = (schema.get("config", None) or {}).get("extra_fields_behavior", "ignore")
+        else:
+            constrained = type_ in _CONSTRAINED
+            r = {k: _unconstrained(v, memo) for k, v in schema.items() if not (constrained and k in _CONSTRAINTS)}
+        memo[id(schema)] = r
+        return r
+    elif isinstance(schema, list):
+        return [_unconstrained(i, memo) for i in schema]
+    return schema
+
+
+def _constructor(cls: type[BaseModel], root: bool) -> Any:
+    """
+    create the model from the validated fields - c.f. BaseModel.model_construct
+    """
+    setattr_ = object.__setattr__
+
+    def construct(value: Any) -> BaseModel:
+        m = cls.__new__(cls)
+        if root:
+            fields, extra, fields_set = {"root": value}, None, {"root"}
+        else:
+            fields, extra, fields_set = value
+        setattr_(m, "__dict__", fields)
+        setattr_(m, "__pydantic_extra__", extra)
+        setattr_(m, "__pydantic_fields_set__", fields_set)
+        setattr_(m, "__pydantic_private__", None)
+        if cls.__pydantic_post_init__:
+            m.model_post_init(None)
+        return m
+
+    return construct
+
+
+def _root_validator(type_: type[BaseModel], trusted: bool = False) -> Optional[SchemaValidator]:
+    """
+    the validator for the root of a RootModel - created from the core schema of the RootModel
+
+    a TypeAdapter of the annotation of the root would have to resolve the forward references again
+
+    :param trusted: the validator does not check the constraints - for all models
+    """
+    schema = type_.__pydantic_core_schema__
+    config = schema.get("config", None)
+    if issubclass(type_, RootModel):
+        definitions = []
+        root = schema
+        if root["type"] == "definitions":
+            definitions = root["definitions"]
+            root = root["schema"]
+        if root["type"] == "definition-ref":
+            root = next(filter(lambda x: x.get("ref", None) == root["schema_ref"], definitions))
+        if root["type"] == "model" and root.get("root_model", False):
+            config = root.get("config", None)
+            schema = root["schema"]
+            if definitions:
+                schema = {"type": "definitions", "schema": schema, "definitions": definitions}
+        else:
+            return None
+    elif not trusted:
+        return None
+
+    if trusted:
+        schema = _unconstrained(schema, dict())
+    return SchemaValidator(schema, config)
+
 
 class OperationBase:
     # parameters: Optional[List[Union[ParameterBase, ReferenceBase]]]
@@ -0,0 +1,269 @@
+"""
+failing fast for upstreams which are degraded - a circuit per server & Operation
+
+  * closed - requests are sent, the outcome of the last calls is recorded
+  * open - the failure rate or slow call rate exceeded the threshold, requests fail without being sent
+  * half-open - after waiting, a few trial requests are sent to decide on closing or opening the circuit again
+
+requests to upstreams which are degraded do not wait for timeouts, tying up threads & tasks
+"""
+
+import collections
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Literal, Optional
+from collections.abc import Hashable
+
+import httpx
+
+from .errors import CircuitOpenError
+
+if TYPE_CHECKING:
+    from .request import RequestBase
+
+
+log = logging.getLogger("aiopenapi3.circuitbreaker")
+
+State = Literal["closed", "open", "half-open"]
+
+
+class Call:
+    """
+    record the outcome of a request - the exceptions & the status_code of the response
+    without circuit, nothing is recorded
+    """
+
+    __slots__ = ("circuit", "started", "status_code")
+
+    def __init__(self, circuit: Optional["Circuit"]) -> None:
+        self.circuit: Optional["Circuit"] = circuit
+        self.started: Optional[float] = None
+        """the time.monotonic() the request was sent - None if not sent"""
+        self.status_code: Optional[int] = None
+
+    def __enter__(self) -> "Call":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.circuit is None:
+            return
+        if self.started is None or (exc_type is not None and not issubclass(exc_type, Exception)):
+            # not sent or cancelled
+            self.circuit.release()
+        elif exc_type is not None and (self.status_code is None or issubclass(exc_type, httpx.TransportError)):
+            # sending the request or receiving the body failed
+            self.circuit.record(time.monotonic() - self.started, None)
+        else:
+            self.circuit.record(time.monotonic() - self.started, self.status_code)
+
+
+class Circuit:
+    """
+    the circuit of a key
+    """
+
+    def __init__(self, breaker: "CircuitBreaker", key: Hashable) -> None:
+        self.breaker: "CircuitBreaker" = breaker
+        self.key: Hashable = key
+
+        self.state: State = "closed"
+        """the state"""
+
+        self.calls: collections.deque[tuple[bool, bool]] = collections.deque(maxlen=breaker.window)
+        """the outcome of the last calls - (failed, slow)"""
+
+        self.opened: float = 0.0
+        """the time.monotonic() the circuit opened"""
+
+        self.rejected: int = 0
+        """the number of requests rejected"""
+
+        self._trials: int = 0
+        self._lock = threading.Lock()
+
+    @property
+    def failure_rate(self) -> Optional[float]:
+        """the ratio of the calls recorded which failed"""
+        if not (calls := self.calls):
+            return None
+        return sum(1 for failed, _ in calls if failed) / len(calls)
+
+    @property
+    def slow_call_rate(self) -> Optional[float]:
+        """the ratio of the calls recorded which were slow"""
+        if not (calls := self.calls):
+            return None
+        return sum(1 for _, slow in calls if slow) / len(calls)
+
+    @property
+    def retry(self) -> Optional[float]:
+        """the seconds until the open circuit is half-open"""
+        if self.state != "open":
+            return None
+        return max(0.0, self.opened + self.breaker.wait - time.monotonic())
+
+    def _transition(self, state: State) -> None:
+        if state == "open":
+            self.opened = time.monotonic()
+            log.warning(
+                "circuit %s open - failure rate %s slow call rate %s", self.key, self.failure_rate, self.slow_call_rate
+            )
+        else:
+            log.info("circuit %s %s", self.key, state)
+        previous, self.state = self.state, state
+        self.calls.clear()
+        self._trials = 0
+        for listener in self.breaker.listeners:
+            listener(self, previous, state)
+
+    def acquire(self) -> bool:
+        """
+        permit a call
+
+        :return: the call is permitted - the circuit is closed, or half-open with trial calls remaining
+        """
+        with self._lock:
+            if self.state == "open":
+                if self.opened + self.breaker.wait > time.monotonic():
+                    self.rejected += 1
+                    return False
+                self._transition("half-open")
+            if self.state == "half-open":
+                if self._trials >= self.breaker.half_open_calls:
+                    self.rejected += 1
+                    return False
+                self._trials += 1
+            return True
+
+    def release(self) -> None:
+        """
+        the call was cancelled - without outcome
+        """
+        with self._lock:
+            if self.state == "half-open" and self._trials > 0:
+                self._trials -= 1
+
+    def record(self, duration: float, status_code: Optional[int]) -> None:
+        """
+        record the outcome of a call
+
+        :param duration: the seconds until the response was received
+        :param status_code: the status_code of the response - None if the request failed
+        """
+        breaker = self.breaker
+        failed = status_code is None or breaker.failure_status[0] <= status_code <= breaker.failure_status[1]
+        slow = duration >= breaker.slow_call_duration
+        with self._lock:
+            if self.state == "open":
+                # calls sent before the circuit opened
+                return
+            self.calls.append((failed, slow))
+            if self.state == "half-open":
+                if len(self.calls) < breaker.half_open_calls:
+                    return
+            elif len(self.calls) < breaker.minimum_calls:
+                return
+            if self.failure_rate >= breaker.failure_rate or self.slow_call_rate >= breaker.slow_call_rate:
+                self._transition("open")
+            elif self.state == "half-open":
+                self._transition("closed")
+
+
+class CircuitBreaker:
+    """
+    a circuit per server & Operation
+
+    .. code:: python
+
+        api.circuit_breaker = CircuitBreaker(failure_rate=0.5, slow_call_duration=5.0, wait=30.0)
+
+    requests to a circuit which is open raise :class:`aiopenapi3.errors.CircuitOpenError`
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 1.0,
+        slow_call_duration: float = 60.0,
+        window: int = 100,
+        minimum_calls: int = 10,
+        wait: float = 60.0,
+        half_open_calls: int = 5,
+        failure_status: tuple[int, int] = (500, 599),
+    ) -> None:
+        if not 0 < failure_rate <= 1 or not 0 < slow_call_rate <= 1:
+            raise ValueError(f"circuit breaker rates {failure_rate} {slow_call_rate}")
+        if not 0 < minimum_calls <= window or not 0 < half_open_calls <= window:
+            raise ValueError(f"circuit breaker calls {minimum_calls} {window} {half_open_calls}")
+
+        self.failure_rate: float = failure_rate
+        """open the circuit if the ratio of calls failed reaches the threshold"""
+
+        self.slow_call_rate: float = slow_call_rate
+        """open the circuit if the ratio of slow calls reaches the threshold"""
+
+        self.slow_call_duration: float = slow_call_duration
+        """calls taking longer than slow_call_duration seconds to receive the response are slow"""
+
+        self.window: int = window
+        """the number of the last calls recorded"""
+
+        self.minimum_calls: int = minimum_calls
+        """the number of calls required to calculate the rates"""
+
+        self.wait: float = wait
+        """the seconds to wait before the circuit is half-open"""
+
+        self.half_open_calls: int = half_open_calls
+        """the number of trial calls in the half-open state"""
+
+        self.failure_status: tuple[int, int] = failure_status
+        """the range of status codes of responses failed - requests raising failed as well"""
+
+        self.circuits: dict[Hashable, Circuit] = dict()
+        """
+        the circuits by (server, Operation)
+        """
+
+        self.listeners: list[Callable[[Circuit, State, State], None]] = list()
+        """
+        called on state transitions of the circuits - listener(circuit, previous, state)
+        the listeners are called holding the lock of the circuit
+        """
+
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(request: "RequestBase", req: httpx.Request) -> Hashable:
+        """
+        the key of the circuit for the request - (server, operationId)
+        """
+        return (
+            f"{req.url.scheme}://{req.url.netloc.decode()}",
+            request.operation.operationId or f"{request.method} {request.path}",
+        )
+
+    def circuit(self, request: "RequestBase", req: httpx.Request) -> Circuit:
+        """
+        the circuit for the request - created on demand
+        """
+        key = self.key(request, req)
+        if (circuit := self.circuits.get(key, None)) is None:
+            with self._lock:
+                if (circuit := self.circuits.get(key, None)) is None:
+                    circuit = self.circuits[key] = Circuit(self, key)
+        return circuit
+
+    def call(self, request: "RequestBase", req: httpx.Request) -> Call:
+        """
+        permit the request
+
+        :raises CircuitOpenError: the circuit is open
+        :return: the Call to record the outcome of the request
+        """
+        circuit = self.circuit(request, req)
+        if not circuit.acquire():
+            data, parameters = (request.vars.data, request.vars.parameters) if request.vars else (None, None)
+            raise CircuitOpenError(request.operation, request, data, parameters, circuit.key, circuit.retry)
+        return Call(circuit)
@@ -29,7 +29,6 @@ from .openapi import OpenAPI
 
 from .loader import ChainLoader, RedirectLoader, WebLoader
 import aiopenapi3.loader
-from aiopenapi3.v30.formdata import decode_content_type
 from .log import init
 
 if typing.TYPE_CHECKING:
@@ -145,6 +144,18 @@ def schema_display_stats(api, duration):
     print(f"… {ss} schemas total")
 
 
+def profile_display(api, format_, limit, output=None):
+    if format_ == "json":
+        data = json.dumps(api.profile.as_dict(), indent=2)
+    else:
+        data = api.profile.format(limit=limit)
+
+    if output:
+        Path(output).write_text(data)
+    else:
+        print(data)
+
+
 def main(argv=None):
     global log
     plugins = []
@@ -193,6 +204,8 @@ def main(argv=None):
     cmd.add_argument("-f", "--format")
 
     def cmd_call(args: argparse.Namespace) -> None:
+        from aiopenapi3.mediatype import parse_content_type
+
         loader = loader_prepare(args, session_factory)
 
         def prepare_arg(value):
@@ -253,8 +266,7 @@ def main(argv=None):
             return
 
         ct = response.headers["content-type"]
-        type, subtype, _ = decode_content_type(ct)
-        if f"{type}/{subtype}" == "application/json":
+        if parse_content_type(ct).media_type == "application/json":
             obj = response.json()
             if args.format:
                 assert expr
@@ -268,6 +280,11 @@ def main(argv=None):
 
     cmd = sub.add_parser("validate")
     cmd.add_argument("input")
+    cmd.add_argument(
+        "-r", "--report", choices=["text", "json"], default=None, help="report the startup profile (sorted by time)"
+    )
+    cmd.add_argument("--report-limit", type=int, default=25, help="number of samples in the text report")
+    cmd.add_argument("--report-file", type=str, default=None, help="write the report to a file")
 
     def cmd_validate(args: argparse.Namespace) -> None:
         loader = loader_prepare(args, session_factory)
@@ -286,6 +303,8 @@ def main(argv=None):
         else:
             if args.verbose:
                 schema_display_stats(api, duration)
+            if args.report:
+                profile_display(api, args.report, args.report_limit, args.report_file)
             print("OK")
 
     cmd.set_defaults(func=cmd_validate)
@@ -0,0 +1,379 @@
+"""
+adaptive concurrency limiting - the number of requests in flight per server or Operation
+
+the limit adapts to the latency observed & the requests dropped by the upstream (429, 503, errors)
+
+  * AIMD - additive increase, multiplicative decrease on requests dropped
+  * Gradient - the ratio of the long term latency & the latency observed, decrease once the latency increases
+
+requests exceeding the limit are queued - optionally with a deadline
+"""
+
+import asyncio
+import collections
+import logging
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Literal, Optional, Union
+from collections.abc import Hashable
+
+import httpx
+
+from .errors import ConcurrencyLimitError, RequestError
+
+if TYPE_CHECKING:
+    from .request import RequestBase
+
+
+log = logging.getLogger("aiopenapi3.concurrency")
+
+
+class AIMD:
+    """
+    increase the limit by 1 for requests succeeded while the limit is used, decrease it by backoff on requests dropped
+    """
+
+    def __init__(self, backoff: float = 0.9, timeout: float = 5.0) -> None:
+        self.backoff: float = backoff
+        """the ratio to decrease the limit on requests dropped"""
+        self.timeout: float = timeout
+        """requests taking longer than timeout seconds are considered dropped"""
+
+    def update(self, limit: float, rtt: float, inflight: int, dropped: bool) -> float:
+        if dropped or rtt >= self.timeout:
+            return limit * self.backoff
+        if inflight * 2 >= limit:
+            return limit + 1
+        return limit
+
+
+class Gradient:
+    """
+    the ratio of the long term average latency & the latency observed - c.f. Netflix concurrency-limits Gradient2
+
+    the limit increases by the queue allowance sqrt(limit) while the latency remains, decreases once it increases
+    """
+
+    def __init__(self, tolerance: float = 1.5, smoothing: float = 0.2, window: int = 600, backoff: float = 0.9) -> None:
+        self.tolerance: float = tolerance
+        """the ratio the latency may exceed the long term latency before the limit decreases"""
+        self.smoothing: float = smoothing
+        """the weight of the new limit"""
+        self.window: int = window
+        """the number of samples of the long term latency average"""
+        self.backoff: float = backoff
+        """the ratio to decrease the limit on requests dropped"""
+
+        self.rtt: Optional[float] = None
+        """the long term latency average"""
+
+    def update(self, limit: float, rtt: float, inflight: int, dropped: bool) -> float:
+        if dropped:
+            return limit * self.backoff
+        if self.rtt is None:
+            self.rtt = rtt
+        else:
+            self.rtt += (rtt - self.rtt) / self.window
+            if self.rtt / rtt > 2:
+                # the long term latency recovers faster from an increased latency
+                self.rtt = rtt * 2
+        if inflight * 2 < limit:
+            # the limit is not used - the latency is not representative
+            return limit
+        gradient = max(0.5, min(1.0, self.tolerance * self.rtt / rtt))
+        new = limit * gradient + math.sqrt(limit)
+        return limit * (1 - self.smoothing) + new * self.smoothing
+
+
+class Slot:
+    """
+    the slot of a request in flight - releasing the slot updates the limit with the outcome of the request
+    without limit, nothing is recorded
+    """
+
+    __slots__ = ("limit", "started", "status_code")
+
+    def __init__(self, limit: Optional["Limit"]) -> None:
+        self.limit: Optional["Limit"] = limit
+        self.started: Optional[float] = None
+        """the time of the clock the request was sent - None if not sent"""
+        self.status_code: Optional[int] = None
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        """the clock measuring the latency - c.f. ConcurrencyLimiter.clock"""
+        return self.limit.limiter.clock if self.limit is not None else time.monotonic
+
+    def __enter__(self) -> "Slot":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.limit is None:
+            return
+        if self.started is None:
+            # not sent - no sample
+            self.limit.release(0.0, None)
+            return
+        dropped: Optional[bool]
+        if exc_type is not None and issubclass(exc_type, (RequestError, httpx.TransportError)):
+            # sending the request or receiving the body failed
+            dropped = True
+        elif self.status_code is not None and (exc_type is None or issubclass(exc_type, Exception)):
+            dropped = self.status_code in self.limit.limiter.drop_status
+        else:
+            # cancelled - no sample
+            dropped = None
+        self.limit.release(self.limit.limiter.clock() - self.started, dropped)
+
+
+class Limit:
+    """
+    the concurrency limit of a key
+    """
+
+    def __init__(self, limiter: "ConcurrencyLimiter", key: Hashable) -> None:
+        self.limiter: "ConcurrencyLimiter" = limiter
+        self.key: Hashable = key
+
+        self.limit: float = limiter.initial
+        """the current limit"""
+
+        self.inflight: int = 0
+        """the number of requests in flight"""
+
+        self.rejected: int = 0
+        """the number of requests rejected - the queue is full or the deadline passed"""
+
+        self.algorithm: Union[AIMD, Gradient] = limiter.algorithm()
+        self._queue: collections.deque[Union[threading.Event, tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = (
+            collections.deque()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def queued(self) -> int:
+        """the number of requests queued"""
+        return len(self._queue)
+
+    def _available(self) -> bool:
+        return self.inflight < max(1, int(self.limit))
+
+    def _grant(self) -> None:
+        while self._queue and self._available():
+            waiter = self._queue.popleft()
+            self.inflight += 1
+            if isinstance(waiter, threading.Event):
+                waiter.set()
+            else:
+                loop, future = waiter
+                loop.call_soon_threadsafe(self._resolve, future)
+
+    def _resolve(self, future: asyncio.Future) -> None:
+        if future.done():
+            # the deadline passed after the slot was granted
+            self.release(0.0, None)
+        else:
+            future.set_result(None)
+
+    def _enqueue(self, waiter) -> Optional[bool]:
+        """
+        acquire or queue - holding the lock
+
+        :return: the slot was acquired without waiting - None if the queue is full
+        """
+        if not self._queue and self._available():
+            self.inflight += 1
+            return True
+        if (m := self.limiter.max_queue) is not None and len(self._queue) >= m:
+            self.rejected += 1
+            return None
+        self._queue.append(waiter)
+        return False
+
+    def _dequeue(self, waiter) -> bool:
+        """
+        remove the waiter after the deadline passed - holding the lock
+
+        :return: the waiter was queued still
+        """
+        try:
+            self._queue.remove(waiter)
+        except ValueError:
+            return False
+        return True
+
+    def acquire(self, timeout: Optional[float]) -> bool:
+        """
+        acquire a slot - blocking
+
+        :return: the slot was acquired - False if the queue is full or the deadline passed
+        """
+        event = threading.Event()
+        with self._lock:
+            if (r := self._enqueue(event)) is not False:
+                return bool(r)
+        if event.wait(timeout):
+            return True
+        with self._lock:
+            if not self._dequeue(event):
+                # granted after the deadline passed
+                return True
+            self.rejected += 1
+        return False
+
+    async def aacquire(self, timeout: Optional[float]) -> bool:
+        """
+        acquire a slot - asynchronous
+
+        :return: the slot was acquired - False if the queue is full or the deadline passed
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            if (r := self._enqueue((loop, future))) is not False:
+                return bool(r)
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except BaseException as e:
+            with self._lock:
+                queued = self._dequeue((loop, future))
+            if not queued and future.done() and not future.cancelled():
+                # granted - the slot is not used
+                self.release(0.0, None)
+            # granted after the deadline passed & cancelled - released by _resolve
+            if isinstance(e, asyncio.TimeoutError):
+                self.rejected += 1
+                return False
+            raise
+
+    def release(self, rtt: float, dropped: Optional[bool]) -> None:
+        """
+        release the slot & update the limit
+
+        :param rtt: the seconds until the response was read
+        :param dropped: the request was dropped by the upstream - None for requests without outcome
+        """
+        limiter = self.limiter
+        with self._lock:
+            if dropped is not None:
+                limit = self.algorithm.update(self.limit, rtt, self.inflight, dropped)
+                self.limit = min(limiter.maximum, max(limiter.minimum, limit))
+            self.inflight -= 1
+            self._grant()
+
+
+class ConcurrencyLimiter:
+    """
+    limit the number of requests in flight per server or Operation - the limit adapts to the upstream
+
+    .. code:: python
+
+        api.concurrency_limit = ConcurrencyLimiter(Gradient, per="server", timeout=10.0)
+
+    requests exceeding the limit are queued, requests not sent within the deadline raise
+    :class:`aiopenapi3.errors.ConcurrencyLimitError`
+    """
+
+    def __init__(
+        self,
+        algorithm: Callable[[], Union[AIMD, Gradient]] = AIMD,
+        per: Union[Literal["server", "operation"], Callable[["RequestBase", httpx.Request], Hashable]] = "server",
+        initial: int = 10,
+        minimum: int = 1,
+        maximum: int = 200,
+        timeout: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        drop_status: tuple[int, ...] = (429, 503),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not callable(per) and per not in ("server", "operation"):
+            raise ValueError(f"concurrency limit per {per}")
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError(f"concurrency limit {minimum} {initial} {maximum}")
+
+        self.algorithm: Callable[[], Union[AIMD, Gradient]] = algorithm
+        """creates the algorithm of a limit - e.g. AIMD, functools.partial(Gradient, tolerance=2.0)"""
+
+        self.per: Union[str, Callable[["RequestBase", httpx.Request], Hashable]] = per
+        """
+        the key of the limits
+
+          * server - per scheme, host & port
+          * operation - per server & Operation
+          * a callable returning the key for the request
+        """
+
+        self.initial: int = initial
+        self.minimum: int = minimum
+        self.maximum: int = maximum
+
+        self.timeout: Optional[float] = timeout
+        """the deadline for requests queued - None to wait"""
+
+        self.max_queue: Optional[int] = max_queue
+        """the maximum number of requests queued per limit - None for unlimited"""
+
+        self.drop_status: tuple[int, ...] = drop_status
+        """the status codes of responses indicating the upstream is overloaded"""
+
+        self.clock: Callable[[], float] = clock
+        """the monotonic clock measuring the latency - time.monotonic"""
+
+        self.limits: dict[Hashable, Limit] = dict()
+        """
+        the limits by key
+        """
+
+        self._lock = threading.Lock()
+
+    def key(self, request: "RequestBase", req: httpx.Request) -> Hashable:
+        """
+        the key of the limit for the request
+        """
+        if callable(self.per):
+            return self.per(request, req)
+        server = f"{req.url.scheme}://{req.url.netloc.decode()}"
+        if self.per == "operation":
+            return (server, request.operation.operationId or f"{request.method} {request.path}")
+        return server
+
+    def limit(self, request: "RequestBase", req: httpx.Request) -> Limit:
+        """
+        the limit for the request - created on demand
+        """
+        key = self.key(request, req)
+        if (limit := self.limits.get(key, None)) is None:
+            with self._lock:
+                if (limit := self.limits.get(key, None)) is None:
+                    limit = self.limits[key] = Limit(self, key)
+        return limit
+
+    @staticmethod
+    def _error(request: "RequestBase", limit: Limit) -> ConcurrencyLimitError:
+        log.debug("concurrency limit %s - rejected (limit %d, queued %d)", limit.key, int(limit.limit), limit.queued)
+        data, parameters = (request.vars.data, request.vars.parameters) if request.vars else (None, None)
+        return ConcurrencyLimitError(request.operation, request, data, parameters, limit.key, int(limit.limit))
+
+    def acquire(self, request: "RequestBase", req: httpx.Request) -> Slot:
+        """
+        wait for a slot - blocking
+
+        :raises ConcurrencyLimitError: the queue is full or the deadline passed
+        """
+        limit = self.limit(request, req)
+        if not limit.acquire(self.timeout):
+            raise self._error(request, limit)
+        return Slot(limit)
+
+    async def aacquire(self, request: "RequestBase", req: httpx.Request) -> Slot:
+        """
+        wait for a slot - asynchronous
+
+        :raises ConcurrencyLimitError: the queue is full or the deadline passed
+        """
+        limit = self.limit(request, req)
+        if not await limit.aacquire(self.timeout):
+            raise self._error(request, limit)
+        return Slot(limit)
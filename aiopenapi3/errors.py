@@ -1,5 +1,5 @@
 import typing
-from typing import Optional
+from typing import Any, Optional
 import dataclasses
 
 import httpx
@@ -101,6 +101,32 @@ class RequestError(HTTPError):
             return f"<{self.__class__.__name__}>"
 
 
+@dataclasses.dataclass(repr=False)
+class CircuitOpenError(RequestError):
+    """the circuit of the server & Operation is open - the request was not sent"""
+
+    key: Any = None
+    """the key of the circuit - (server, operationId)"""
+    retry: Optional[float] = None
+    """the seconds until the circuit is half-open - None for half-open circuits with the trial calls in progress"""
+
+    def __str__(self):
+        return f"<{self.__class__.__name__} {self.key} retry {self.retry}>"
+
+
+@dataclasses.dataclass(repr=False)
+class ConcurrencyLimitError(RequestError):
+    """the request was not sent within the deadline - or the queue was full - as the concurrency limit is reached"""
+
+    key: Any = None
+    """the key of the limit - the server or (server, operationId)"""
+    limit: Optional[int] = None
+    """the concurrency limit"""
+
+    def __str__(self):
+        return f"<{self.__class__.__name__} {self.key} limit {self.limit}>"
+
+
 class ResponseError(HTTPError):
     """the response can not be processed accordingly"""
 
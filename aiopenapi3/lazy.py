@@ -0,0 +1,44 @@
+"""
+the version specific subpackages v20, v30 & v31 are expensive to import - creating & building their pydantic models
+
+they are imported once a description document of the version is parsed instead of importing aiopenapi3
+"""
+
+import importlib
+import operator
+import sys
+import types
+from typing import Any
+
+
+class LazyModule(types.ModuleType):
+    """
+    a module which is imported on first attribute access
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(importlib.import_module(self.__name__), item)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self.__name__!r}>"
+
+
+def loaded(*names: str) -> tuple[type, ...]:
+    """
+    the classes of the version specific subpackages imported already
+
+    an object can not be an instance of a class of a subpackage which was not imported yet,
+    using the classes returned for isinstance checks does not import the subpackages
+
+    :param names: the classes e.g. "v20.Root", "v30.paths.Response"
+    """
+    r = []
+    for name in names:
+        version, _, attr = name.partition(".")
+        if (module := sys.modules.get(f"aiopenapi3.{version}", None)) is None:
+            continue
+        r.append(operator.attrgetter(attr)(module))
+    return tuple(r)
@@ -0,0 +1,70 @@
+"""
+parsing Content-Type header values - https://datatracker.ietf.org/doc/html/rfc7231#section-3.1.1.1
+
+    media-type = type "/" subtype *( OWS ";" OWS parameter )
+    parameter  = token "=" ( token / quoted-string )
+
+the distinct values received are few - the results are cached per header value
+"""
+
+import functools
+import re
+from typing import NamedTuple, Optional
+
+
+_PARAMETER = re.compile(r'[ \t]*;[ \t]*(?:([^\s;="]+)[ \t]*=[ \t]*("(?:[^"\\]|\\.)*"|[^;"]*)|[^;]*)', re.DOTALL)
+_QUOTED_PAIR = re.compile(r"\\(.)", re.DOTALL)
+
+
+class ContentType(NamedTuple):
+    """
+    a parsed Content-Type - type, subtype & parameter names are case-insensitive and lowercase
+    """
+
+    media_type: str
+    """type/subtype"""
+    type: str
+    subtype: str
+    parameters: tuple[tuple[str, str], ...]
+    """the parameters - quoted-string values unquoted"""
+
+    def parameter(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        the value of the parameter
+
+        :param name: the lowercase name of the parameter
+        """
+        for k, v in self.parameters:
+            if k == name:
+                return v
+        return default
+
+
+@functools.lru_cache(maxsize=256)
+def parse_content_type(value: str) -> ContentType:
+    """
+    parse the value of a Content-Type header
+
+    invalid parameters are ignored, parsing stops at the first parameter which can not be parsed
+
+    :param value: the header value, e.g. 'multipart/form-data; boundary="a b"'
+    :return: the ContentType
+    """
+    media_type, _, _ = value.partition(";")
+    type_, _, subtype = media_type.strip().lower().partition("/")
+    type_, subtype = type_.strip(), subtype.strip()
+
+    parameters = list()
+    pos, end = len(media_type), len(value)
+    while pos < end and (m := _PARAMETER.match(value, pos)) is not None and m.end() > pos:
+        pos = m.end()
+        if (name := m.group(1)) is None:
+            continue
+        v = m.group(2)
+        if v[:1] == '"':
+            v = _QUOTED_PAIR.sub(r"\1", v[1:-1])
+        else:
+            v = v.rstrip(" \t")
+        parameters.append((name.lower(), v))
+
+    return ContentType(f"{type_}/{subtype}" if subtype else type_, type_, subtype, tuple(parameters))
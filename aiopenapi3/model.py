@@ -1,10 +1,17 @@
 import collections
+import contextlib
+import contextvars
+import copy
 import dataclasses
+import functools
 import inspect
+import itertools
 import logging
 import re
 import sys
-from typing import Any, cast, TypeVar
+import types
+from typing import Any, cast, TypeVar, ForwardRef
+from collections.abc import Callable, Iterator, Sequence
 import typing
 
 if sys.version_info >= (3, 10):
@@ -14,11 +21,13 @@ else:
 
 from typing import Optional, Union, Annotated, Literal
 from pydantic import BaseModel, TypeAdapter, Field, RootModel, ConfigDict
+from typing_extensions import TypedDict, NotRequired  # pydantic requires typing_extensions.TypedDict < 3.12
 import pydantic
 
 from .base import ReferenceBase, SchemaBase
+from .lazy import loaded
 from . import me
-from .pydanticv2 import field_class_to_schema, create_model
+from .pydanticv2 import field_class_schemas, create_model
 
 if typing.TYPE_CHECKING:
     from .base import DiscriminatorBase
@@ -47,7 +56,7 @@ def generate_type_format_to_class():
     :return: None
     """
     global type_format_to_class
-    for cls, spec in field_class_to_schema:
+    for cls, spec in field_class_schemas():
         if "type" not in spec:
             # FIXME Decimal is anyOf now
             continue
@@ -73,6 +82,8 @@ def generate_type_format_to_class():
 def class_from_schema(s, _type):
     if _type == "boolean":
         return bool
+    if len(type_format_to_class) == 0:
+        generate_type_format_to_class()
     a = type_format_to_class[_type]
     b = a.get(s.format, a[None])
     return b
@@ -280,9 +291,46 @@ def _follow(r: "ReferenceType", t: type[_T]) -> TypeGuard[_T]:
     return _follow(r._target, t)
 
 
+_analysis: contextvars.ContextVar[Optional[dict[tuple[str, Any], tuple[Any, Any]]]] = contextvars.ContextVar(
+    "_analysis", default=None
+)
+"""
+the per schema analysis cache, active while creating the models - c.f. Model.analysis
+"""
+
+
 class Model:  # (BaseModel):
     ALIASES: dict[str, str] = dict()
 
+    @staticmethod
+    @contextlib.contextmanager
+    def analysis() -> Iterator[dict[tuple[str, Any], tuple[Any, Any]]]:
+        """
+        cache the analysis of each schema - types, combined attributes & property names - while creating the models
+
+        the schemas must not be modified while the cache is active - clear the cache yielded after modifications
+        """
+        token = _analysis.set(cache := dict())
+        try:
+            yield cache
+        finally:
+            _analysis.reset(token)
+
+    @staticmethod
+    def analyzed(kind: str, key: Any, fn: Callable[[], _T]) -> _T:
+        """
+        the result of fn for key - cached if the analysis cache is active
+
+        objects are cached by id, the cache keeps a reference to the object as the id of objects can be reused
+        strings & tuples are cached by value
+        """
+        if (cache := _analysis.get()) is None:
+            return fn()
+        ckey = (kind, key if isinstance(key, (str, tuple)) else id(key))
+        if (r := cache.get(ckey, None)) is None:
+            r = cache[ckey] = (key, fn())
+        return r[1]
+
     @classmethod
     def from_schema(
         cls,
@@ -315,8 +363,6 @@ class Model:  # (BaseModel):
         discriminators: list["DiscriminatorType"],
         extra: Optional[list["SchemaType"]],
     ) -> _ClassInfo:
-        from . import v20, v30, v31
-
         type_name = schema._get_identity("L8")  # + f"_{type}"
 
         classinfo = _ClassInfo(type_name, _type)
@@ -345,7 +391,7 @@ class Model:  # (BaseModel):
 
             if hasattr(schema, "anyOf") and schema.anyOf:
                 assert all(schema.anyOf)
-                assert isinstance(schema, (v30.Schema, v31.Schema))
+                assert isinstance(schema, loaded("v30.Schema", "v31.Schema"))
                 t = tuple(
                     i.get_type(
                         names=schemanames + ([cast(str, i.ref)] if isinstance(i, ReferenceBase) else []),
@@ -361,9 +407,9 @@ class Model:  # (BaseModel):
                     ]
                 else:
                     if len(t):
-                        classinfo.root = Union[t]
+                        classinfo.root = Model.createUnion(t)
             elif hasattr(schema, "oneOf") and schema.oneOf:
-                assert isinstance(schema, (v30.Schema, v31.Schema))
+                assert isinstance(schema, loaded("v30.Schema", "v31.Schema"))
                 t = tuple(
                     i.get_type(
                         names=schemanames + ([cast(str, i.ref)] if isinstance(i, ReferenceBase) else []),
@@ -379,40 +425,42 @@ class Model:  # (BaseModel):
                     ]
                 else:
                     if len(t):
-                        classinfo.root = Union[t]
+                        classinfo.root = Model.createUnion(t)
             else:
                 # default schema properties …
                 classinfo._createAnnotations(schema, _type, discriminators, schemanames, fwdref=True, overwrite=True)
                 classinfo.createFields(schema, overwrite=True)
-                if "patternProperties" in schema.model_fields_set:
+                if getattr(schema, "patternProperties", None):
+                    patterns = tuple(sorted(schema.patternProperties.keys()))
+                    # the pattern matching a property name - computed once per name for the model
+                    match = functools.lru_cache(maxsize=4096)(Model.patternMatcher(patterns))
 
                     def mkx():
                         def get_patternProperty(self_, item):
-                            patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
+                            if item in patterns:
+                                for name, value in self_.model_extra.items():
+                                    if match(name) == item:
+                                        yield name, value
+                                return
 
                             for name, value in self_.model_extra.items():
                                 if re.match(item, name):
                                     yield name, value
 
-                        get_patternProperty.__annotations__["item"] = Literal[
-                            tuple(sorted(schema.patternProperties.keys()))
-                        ]
+                        get_patternProperty.__annotations__["item"] = Literal[patterns]
                         return get_patternProperty
 
                     classinfo.properties["aio3_patternProperty"].default = mkx()
 
                     def mkx():
                         def get_patternProperties(self_):
-                            patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
                             r = {k: list() for k in patterns}
                             for name, value in self_.model_extra.items():
-                                for pattern in patterns:
-                                    if re.match(pattern, name):
-                                        r[pattern].append((name, value))
-                                        break
-                                    else:
-                                        # unmatched …
-                                        pass
+                                if (pattern := match(name)) is not None:
+                                    r[pattern].append((name, value))
+                                else:
+                                    # unmatched …
+                                    pass
                             return r
 
                         return get_patternProperties
@@ -423,12 +471,8 @@ class Model:  # (BaseModel):
 
                         def mkx():
                             def validate_patternProperties(self_):
-                                patterns = typing.get_args(self_.aio3_patternProperty.__annotations__["item"])
-                                for name, value in self_.model_extra.items():
-                                    for pattern in patterns:
-                                        if re.match(pattern, name):
-                                            break
-                                    else:
+                                for name in self_.model_extra or dict():
+                                    if match(name) is None:
                                         raise ValueError(f"unmatched property {name}")
                                 return self_
 
@@ -464,6 +508,256 @@ class Model:  # (BaseModel):
         classinfo.validate()
         return classinfo
 
+    @staticmethod
+    def plain(annotation: Any) -> tuple[Any, dict[str, Any]]:
+        """
+        the type using TypedDicts instead of models - for validating into plain dicts & lists
+
+        recursive models refer to their TypedDict by name, the names are resolved using the namespace returned
+
+        :param annotation: the type, e.g. the model of a Schema
+        :return: the type and the namespace of the forward references
+        """
+        namespace: dict[str, Any] = dict()
+        return Model._plain(annotation, dict(), namespace), namespace
+
+    @staticmethod
+    def _plain(annotation: Any, memo: dict[type[BaseModel], Any], namespace: dict[str, Any]) -> Any:
+        origin = typing.get_origin(annotation)
+        if origin in (Union, getattr(types, "UnionType", Union)):
+            return Union[tuple(Model._plain(i, memo, namespace) for i in typing.get_args(annotation))]
+        elif origin == Annotated:
+            t, *metadata = typing.get_args(annotation)
+            return Annotated[(Model._plain(t, memo, namespace), *(Model._plain_metadata(i, t) for i in metadata))]
+        elif origin is list:
+            return list[Model._plain(typing.get_args(annotation)[0], memo, namespace)]  # type: ignore[misc]
+        elif origin is dict:
+            k, v = typing.get_args(annotation)
+            return dict[k, Model._plain(v, memo, namespace)]  # type: ignore[valid-type]
+        elif isinstance(annotation, ForwardRef) and annotation.__forward_evaluated__:
+            return Model._plain(annotation.__forward_value__, memo, namespace)
+        elif not is_basemodel(annotation):
+            return annotation
+
+        if Model._validated(annotation):
+            # the validators of the model require the model - validate using the model & return its data
+            return Annotated[annotation, pydantic.AfterValidator(Model._dump)]
+
+        if issubclass(annotation, RootModel):
+            return Model._plain(annotation.model_fields["root"].annotation, memo, namespace)
+
+        if (r := memo.get(annotation, None)) is not None:
+            if isinstance(r, str):
+                # recursion - the TypedDict is not created yet, refer to it by name
+                namespace[r] = None
+            return r
+
+        ref = memo[annotation] = f"_plain_{len(memo)}"
+        fields = dict()
+        for key, field in annotation.model_fields.items():
+            t = Model._plain(field.annotation, memo, namespace)
+            if field.discriminator is not None:
+                t = Annotated[t, Model._plain_metadata(Field(discriminator=field.discriminator), field.annotation)]
+            if field.metadata:
+                t = Annotated[(t, *field.metadata)]
+            fields[field.alias or key] = t if field.is_required() else NotRequired[t]
+
+        r = memo[annotation] = types.new_class(
+            annotation.__name__,
+            (TypedDict,),
+            exec_body=lambda ns: ns.update(
+                __annotations__=fields,
+                __module__=me.__name__,
+                __pydantic_config__=ConfigDict(
+                    extra=annotation.model_config.get("extra", None) or "ignore", regex_engine="python-re"
+                ),
+            ),
+        )
+        if ref in namespace:
+            namespace[ref] = r
+        return r
+
+    @staticmethod
+    def _validated(annotation: type[BaseModel]) -> bool:
+        """
+        the model has validators - e.g. patternProperties
+        """
+        decorators = annotation.__pydantic_decorators__
+        return bool(decorators.model_validators or decorators.field_validators or decorators.root_validators)
+
+    @staticmethod
+    def _dump(value: BaseModel) -> Any:
+        return value.model_dump(by_alias=True, exclude_unset=True)
+
+    @staticmethod
+    def _plain_metadata(metadata: Any, annotation: Any) -> Any:
+        """
+        the discriminator of a Union of models refers to the name of the field, the TypedDict to the alias
+        """
+        if not (isinstance(metadata, pydantic.fields.FieldInfo) and isinstance(metadata.discriminator, str)):
+            return metadata
+        for i in typing.get_args(annotation):
+            if is_basemodel(i) and (field := i.model_fields.get(metadata.discriminator, None)) is not None:
+                return Field(discriminator=field.alias or metadata.discriminator)
+        return metadata
+
+    @staticmethod
+    def project(annotation: Any, fields: Sequence[str]) -> Any:
+        """
+        the type reduced to the fields given - for validating only the fields required
+
+        models are reduced to the properties of the paths, ignoring all other properties of the data
+
+        :param annotation: the type, e.g. the model of a Schema
+        :param fields: the paths of the properties to keep, e.g. ["id", "owner.name"]
+        """
+        tree: dict[str, Any] = dict()
+        for path in fields:
+            node = tree
+            for name in path.split("."):
+                node = node.setdefault(name, dict())
+        return Model._project(annotation, tree, "")
+
+    @staticmethod
+    def _project(annotation: Any, tree: dict[str, Any], path: str) -> Any:
+        if not tree:
+            return annotation
+
+        origin = typing.get_origin(annotation)
+        if origin in (Union, getattr(types, "UnionType", Union)):
+            return Union[tuple(Model._project(i, tree, path) for i in typing.get_args(annotation))]
+        elif origin == Annotated:
+            t, *metadata = typing.get_args(annotation)
+            for i in metadata:
+                tree = Model._discriminated(tree, i)
+            return Annotated[(Model._project(t, tree, path), *metadata)]
+        elif origin is list:
+            return list[Model._project(typing.get_args(annotation)[0], tree, path)]  # type: ignore[misc]
+        elif origin is dict:
+            k, v = typing.get_args(annotation)
+            return dict[k, Model._project(v, tree, path)]  # type: ignore[valid-type]
+        elif annotation is None.__class__:
+            return annotation
+        elif isinstance(annotation, ForwardRef) and annotation.__forward_evaluated__:
+            return Model._project(annotation.__forward_value__, tree, path)
+        elif not is_basemodel(annotation):
+            raise ValueError(f"can not select {sorted(tree.keys())} of {path or 'the result'} ({annotation})")
+
+        if issubclass(annotation, RootModel):
+            return Model._project(annotation.model_fields["root"].annotation, tree, path)
+
+        byalias = {(f.alias or name): name for name, f in annotation.model_fields.items()}
+        fields = dict()
+        for alias, subtree in tree.items():
+            if (name := byalias.get(alias, alias)) not in annotation.model_fields:
+                raise ValueError(
+                    f"{annotation.__name__} has no property {alias} ({'.'.join(filter(None, (path, alias)))})"
+                )
+            field = copy.copy(annotation.model_fields[name])
+            subtree = Model._discriminated(subtree, field)
+            field.annotation = Model._project(field.annotation, subtree, ".".join(filter(None, (path, alias))))
+            fields[name] = (field.annotation, field)
+
+        return create_model(
+            annotation.__name__,
+            __module__=me.__name__,
+            __config__=ConfigDict(extra="ignore", regex_engine="python-re"),
+            **fields,
+        )
+
+    @staticmethod
+    def _discriminated(tree: dict[str, Any], metadata: Any) -> dict[str, Any]:
+        """
+        the tree including the discriminator property of the Union - the types of the Union require it
+        """
+        discriminator = getattr(metadata, "discriminator", None)
+        discriminator = getattr(discriminator, "discriminator", discriminator)
+        if not tree or not isinstance(discriminator, str):
+            return tree
+        return {discriminator: dict(), **tree}
+
+    @staticmethod
+    def createUnion(t: tuple[Any, ...]) -> Any:
+        """
+        the Union of the types of anyOf/oneOf without discriminator mapping
+
+        pydantic tries each type of a Union, if the type can be identified from the data the Union is tagged instead
+          * by a property which is a required Literal (const/enum) in all types with different values
+          * by a property which is unique to a type if all types forbid additional properties
+
+        only the type identified can validate the data, the result of the validation is the same
+        """
+        if len(t) < 2 or not all(is_basemodel(i) and not issubclass(i, RootModel) for i in t):
+            return Union[t]
+
+        # the same Union is created for each schema referring to it, e.g. the anyOf of a property
+        name, keys = Model.analyzed(
+            "discriminator", t, lambda: (Model._discriminatorLiteral(t), Model._discriminatorKeys(t))
+        )
+
+        if name is not None:
+            return Annotated[Union[t], Field(discriminator=name)]
+
+        if keys:
+            untagged = "*"
+
+            def discriminator(v: Any) -> str:
+                if isinstance(v, dict):
+                    tags = {keys[k] for k in v.keys() if k in keys}
+                    if len(tags) == 1:
+                        return tags.pop()
+                return untagged
+
+            return Annotated[
+                Union[
+                    tuple(Annotated[i, pydantic.Tag(str(n))] for n, i in enumerate(t))
+                    + (Annotated[Union[t], pydantic.Tag(untagged)],)
+                ],
+                pydantic.Discriminator(discriminator),
+            ]
+
+        return Union[t]
+
+    @staticmethod
+    def _discriminatorLiteral(t: tuple[type[BaseModel], ...]) -> Optional[str]:
+        """
+        the name of a required property with a Literal type in all types - with different values
+        """
+        for name in t[0].model_fields.keys():
+            values: set[Any] = set()
+            for i in t:
+                if (
+                    (field := i.model_fields.get(name, None)) is None
+                    or not field.is_required()
+                    or typing.get_origin(field.annotation) != Literal
+                ):
+                    break
+                v = set(typing.get_args(field.annotation))
+                if not all(type(j) in (str, int) for j in v) or values & v:
+                    break
+                values |= v
+            else:
+                return name
+        return None
+
+    @staticmethod
+    def _discriminatorKeys(t: tuple[type[BaseModel], ...]) -> dict[str, str]:
+        """
+        a property unique to the type for each of the types which can be identified this way - by the alias
+        """
+        if not all(i.model_config.get("extra", None) == "forbid" for i in t):
+            return dict()
+
+        aliases = [[f.alias or name for name, f in i.model_fields.items()] for i in t]
+        count = collections.Counter(itertools.chain.from_iterable(map(set, aliases)))
+        r = dict()
+        for n, names in enumerate(aliases):
+            for name in names:
+                if count[name] == 1:
+                    r[name] = str(n)
+                    break
+        return r
+
     @staticmethod
     def createConfigDict(schema: "SchemaType"):
         """
@@ -475,8 +769,6 @@ class Model:  # (BaseModel):
           * pydantic type identification does not work reliable due to missing rejects,
 
         """
-        from . import v20, v30, v31
-
         arbitrary_types_allowed_ = False
         extra_ = "allow"
 
@@ -599,7 +891,11 @@ class Model:  # (BaseModel):
         return rr
 
     @staticmethod
-    def types(schema: "SchemaType"):
+    def types(schema: "SchemaType") -> tuple[str, ...]:
+        return Model.analyzed("types", schema, lambda: tuple(Model._types(schema)))
+
+    @staticmethod
+    def _types(schema: "SchemaType"):
         if isinstance(schema.type, str):
             yield schema.type
             if getattr(schema, "nullable", False):
@@ -727,9 +1023,7 @@ class Model:  # (BaseModel):
             """
             https://docs.pydantic.dev/latest/usage/fields/#numeric-constraints
             """
-            from . import v20, v30, v31
-
-            if isinstance(schema, (v20.Schema, v30.Schema)):
+            if isinstance(schema, loaded("v20.Schema", "v30.Schema")):
                 mof: tuple[str, str] = ("multipleOf", "multiple_of")
                 if (v := getattr(schema, mof[0], None)) is not None:
                     args[mof[1]] = v
@@ -744,7 +1038,7 @@ class Model:  # (BaseModel):
                             args[t1] = v
                         else:
                             args[t0] = v
-            elif isinstance(schema, v31.Schema):
+            elif isinstance(schema, loaded("v31.Schema")):
                 for k, m in {
                     "multipleOf": "multiple_of",
                     "exclusiveMaximum": "lt",
@@ -768,6 +1062,40 @@ class Model:  # (BaseModel):
 
         return Field(**args)
 
+    @staticmethod
+    def patternMatcher(patterns: tuple[str, ...]) -> Callable[[str], Optional[str]]:
+        """
+        match property names against the patterns of patternProperties - returns the first pattern matching
+
+        the patterns are compiled once and combined into a single alternation dispatching on the name of the group
+        matched, patterns using groups themselves (e.g. backreferences) or flags are matched one after another
+        """
+        compiled = [(pattern, re.compile(pattern)) for pattern in patterns]
+        combined = None
+        if compiled and all(c.groups == 0 for _, c in compiled):
+            try:
+                combined = re.compile("|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(patterns)))
+            except re.error:
+                pass
+
+        if combined is not None:
+            bygroup = {f"p{i}": pattern for i, pattern in enumerate(patterns)}
+
+            def match(name: str) -> Optional[str]:
+                if (m := combined.match(name)) is None:
+                    return None
+                return bygroup[m.lastgroup]
+
+        else:
+
+            def match(name: str) -> Optional[str]:
+                for pattern, c in compiled:
+                    if c.match(name):
+                        return pattern
+                return None
+
+        return match
+
     @staticmethod
     def nameof(name: str, args=None):
         """
@@ -779,7 +1107,14 @@ class Model:  # (BaseModel):
         :param args:
         :return:
         """
+        rename = Model.analyzed("nameof", name, lambda: Model._nameof(name))
+        if rename != name:
+            if args is not None:
+                args["alias"] = name
+        return rename
 
+    @staticmethod
+    def _nameof(name: str) -> str:
         if len(name) == 0:
             # FIXME
             #  are empty property names valid?
@@ -801,12 +1136,4 @@ class Model:  # (BaseModel):
         if rename[0] == "_":
             rename = rename.lstrip("_") + "_"
 
-        if rename != name:
-            if args is not None:
-                args["alias"] = name
-            return rename
-        return name
-
-
-if len(type_format_to_class) == 0:
-    generate_type_format_to_class()
+        return rename
@@ -2,6 +2,7 @@ import sys
 import typing
 
 from typing import Callable, Any, Union, cast, Optional, ForwardRef
+from collections.abc import Iterator
 import logging
 import copy
 import pickle
@@ -20,24 +21,33 @@ import httpx
 import yarl
 from pydantic import BaseModel
 
-from aiopenapi3.v30.general import Reference
 import aiopenapi3.request
 from .json import JSONReference
-from . import v20
-from . import v30
-from . import v31
 from . import log
 from .request import OperationIndex, HTTP_METHODS
 from .errors import ReferenceResolutionError, HTTPClientError, HTTPServerError
 from .loader import Loader, NullLoader
 from .plugin import Plugin, Plugins
+from .profiler import Profiler
+from .validation import ValidationPolicies
+from .pagination import Paginations
+from .backend import Backend, PydanticBackend
 from .base import RootBase, ReferenceBase, SchemaBase, OperationBase, DiscriminatorBase
 from .request import RequestBase
-from .v30.paths import Operation
 from .model import is_basemodel, Model
+from .lazy import LazyModule, loaded
 
 
 if typing.TYPE_CHECKING:
+    from . import v20, v30, v31
+    from .v30.general import Reference
+    from .v30.paths import Operation
+    from .arrow import Columnar
+    from .auth import TokenRefresh
+    from .ratelimit import RateLimiter
+    from .circuitbreaker import CircuitBreaker
+    from .concurrency import ConcurrencyLimiter
+    from .request import Authorization
     from ._types import (
         RootType,
         JSON,
@@ -49,9 +59,13 @@ if typing.TYPE_CHECKING:
         HTTPMethodType,
         ServerType,
     )
+else:
+    v20 = LazyModule("aiopenapi3.v20")
+    v30 = LazyModule("aiopenapi3.v30")
+    v31 = LazyModule("aiopenapi3.v31")
 
 
-def has_components(y: Optional["RootType"]) -> TypeGuard[Union[v30.Root, v31.Root]]:
+def has_components(y: Optional["RootType"]) -> TypeGuard[Union["v30.Root", "v31.Root"]]:
     #    return all([typing.cast("RootType", y), typing.cast("RootType", y).components])
     #    return isinstance(y, (v30.Root, v31.Root))
     #    return all([y, y.components])
@@ -63,7 +77,7 @@ def has_components(y: Optional["RootType"]) -> TypeGuard[Union[v30.Root, v31.Roo
 
 
 def is_schema(v: tuple[str, "SchemaType"]) -> TypeGuard["SchemaType"]:
-    return isinstance(v[1], (v20.Schema, v30.Schema, v31.Schema))
+    return isinstance(v[1], loaded("v20.Schema", "v30.Schema", "v31.Schema"))
 
 
 class OpenAPI:
@@ -274,6 +288,61 @@ class OpenAPI:
         Raise for http status code
         """
 
+        self.validation: ValidationPolicies = ValidationPolicies()
+        """
+        the validation policy for the data of responses - per Operation
+        """
+
+        self.pagination: Paginations = Paginations()
+        """
+        the paginators of the Operations - c.f. :meth:`aiopenapi3.request.RequestBase.paginate`
+        """
+
+        self.plain: bool = False
+        """
+        return the data of responses as plain dicts & lists instead of models - validated using TypedDicts
+        """
+
+        self.backend: Backend = PydanticBackend()
+        """
+        the backend creating the data of responses - c.f. :class:`aiopenapi3.backend.MsgspecBackend`
+        """
+
+        self._columnar: dict[int, tuple[Optional["SchemaType"], "Columnar"]] = dict()
+        """
+        the Arrow schemas of the Schemas of responses - c.f. :meth:`aiopenapi3.request.RequestBase.arrow`
+        """
+
+        self._dispatch: dict[int, tuple["OperationType", Any]] = dict()
+        """
+        the Responses of the Operations precompiled for processing responses - c.f. :class:`aiopenapi3.v30.glue.Dispatch`
+        """
+
+        self._authorizations: dict[tuple[int, str, int, type], tuple[Optional[list[Any]], "Authorization"]] = dict()
+        """
+        the authorizations resolved per security requirements - reset by :meth:`authenticate`
+        """
+
+        self.token_refresh: Optional["TokenRefresh"] = None
+        """
+        refresh OAuth2 tokens in the background before they expire - c.f. :class:`aiopenapi3.auth.TokenRefresh`
+        """
+
+        self.rate_limit: Optional["RateLimiter"] = None
+        """
+        client side rate limiting of the requests - c.f. :class:`aiopenapi3.ratelimit.RateLimiter`
+        """
+
+        self.circuit_breaker: Optional["CircuitBreaker"] = None
+        """
+        fail fast for servers & Operations which are degraded - c.f. :class:`aiopenapi3.circuitbreaker.CircuitBreaker`
+        """
+
+        self.concurrency_limit: Optional["ConcurrencyLimiter"] = None
+        """
+        adaptive limit of the requests in flight - c.f. :class:`aiopenapi3.concurrency.ConcurrencyLimiter`
+        """
+
         self._security: dict[str, tuple[str]] = dict()
         """
         authorization informations
@@ -292,6 +361,11 @@ class OpenAPI:
 
         self._server_select: Callable[[list["ServerType"]], "ServerType"] = random.choice
 
+        self.profile: Profiler = Profiler()
+        """
+        startup profile - time & allocations of parsing, resolving and creating the models
+        """
+
         self._init_plugins(plugins)
         """
         the plugin interface allows taking care of defects in description documents and implementations
@@ -303,16 +377,19 @@ class OpenAPI:
         """
         Document Plugins get called via OpenAPI.load… - this is processed already
         """
-        self._root = self._parse_obj(document)
+        with self.profile.measure("parse", str(self._base_url)):
+            self._root = self._parse_obj(document)
 
         self._documents[self._base_url] = self._root
 
         self._init_session_factory(session_factory)
         self._init_references()
-        only_required = self._init_operationindex(use_operation_tags)
+        with self.profile.measure("operationindex"):
+            only_required = self._init_operationindex(use_operation_tags)
         self._init_schema_types(only_required)
 
-        self.plugins.init.initialized(initialized=self._root)
+        with self.profile.measure("plugin", "initialized"):
+            self.plugins.init.initialized(initialized=self._root)
 
     def _init_plugins(self, plugins):
         for i in plugins or []:
@@ -323,18 +400,18 @@ class OpenAPI:
         if issubclass(getattr(session_factory, "__annotations__", {}).get("return", None.__class__), httpx.Client) or (
             type(session_factory) == type and issubclass(session_factory, httpx.Client)
         ):
-            if isinstance(self._root, v20.Root):
+            if isinstance(self._root, loaded("v20.Root")):
                 self._createRequest = v20.Request
-            elif isinstance(self._root, (v30.Root, v31.Root)):
+            elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
                 self._createRequest = v30.Request
             else:
                 raise ValueError(self._root)
         elif issubclass(
             getattr(session_factory, "__annotations__", {}).get("return", None.__class__), httpx.AsyncClient
         ) or (type(session_factory) == type and issubclass(session_factory, httpx.AsyncClient)):
-            if isinstance(self._root, v20.Root):
+            if isinstance(self._root, loaded("v20.Root")):
                 self._createRequest = v20.AsyncRequest
-            elif isinstance(self._root, (v30.Root, v31.Root)):
+            elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
                 self._createRequest = v30.AsyncRequest
             else:
                 raise ValueError(self._root)
@@ -354,7 +431,8 @@ class OpenAPI:
             for i in todo:
                 #                print(names[i])
                 try:
-                    values[i]._resolve_references(self)
+                    with self.profile.measure("resolve", str(names[i])):
+                        values[i]._resolve_references(self)
                 except ReferenceResolutionError as e:
                     e.document = names[i]
                     raise
@@ -365,10 +443,12 @@ class OpenAPI:
     #            i._resolve_references(self)
 
     def _init_operationindex(self, use_operation_tags: bool) -> bool:
-        if (p := self.plugins.init.paths(initialized=self._root, paths=self.paths).paths) is not None:
+        with self.profile.measure("plugin", "paths"):
+            p = self.plugins.init.paths(initialized=self._root, paths=self.paths).paths
+        if p is not None:
             self._root.paths = p
 
-        if isinstance(self._root, v20.Root):
+        if isinstance(self._root, loaded("v20.Root")):
             if self.paths:
                 obj: "PathItemType"
                 for path, obj in self.paths.items():
@@ -378,7 +458,7 @@ class OpenAPI:
                         if op.operationId is None:
                             continue
                         for r, response in op.responses.items():
-                            if isinstance(response, Reference):
+                            if isinstance(response, loaded("v30.Reference")):
                                 continue
                             if response.headers:
                                 for h in response.headers.values():
@@ -389,7 +469,7 @@ class OpenAPI:
                             if isinstance(response.schema_, (v20.Schema,)):
                                 response.schema_._get_identity("OP", f"{path}.{m}.{r}")
 
-        elif isinstance(self._root, (v30.Root, v31.Root)):
+        elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
             allschemas = [
                 x.components.schemas
                 for x in filter(has_components, self._documents.values())
@@ -412,13 +492,13 @@ class OpenAPI:
                         if op.operationId is None:
                             continue
                         for r, response in op.responses.items():
-                            if isinstance(response, Reference):
+                            if isinstance(response, v30.Reference):
                                 continue
                             assert response.content is not None
                             for c, content in response.content.items():
                                 if content.schema_ is None:
                                     continue
-                                if isinstance(content.schema_, (v30.Schema, v31.Schema)):
+                                if isinstance(content.schema_, loaded("v30.Schema", "v31.Schema")):
                                     content.schema_._get_identity("OP", f"{path}.{m}.{r}.{c}")
             else:
                 if isinstance(self._root, v30.Root):
@@ -436,6 +516,10 @@ class OpenAPI:
     @staticmethod
     def _get_combined_attributes(schema):
         """Combine attributes from the schema."""
+        return Model.analyzed("combined", schema, lambda: OpenAPI._combine_attributes(schema))
+
+    @staticmethod
+    def _combine_attributes(schema):
         is_array = Model.is_type_any(schema) or Model.is_type(schema, "array")
         return (
             getattr(schema, "oneOf", [])  # Swagger compat
@@ -477,14 +561,72 @@ class OpenAPI:
             processed.update(next_set)
         return processed
 
+    @classmethod
+    def _schema_components(cls, schemas: dict[int, "SchemaType"], nodes: set[int]) -> list[list[int]]:
+        """
+        The strongly connected components of the schema dependency graph (Tarjan) in topological order.
+
+        The components are ordered dependencies first, a component with more than a single schema - or a single schema
+        referencing itself - is a cycle and requires forward references.
+        """
+
+        def dependencies(schema: "SchemaType") -> list[int]:
+            r = list(cls._process_schema_attributes(schema, set()).keys())
+            if isinstance(v := schema.additionalProperties, ReferenceBase):
+                r.append(id(v._target))
+            elif isinstance(v, SchemaBase):
+                r.append(id(v))
+            return [i for i in r if i in nodes]
+
+        edges: dict[int, list[int]] = {i: dependencies(schemas[i]) for i in nodes}
+
+        index: dict[int, int] = dict()
+        lowlink: dict[int, int] = dict()
+        stack: list[int] = list()
+        onstack: set[int] = set()
+        components: list[list[int]] = list()
+
+        for root in nodes:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            onstack.add(root)
+            work: list[tuple[int, Iterator[int]]] = [(root, iter(edges[root]))]
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in index:
+                        index[w] = lowlink[w] = len(index)
+                        stack.append(w)
+                        onstack.add(w)
+                        work.append((w, iter(edges[w])))
+                        break
+                    elif w in onstack:
+                        lowlink[v] = min(lowlink[v], index[w])
+                else:
+                    work.pop()
+                    if work:
+                        lowlink[work[-1][0]] = min(lowlink[work[-1][0]], lowlink[v])
+                    if lowlink[v] == index[v]:
+                        component = list()
+                        while True:
+                            w = stack.pop()
+                            onstack.remove(w)
+                            component.append(w)
+                            if w == v:
+                                break
+                        components.append(component)
+        return components
+
     def _init_schema_types_collect(self, only_required: bool) -> dict[str, "SchemaType"]:
         byname: dict[str, "SchemaType"] = dict()
 
         def is_schema(v: tuple[str, "SchemaType"]) -> bool:
-            return isinstance(v[1], (v20.Schema, v30.Schema, v31.Schema))
+            return isinstance(v[1], loaded("v20.Schema", "v30.Schema", "v31.Schema"))
 
         op: Operation
-        if isinstance(self._root, v20.Root):
+        if isinstance(self._root, loaded("v20.Root")):
             documents = cast(list[v20.Root], self._documents.values())
             # Schema
             if only_required is False:
@@ -502,7 +644,7 @@ class OpenAPI:
                             if isinstance(response, ReferenceBase):
                                 response = response._target
                             if isinstance(response, (v20.paths.Response)):
-                                if isinstance(response.schema_, (v20.Schema, v31.Schema)):
+                                if isinstance(response.schema_, loaded("v20.Schema", "v31.Schema")):
                                     name = response.schema_._get_identity("PI", f"{path}.{m}.{r}")
                                     byname[name] = response.schema_
                             else:
@@ -515,9 +657,9 @@ class OpenAPI:
                     assert response.schema_
                     byname[response.schema_._get_identity(name=name)] = response.schema_
 
-        elif isinstance(self._root, (v30.Root, v31.Root)):
+        elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
             # Schema
-            documents = cast(Union[list[v30.Root], list[v31.Root]], self._documents.values())
+            documents = cast(Union[list["v30.Root"], list["v31.Root"]], self._documents.values())
             components = [x.components for x in filter(has_components, documents) if x.components is not None]
             assert components is not None
             if only_required is False:
@@ -559,7 +701,7 @@ class OpenAPI:
                     for r, response in op.responses.items():
                         if isinstance(response, ReferenceBase):
                             response = response._target
-                        if isinstance(response, (v30.paths.Response, v31.paths.Response)):
+                        if isinstance(response, loaded("v30.paths.Response", "v31.paths.Response")):
                             assert response.content is not None
                             for mt, mto in response.content.items():
                                 if mto.schema_ is None:
@@ -579,49 +721,119 @@ class OpenAPI:
                                 continue
                             byname[mto.schema_._get_identity("R")] = mto.schema_
 
-        byname = self.plugins.init.schemas(initialized=self._root, schemas=byname).schemas
+        with self.profile.measure("plugin", "schemas"):
+            byname = self.plugins.init.schemas(initialized=self._root, schemas=byname).schemas
         return byname
 
+    def _init_schema_locations(self) -> None:
+        """
+        set the JSON Reference of the component schemas, c.f. SchemaBase._location
+        """
+        for url, document in self._documents.items():
+            schemas: dict[str, Any]
+            if isinstance(document, loaded("v20.Root")):
+                schemas, pointer = document.definitions, "definitions"
+            elif has_components(document) and document.components is not None:
+                schemas, pointer = document.components.schemas, "components/schemas"
+            else:
+                continue
+            prefix = "" if document is self._root else str(url)
+            for name, schema in (schemas or dict()).items():
+                if isinstance(schema, SchemaBase):
+                    schema._location = f"{prefix}#/{pointer}/{name.replace('~', '~0').replace('/', '~1')}"
+
     def _init_schema_types(self, only_required: bool) -> None:
+        self._init_schema_locations()
         byname: dict[str, "SchemaType"] = self._init_schema_types_collect(only_required)
         byid: dict[int, "SchemaType"] = {id(i): i for i in byname.values()}
         data: set[int] = set(byid.keys())
-        todo: set[int] = self._iterate_schemas(byid, data, set())
         types: dict[str, Union[ForwardRef, type[BaseModel], type[int], type[str], type[float], type[bool]]] = dict()
 
+        with Model.analysis() as analysis:
+            todo: set[int] = self._iterate_schemas(byid, data, set())
+
+            """
+            Due to Plugins (e.g. Cull/Reduce) byname may be incomplete
+            """
+            resolved: list["SchemaType"] = list(
+                map(lambda x: byid[x]._target if isinstance(byid[x], ReferenceBase) else byid[x], todo | data)
+            )
+            with self.profile.measure("plugin", "resolved"):
+                self.plugins.init.resolved(initialized=self._root, resolved=resolved)
+
+            if self.plugins.init.resolved.methods:
+                # the plugins may have modified the schemas
+                analysis.clear()
+
+            self._init_schema_types_create(byid, todo | data, types)
+
+    def _init_schema_types_create(
+        self,
+        byid: dict[int, "SchemaType"],
+        schemas: set[int],
+        types: dict[str, Union[ForwardRef, type[BaseModel], type[int], type[str], type[float], type[bool]]],
+    ) -> None:
         """
-        Due to Plugins (e.g. Cull/Reduce) byname may be incomplete
+        Creating the models in topological order of the schema dependencies allows using the models of the dependencies
+        instead of forward references, only schemas in cycles require forward references and a model_rebuild.
         """
-        resolved: list["SchemaType"] = list(
-            map(lambda x: byid[x]._target if isinstance(byid[x], ReferenceBase) else byid[x], todo | data)
-        )
-        self.plugins.init.resolved(initialized=self._root, resolved=resolved)
 
-        # print(f"{len(todo | data)} {only_required=}")
-        for i in todo | data:
+        def rebuild(name: str, schema, raise_errors: bool = True) -> None:
+            if not is_basemodel(schema):
+                # primitive types: str, int …
+                return
+            if schema.__pydantic_complete__:
+                # no forward references
+                return
+            with self.profile.measure("model_rebuild", name):
+                schema.model_rebuild(raise_errors=raise_errors, _types_namespace={"__types": types})
+
+        """
+        Structurally identical inline schemas share the model, the identity of each schema is kept as alias in types.
+        Component schemas keep their own model.
+        """
+        shared: dict[str, type[BaseModel]] = dict()
+        hashes: dict[int, str] = dict()
+
+        """
+        Anonymous schemas are named by content, identical schemas may share the name - keep all models for rebuild.
+        """
+        models: list[tuple[str, Any]] = list()
+
+        for component in self._schema_components(byid, schemas):
+            created = list()
+            for i in component:
+                b = byid[i]
+                name = b._get_identity("X")
+                with self.profile.measure("get_type", name):
+                    structure = b._get_structure(hashes=hashes) if b._location is None else None
+                    if structure is not None and b._model_type is None and (m := shared.get(structure)) is not None:
+                        b._model_type = m
+                    types[name] = b.get_type()
+                if structure is not None and is_basemodel(types[name]) and types[name].__pydantic_complete__:
+                    # models of cycles can not be shared
+                    shared.setdefault(structure, types[name])
+                created.append((name, types[name]))
+
+            # cycles are rebuild before the models are used by the dependents
+            # forward references to schemas not created yet are resolved by the final rebuild
+            for name, schema in created:
+                rebuild(name, schema, raise_errors=False)
+            models.extend(created)
+
+        for i in schemas:
             b = byid[i]
             name = b._get_identity("X")
-            types[name] = b.get_type()
             for idx, j in enumerate(b._model_types):
                 types[f"{name}.c{idx}"] = j
+                models.append((f"{name}.c{idx}", j))
 
-        # print(f"{len(types)}")
-        for name, schema in types.items():
-            if not is_basemodel(schema):
-                # primitive types: str, int …
-                continue
-            try:
-                schema.model_rebuild(_types_namespace={"__types": types})
-                thes = byname.get(name, None)
-                if thes is not None:
-                    for v in byid[id(thes)]._model_types:
-                        v.model_rebuild(_types_namespace={"__types": types})
-            except Exception as e:
-                raise e
+        for name, schema in models:
+            rebuild(name, schema)
 
     @property
     def url(self) -> yarl.URL:
-        if isinstance(self._root, v20.Root):
+        if isinstance(self._root, loaded("v20.Root")):
             base = yarl.URL(self._base_url)
             scheme = host = port = path = None
 
@@ -643,7 +855,7 @@ class OpenAPI:
 
             r = yarl.URL.build(scheme=scheme, host=host, port=port, path=path)
             return r
-        elif isinstance(self._root, (v30.Root, v31.Root)):
+        elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
             assert self._root.servers
             server: "ServerType" = self._server_select(self._root.servers)
             return self._base_url.join(yarl.URL(server.createUrl(self._server_variables)))
@@ -656,14 +868,18 @@ class OpenAPI:
         :param args: None to remove all credentials / reset the authorizations
         :param kwargs: scheme=value
         """
+        self._authorizations = dict()
+        if self.token_refresh is not None:
+            self.token_refresh.cancel()
+
         if len(args) == 1 and args[0] == None:
             self._security = dict()
 
         schemes = frozenset(kwargs.keys())
 
-        if isinstance(self._root, v20.Root):
+        if isinstance(self._root, loaded("v20.Root")):
             v = schemes - frozenset(SecuritySchemes := self._root.securityDefinitions)
-        elif isinstance(self._root, (v30.Root, v31.Root)):
+        elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
             v = schemes - frozenset(SecuritySchemes := self._root.components.securitySchemes)
         else:
             raise TypeError(self._root)  # noqa
@@ -689,8 +905,9 @@ class OpenAPI:
     def _load(self, url: yarl.URL):
         self.log.debug(f"Downloading Description Document {url} using {self.loader} …")
         assert self.loader
-        data = self.loader.get(self.plugins, url)
-        return self._parse_obj(data)
+        with self.profile.measure("parse", str(url)):
+            data = self.loader.get(self.plugins, url)
+            return self._parse_obj(data)
 
     @property
     def _(self) -> OperationIndex:
@@ -731,9 +948,9 @@ class OpenAPI:
 
                 operation = getattr(pathitem, method)
                 assert operation is not None
-                if isinstance(self._root, v20.Root):
+                if isinstance(self._root, loaded("v20.Root")):
                     servers = None
-                elif isinstance(self._root, (v30.Root, v31.Root)):
+                elif isinstance(self._root, loaded("v30.Root", "v31.Root")):
                     servers = operation.servers or pathitem.servers or self.servers
                 else:
                     raise TypeError(self._root)
@@ -743,7 +960,7 @@ class OpenAPI:
         except Exception as e:
             raise aiopenapi3.errors.RequestError(operation, request, None, {}) from e
 
-    def resolve_jr(self, root: RootBase, obj, value: Reference):
+    def resolve_jr(self, root: RootBase, obj, value: "Reference"):
         """
         Resolve a `JSON Reference<https://datatracker.ietf.org/doc/html/draft-pbryan-zyp-json-ref-03>`_ in our documents
 
@@ -811,6 +1028,16 @@ class OpenAPI:
         api._createRequest = self._createRequest
         api._session_factory = self._session_factory
         api.loader = self.loader
+        api.profile = self.profile
+        api.validation = self.validation
+        api.pagination = self.pagination
+        api.plain = self.plain
+        api.backend = self.backend
+        api.token_refresh = self.token_refresh
+        api.rate_limit = self.rate_limit
+        api.circuit_breaker = self.circuit_breaker
+        api.concurrency_limit = self.concurrency_limit
+        # the caches keyed by id() (_columnar, _dispatch, _authorizations) are rebuilt on demand
         return api
 
     def clone(self, baseurl: Optional[yarl.URL] = None) -> "OpenAPI":
@@ -837,6 +1064,7 @@ class OpenAPI:
 
         api._init_plugins(plugins)
 
+        api.profile = Profiler()
         api._init_schema_types(only_required=False)
 
         if session_factory is not None:
@@ -854,8 +1082,29 @@ class OpenAPI:
         :param path: cache path
         """
 
-        restore = (self.loader, self.plugins, self._session_factory)
+        restore = (
+            self.loader,
+            self.plugins,
+            self._session_factory,
+            self.token_refresh,
+            self.rate_limit,
+            self.circuit_breaker,
+            self.concurrency_limit,
+        )
         self.loader = self._session_factory = self.plugins = None  # type: ignore[assignment]
+        self.token_refresh = self.rate_limit = self.circuit_breaker = self.concurrency_limit = None
+        # the caches are keyed by id() and rebuilt on demand
+        caches = (self._columnar, self._dispatch, self._authorizations)
+        self._columnar, self._dispatch, self._authorizations = dict(), dict(), dict()
         with path.open("wb") as f:
             pickle.dump(self, f)
-        self.loader, self.plugins, self._session_factory = restore
+        (
+            self.loader,
+            self.plugins,
+            self._session_factory,
+            self.token_refresh,
+            self.rate_limit,
+            self.circuit_breaker,
+            self.concurrency_limit,
+        ) = restore
+        self._columnar, self._dispatch, self._authorizations = caches
@@ -0,0 +1,388 @@
+"""
+iterating the items of paginated Operations
+
+  * link - the next page is the rel="next" link of the Link header - https://datatracker.ietf.org/doc/html/rfc8288
+  * cursor - the next page is requested using the cursor/next-token of the response
+  * offset - offset & limit parameters
+  * page - page number & page size parameters
+
+the pages of offset & page pagination are known in advance - the next pages can be requested concurrently
+"""
+
+import abc
+import asyncio
+import collections
+import dataclasses
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import AsyncIterator, Iterator
+
+import httpx
+import pydantic
+import yarl
+
+if TYPE_CHECKING:
+    from ._types import OperationType, RequestData, RequestParameters
+    from .request import RequestBase, AsyncRequestBase
+
+
+EXTENSION = "aiopenapi3-pagination"
+"""
+the specification extension to configure the pagination of an Operation
+
+  x-aiopenapi3-pagination:
+    type: offset
+    offset: offset
+    limit: limit
+    size: 100
+    items: data.items
+"""
+
+_LINK = re.compile(r'<([^>]*)>((?:\s*;\s*[^;,"=]+(?:=\s*(?:"[^"]*"|[^;,]*))?)*)')
+_REL = re.compile(r';\s*rel\s*=\s*(?:"([^"]*)"|([^;,\s]*))', re.IGNORECASE)
+
+
+def _get(data: Any, path: Optional[str]) -> Any:
+    """
+    the value at the path of the data - models & plain data
+
+    :param path: the property names, separated by ".", the properties of models by name or alias
+    """
+    if isinstance(data, pydantic.RootModel):
+        data = data.root
+    if not path:
+        return data
+    for name in path.split("."):
+        if data is None:
+            return None
+        if isinstance(data, dict):
+            data = data.get(name, None)
+            continue
+        if isinstance(data, pydantic.BaseModel) and name not in (fields := type(data).model_fields):
+            name = next((k for k, v in fields.items() if v.alias == name), name)
+        data = getattr(data, name, None)
+        if isinstance(data, pydantic.RootModel):
+            data = data.root
+    return data
+
+
+def links(value: str) -> dict[str, str]:
+    """
+    the links of a Link header by relation type
+
+    :param value: the Link header, e.g. '<https://example.org/items?page=2>; rel="next"'
+    """
+    r = dict()
+    for target, params in _LINK.findall(value):
+        if (m := _REL.search(params)) is None:
+            continue
+        for rel in (m.group(1) or m.group(2)).lower().split():
+            r.setdefault(rel, target)
+    return r
+
+
+@dataclasses.dataclass
+class Paginator(abc.ABC):
+    items: Optional[str] = None
+    """the path of the array of items in the data of the response - None for responses which are the array"""
+
+    @classmethod
+    def from_extension(cls, value: dict[str, Any]) -> "Paginator":
+        value = dict(value)
+        type_ = value.pop("type")
+        if (r := PAGINATORS.get(type_, None)) is None:
+            raise ValueError(f"pagination type {type_}")
+        return r(**value)
+
+    def items_of(self, data: Any) -> list[Any]:
+        """
+        the items of the page
+        """
+        return _get(data, self.items) or []
+
+    def first(self, parameters: "RequestParameters") -> "RequestParameters":
+        """
+        the parameters of the first page
+        """
+        return parameters
+
+    @abc.abstractmethod
+    def next(
+        self,
+        request: "RequestBase",
+        parameters: "RequestParameters",
+        data: Any,
+        result: httpx.Response,
+        items: list[Any],
+    ) -> Optional["RequestParameters"]:
+        """
+        the parameters of the next page
+
+        :param parameters: the parameters of the page received
+        :return: the parameters - None for the last page
+        """
+        ...
+
+
+class Prefetch(abc.ABC):
+    """
+    the parameters of the pages are known in advance - the pages can be requested concurrently
+    """
+
+    @abc.abstractmethod
+    def page(self, parameters: "RequestParameters", index: int) -> "RequestParameters":
+        """
+        the parameters of the page
+
+        :param parameters: the parameters of the request
+        :param index: the index of the page
+        """
+        ...
+
+    @abc.abstractmethod
+    def last(self, items: list[Any]) -> bool:
+        """
+        the page is the last page
+        """
+        ...
+
+
+@dataclasses.dataclass
+class Link(Paginator):
+    """
+    the next page is the rel="next" link of the Link header - the query parameters of the link are used
+    """
+
+    rel: str = "next"
+
+    def next(self, request, parameters, data, result, items):
+        if (value := result.headers.get("Link", None)) is None or (target := links(value).get(self.rel)) is None:
+            return None
+        query = {getattr(p, "name") for p in request.parameters if getattr(p, "in_", None) == "query"}
+        url = yarl.URL(target)
+        r = {k: v for k, v in parameters.items() if k not in query}
+        for name in url.query.keys():
+            if name in query:
+                values = url.query.getall(name)
+                r[name] = values if len(values) > 1 else values[0]
+        return r
+
+
+@dataclasses.dataclass
+class Cursor(Paginator):
+    """
+    the next page is requested using the cursor of the response - from the data or a header
+    """
+
+    parameter: str = "cursor"
+    """the name of the parameter of the cursor"""
+    field: Optional[str] = "next"
+    """the path of the cursor of the next page in the data"""
+    header: Optional[str] = None
+    """the header of the cursor of the next page - precedes field"""
+
+    def next(self, request, parameters, data, result, items):
+        if self.header is not None:
+            cursor = result.headers.get(self.header, None)
+        else:
+            cursor = _get(data, self.field)
+        if not cursor or not items:
+            return None
+        return {**parameters, self.parameter: cursor}
+
+
+@dataclasses.dataclass
+class Offset(Prefetch, Paginator):
+    """
+    offset & limit parameters - a page with less than size items is the last page
+    """
+
+    offset: str = "offset"
+    """the name of the offset parameter"""
+    limit: Optional[str] = "limit"
+    """the name of the limit parameter - None if the page size is fixed"""
+    size: int = 100
+    """the page size"""
+    start: int = 0
+    """the offset of the first item"""
+
+    def page(self, parameters, index):
+        r = {**parameters, self.offset: self.start + index * self.size}
+        if self.limit is not None:
+            r[self.limit] = self.size
+        return r
+
+    def first(self, parameters):
+        return self.page(parameters, 0)
+
+    def next(self, request, parameters, data, result, items):
+        if self.last(items):
+            return None
+        return {**parameters, self.offset: parameters[self.offset] + self.size}
+
+    def last(self, items):
+        return len(items) < self.size
+
+
+@dataclasses.dataclass
+class Page(Prefetch, Paginator):
+    """
+    page number & page size parameters - a page with less than size items is the last page
+    """
+
+    parameter: str = "page"
+    """the name of the page number parameter"""
+    size_parameter: Optional[str] = "per_page"
+    """the name of the page size parameter - None if the page size is fixed"""
+    size: int = 100
+    """the page size"""
+    start: int = 1
+    """the number of the first page"""
+
+    def page(self, parameters, index):
+        r = {**parameters, self.parameter: self.start + index}
+        if self.size_parameter is not None:
+            r[self.size_parameter] = self.size
+        return r
+
+    def first(self, parameters):
+        return self.page(parameters, 0)
+
+    def next(self, request, parameters, data, result, items):
+        if self.last(items):
+            return None
+        return {**parameters, self.parameter: parameters[self.parameter] + 1}
+
+    def last(self, items):
+        return len(items) < self.size
+
+
+PAGINATORS: dict[str, type[Paginator]] = {"link": Link, "cursor": Cursor, "offset": Offset, "page": Page}
+
+
+class Paginations:
+    """
+    the paginators of the Operations of an OpenAPI description document
+    """
+
+    def __init__(self) -> None:
+        self.operations: dict[str, Paginator] = dict()
+        """
+        the paginator of an Operation by operationId - precedes the specification extension
+        """
+
+        self._extensions: dict[int, tuple["OperationType", Optional[Paginator]]] = dict()
+
+    def __getitem__(self, operation: "OperationType") -> Optional[Paginator]:
+        if operation.operationId is not None and (r := self.operations.get(operation.operationId, None)) is not None:
+            return r
+        if (e := self._extensions.get(id(operation), None)) is None or e[0] is not operation:
+            value = (operation.extensions or dict()).get(EXTENSION, None)
+            e = self._extensions[id(operation)] = (
+                operation,
+                Paginator.from_extension(value) if value is not None else None,
+            )
+        return e[1]
+
+    def __getstate__(self):
+        return {"operations": self.operations, "_extensions": dict()}
+
+
+def _paginator(request: "RequestBase", paginator: Optional[Paginator]) -> Paginator:
+    if paginator is None and (paginator := request.api.pagination[request.operation]) is None:
+        raise ValueError(f"no paginator for Operation {request.operation.operationId}")
+    return paginator
+
+
+def _page(request: "RequestBase") -> "RequestBase":
+    """
+    a Request for a page requested concurrently - Requests are not shared
+    """
+    return request.api._createRequest(request.api, request.method, request.path, request.operation, request.servers)
+
+
+def paginate(
+    request: "RequestBase",
+    data: Optional["RequestData"],
+    parameters: Optional["RequestParameters"],
+    context: Any,
+    paginator: Optional[Paginator],
+    prefetch: int,
+) -> Iterator[Any]:
+    paginator = _paginator(request, paginator)
+    parameters = dict(parameters or dict())
+
+    if prefetch > 0 and isinstance(paginator, Prefetch):
+        with ThreadPoolExecutor(prefetch + 1, thread_name_prefix="aiopenapi3-pagination") as executor:
+            pending: collections.deque = collections.deque()
+            try:
+                for index in range(prefetch + 1):
+                    pending.append(
+                        executor.submit(_page(request).request, data, paginator.page(parameters, index), context)
+                    )
+                while pending:
+                    _, body, _ = pending.popleft().result()
+                    items = paginator.items_of(body)
+                    yield from items
+                    if paginator.last(items):
+                        break
+                    index += 1
+                    pending.append(
+                        executor.submit(_page(request).request, data, paginator.page(parameters, index), context)
+                    )
+            finally:
+                for future in pending:
+                    future.cancel()
+        return
+
+    page: Optional["RequestParameters"] = paginator.first(parameters)
+    while page is not None:
+        _, body, result = request.request(data, page, context)
+        items = paginator.items_of(body)
+        yield from items
+        page = paginator.next(request, page, body, result, items)
+
+
+async def apaginate(
+    request: "AsyncRequestBase",
+    data: Optional["RequestData"],
+    parameters: Optional["RequestParameters"],
+    context: Any,
+    paginator: Optional[Paginator],
+    prefetch: int,
+) -> AsyncIterator[Any]:
+    paginator = _paginator(request, paginator)
+    parameters = dict(parameters or dict())
+
+    if prefetch > 0 and isinstance(paginator, Prefetch):
+        pending: collections.deque[asyncio.Task] = collections.deque()
+        try:
+            for index in range(prefetch + 1):
+                pending.append(
+                    asyncio.ensure_future(_page(request).request(data, paginator.page(parameters, index), context))
+                )
+            while pending:
+                _, body, _ = await pending.popleft()
+                items = paginator.items_of(body)
+                for item in items:
+                    yield item
+                if paginator.last(items):
+                    break
+                index += 1
+                pending.append(
+                    asyncio.ensure_future(_page(request).request(data, paginator.page(parameters, index), context))
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        return
+
+    page: Optional["RequestParameters"] = paginator.first(parameters)
+    while page is not None:
+        _, body, result = await request.request(data, page, context)
+        items = paginator.items_of(body)
+        for item in items:
+            yield item
+        page = paginator.next(request, page, body, result, items)
@@ -1,7 +1,11 @@
+import asyncio
 import dataclasses
-from typing import TYPE_CHECKING, Any, Optional
+import inspect
+from typing import TYPE_CHECKING, Any, Optional, Union
+from collections.abc import Awaitable, Callable
 import abc
 import sys
+import types
 
 if sys.version_info >= (3, 10):
     from typing import TypeGuard
@@ -98,6 +102,8 @@ class Message(Plugin):
     sending: marshalled(dict)-> sending(str)
 
     receiving: received -> parsed -> unmarshalled
+
+    hooks may be coroutines - awaited in asynchronous requests, run to completion in synchronous requests
     """
 
     @dataclasses.dataclass
@@ -163,24 +169,92 @@ class Message(Plugin):
 
 
 class Domain:
-    def __init__(self, ctx, plugins: list[Plugin]):
+    def __init__(self, ctx, plugins: list[Plugin], base: Optional[type[Plugin]] = None):
         self.ctx = ctx
         self.plugins = plugins
+        self.base = base
+        self._init_methods()
+
+    def _init_methods(self) -> None:
+        """
+        precompute the hooks of the domain - no need to go through __getattr__ for each call
+        """
+        self.passthrough: type[Passthrough] = type(
+            f"{self.ctx.__qualname__}.Passthrough",
+            (Passthrough,),
+            {"_fields": frozenset(i.name for i in dataclasses.fields(self.ctx))},
+        )
+        if self.base is None:
+            return
+        for name, value in vars(self.base).items():
+            if name.startswith("_") or not callable(value) or isinstance(value, type):
+                continue
+            self._set_method(name)
+
+    def _set_method(self, name: str) -> Union["Method", type["Passthrough"]]:
+        """
+        hooks without implementations return the arguments as Passthrough - calling the Passthrough directly
+        skips creating the Context
+        """
+        r: Union[Method, type[Passthrough]] = Method(name, self)
+        if not r.methods:
+            r = self.passthrough
+        setattr(self, name, r)
+        return r
 
     def __getstate__(self):
-        return self.ctx, self.plugins
+        return self.ctx, self.plugins, self.base
 
     def __setstate__(self, state):
-        self.ctx, self.plugins = state
+        self.ctx, self.plugins, self.base = state
+        self._init_methods()
+
+    def __getattr__(self, name: str) -> Union["Method", type["Passthrough"]]:
+        if name.startswith("_") or name in ("ctx", "plugins", "base", "passthrough"):
+            raise AttributeError(name)
+        return self._set_method(name)
+
+
+class Passthrough(types.SimpleNamespace):
+    """
+    returned by a hook without any implementation instead of the Context
+
+    provides the arguments unchanged - without creating the Context and calling the hook of each plugin
+    """
+
+    _fields: frozenset[str] = frozenset()
+    methods: tuple[Callable[[Any], Any], ...] = ()
 
-    def __getattr__(self, name: str) -> "Method":
-        return Method(name, self)
+    def __getattr__(self, name: str) -> Any:
+        if name in self._fields:
+            return None
+        raise AttributeError(name)
+
+    @classmethod
+    async def acall(cls, **kwargs) -> "Passthrough":
+        return cls(**kwargs)
 
 
 class Method:
     def __init__(self, name: str, domain: Domain):
         self.name = name
         self.domain = domain
+        self.methods: tuple[Callable[[Any], Any], ...] = tuple(
+            method for plugin in domain.plugins if (method := self._implementation(plugin)) is not None
+        )
+        """
+        the bound methods of the plugins implementing the hook
+        """
+
+    def _implementation(self, plugin: Plugin) -> Optional[Callable[[Any], Any]]:
+        if (method := getattr(plugin, self.name, None)) is None:
+            return None
+        if self.domain.base is not None and getattr(method, "__func__", None) is getattr(
+            self.domain.base, self.name, None
+        ):
+            """the default implementation - returning the Context unmodified"""
+            return None
+        return method
 
     def __call__(self, **kwargs):
         # pickle …
@@ -188,13 +262,47 @@ class Method:
         #        if not kwargs:
         #            return
         r = self.domain.ctx(**kwargs)
-        for plugin in self.domain.plugins:
-            method = getattr(plugin, self.name, None)
-            if method is None:
-                continue
-            method(r)
+        for method in self.methods:
+            if inspect.isawaitable(v := method(r)):
+                run_to_completion(v)
         return r
 
+    async def acall(self, **kwargs):
+        """
+        call the hook - awaiting coroutine implementations
+        """
+        r = self.domain.ctx(**kwargs)
+        for method in self.methods:
+            if inspect.isawaitable(v := method(r)):
+                await v
+        return r
+
+
+def run_to_completion(awaitable: Awaitable[Any]) -> Any:
+    """
+    run a coroutine hook implementation in a synchronous context
+
+    :raises RuntimeError: if an event loop is running in this thread already
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError("coroutine plugin hooks can not be used in synchronous requests within a running event loop")
+
+    async def wait():
+        return await awaitable
+
+    # a private loop - asyncio.run() would reset the event loop of the thread
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(wait())
+    finally:
+        loop.close()
+
 
 class Plugins:
     _domains: dict[str, type[Plugin]] = {"init": Init, "document": Document, "message": Message}
@@ -216,7 +324,7 @@ class Plugins:
             return isinstance(p, domain)
 
         p: list[Plugin] = list(filter(domain_type_f, plugins))
-        return Domain(domain.Context, p)
+        return Domain(domain.Context, p, domain)
 
     @property
     def init(self) -> Domain:
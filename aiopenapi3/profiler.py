@@ -0,0 +1,99 @@
+"""
+the startup profiler records where the time of OpenAPI.__init__ goes
+
+phases:
+  * parse - parsing a description document (per url)
+  * resolve - resolving the references of a description document (per url)
+  * operationindex - creating the operation index
+  * get_type - creating the model for a schema (per schema identity)
+  * model_rebuild - rebuilding the model of a schema (per schema identity)
+  * plugin - calling an Init plugin hook (per hook)
+"""
+
+import collections
+import contextlib
+import dataclasses
+import time
+import tracemalloc
+from typing import Any, Optional
+from collections.abc import Iterator
+
+
+class Profiler:
+    @dataclasses.dataclass
+    class Sample:
+        phase: str
+        """the startup phase"""
+        key: Optional[str]
+        """the document url, schema identity or plugin hook measured"""
+        duration: float = 0.0
+        """wall clock time in seconds, including nested samples"""
+        own: float = 0.0
+        """wall clock time in seconds, excluding nested samples"""
+        allocated: Optional[int] = None
+        """net memory allocated in bytes - only available if tracemalloc is tracing"""
+
+    def __init__(self) -> None:
+        self.samples: list[Profiler.Sample] = []
+        self._stack: list[float] = []
+
+    def __getstate__(self):
+        return {"samples": self.samples, "_stack": []}
+
+    @contextlib.contextmanager
+    def measure(self, phase: str, key: Optional[str] = None) -> Iterator["Profiler.Sample"]:
+        """
+        measure the time & allocations of a block of code
+
+        :param phase: the name of the phase
+        :param key: the item processed
+        """
+        sample = Profiler.Sample(phase, key)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            before = tracemalloc.get_traced_memory()[0]
+        self._stack.append(0.0)
+        begin = time.perf_counter()
+        try:
+            yield sample
+        finally:
+            sample.duration = time.perf_counter() - begin
+            nested = self._stack.pop()
+            sample.own = sample.duration - nested
+            if self._stack:
+                self._stack[-1] += sample.duration
+            if tracing:
+                sample.allocated = tracemalloc.get_traced_memory()[0] - before
+            self.samples.append(sample)
+
+    def totals(self) -> dict[str, float]:
+        """
+        :return: the time spent in each phase, excluding nested samples
+        """
+        r: dict[str, float] = collections.defaultdict(float)
+        for i in self.samples:
+            r[i.phase] += i.own
+        return dict(sorted(r.items(), key=lambda x: x[1], reverse=True))
+
+    def report(self, phase: Optional[str] = None, limit: Optional[int] = None) -> list["Profiler.Sample"]:
+        """
+        the samples sorted by the time spent, excluding nested samples
+
+        :param phase: limit to samples of this phase
+        :param limit: limit the number of samples
+        """
+        r = sorted(filter(lambda x: phase is None or x.phase == phase, self.samples), key=lambda x: x.own, reverse=True)
+        return r[:limit]
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"totals": self.totals(), "samples": [dataclasses.asdict(i) for i in self.report()]}
+
+    def format(self, limit: Optional[int] = 25) -> str:
+        lines = ["phase totals"]
+        for phase, duration in self.totals().items():
+            lines.append(f"  {duration * 1000:10.3f} ms  {phase}")
+        lines.append(f"top {limit} samples" if limit else "samples")
+        for i in self.report(limit=limit):
+            allocated = f" {i.allocated / 1024:10.1f} KiB" if i.allocated is not None else ""
+            lines.append(f"  {i.own * 1000:10.3f} ms {allocated} {i.phase:14s} {i.key or ''}")
+        return "\n".join(lines)
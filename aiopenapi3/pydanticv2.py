@@ -1,3 +1,4 @@
+import functools
 from decimal import Decimal
 from datetime import datetime, date, time, timedelta
 from ipaddress import IPv4Network, IPv6Network, IPv4Interface, IPv6Interface, IPv4Address, IPv6Address
@@ -35,9 +36,21 @@ field_classes_to_support: tuple[type[Any], ...] = (
     frozenset,
 )
 
-field_class_to_schema: tuple[tuple[Any, dict[str, Any]], ...] = tuple(
-    (field_class, TypeAdapter(field_class).json_schema()) for field_class in field_classes_to_support
-)
+
+@functools.cache
+def field_class_schemas() -> tuple[tuple[Any, dict[str, Any]], ...]:
+    """
+    the json schema of the field classes supported - created on first use as creating the TypeAdapters is expensive
+    """
+    return tuple((field_class, TypeAdapter(field_class).json_schema()) for field_class in field_classes_to_support)
+
+
+def __getattr__(name: str) -> Any:
+    # field_class_to_schema - the module constant, created on first access
+    if name == "field_class_to_schema":
+        return field_class_schemas()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 from pydantic import ConfigDict, BaseModel, PydanticUserError
 from pydantic.main import ModelT
@@ -0,0 +1,341 @@
+"""
+client side rate limiting - a token bucket per operation, server or security identity
+
+the buckets adapt to the quota announced by the server
+
+  * RateLimit-Limit/-Remaining/-Reset & X-RateLimit-Limit/-Remaining/-Reset
+  * RateLimit: limit=100, remaining=50, reset=30 - or r=50;t=30
+  * Retry-After
+
+the remaining quota is spread until the reset instead of exhausting it & receiving 429 responses until the reset
+"""
+
+import asyncio
+import dataclasses
+import email.utils
+import hashlib
+import logging
+import math
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+from collections.abc import Awaitable, Hashable
+
+import httpx
+
+if TYPE_CHECKING:
+    from ._types import OperationType
+    from .request import RequestBase
+
+
+log = logging.getLogger("aiopenapi3.ratelimit")
+
+EXTENSION = "aiopenapi3-rate-limit"
+"""
+the specification extension to configure the rate limit of an Operation - or of the description document
+
+  x-aiopenapi3-rate-limit: 10
+
+  x-aiopenapi3-rate-limit:
+    rate: 10
+    burst: 20
+"""
+
+_FIELDS = re.compile(r"([a-z]+)=([0-9]+(?:\.[0-9]+)?)")
+
+
+@dataclasses.dataclass(frozen=True)
+class RateLimit:
+    rate: float
+    """requests per second"""
+    burst: int = 1
+    """the number of requests which can be sent at once"""
+
+    def __post_init__(self) -> None:
+        if not self.rate > 0:
+            raise ValueError(f"rate limit rate {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"rate limit burst {self.burst}")
+
+    @classmethod
+    def from_extension(cls, value: Union[float, dict[str, Any]]) -> "RateLimit":
+        if isinstance(value, (int, float)):
+            return cls(rate=value)
+        return cls(**value)
+
+
+class TokenBucket:
+    """
+    the token bucket of a key - waiting requests reserve tokens in advance, the rate is smooth
+    """
+
+    def __init__(self, limit: Optional[RateLimit], clock: Callable[[], float] = time.monotonic) -> None:
+        self.limit: Optional[RateLimit] = limit
+        """the rate limit configured - None for buckets adapting to the quota only"""
+
+        self.rate: Optional[float] = limit.rate if limit else None
+        """the current rate - adapted to the remaining quota"""
+
+        self.burst: float = limit.burst if limit else math.inf
+        self.tokens: float = self.burst
+        """the tokens available - negative for requests waiting"""
+
+        self.blocked: float = 0.0
+        """the time of the clock requests are blocked until - Retry-After or quota exhausted"""
+
+        self.clock: Callable[[], float] = clock
+        """the monotonic clock - time.monotonic"""
+
+        self._updated: float = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        take a token
+
+        :return: the delay to wait before sending the request
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            self.tokens -= 1
+            delay = max(0.0, self.blocked - now)
+            if self.tokens < 0 and self.rate is not None:
+                delay = max(delay, -self.tokens / self.rate)
+            return delay
+
+    def update(self, remaining: Optional[float], reset: Optional[float], retry_after: Optional[float]) -> None:
+        """
+        adapt to the quota announced by the server
+
+        :param remaining: the number of requests remaining in the quota
+        :param reset: the seconds until the quota resets
+        :param retry_after: the seconds to wait
+        """
+        with self._lock:
+            now = self.clock()
+            self._refill(now)
+            if retry_after is not None:
+                self.blocked = max(self.blocked, now + retry_after)
+            if remaining is None or reset is None:
+                return
+            if remaining < 1:
+                self.blocked = max(self.blocked, now + reset)
+            elif reset > 0:
+                rate = remaining / reset
+                self.rate = rate if self.limit is None else min(self.limit.rate, rate)
+                if self.limit is None:
+                    self.burst = remaining
+                self.tokens = min(self.tokens, remaining)
+
+
+class RateLimiter:
+    """
+    rate limit the requests - the requests wait for their token before they are sent
+
+    .. code:: python
+
+        api.rate_limit = RateLimiter(RateLimit(rate=10, burst=5), per="identity")
+        api.rate_limit.operations["listPets"] = RateLimit(rate=1)
+
+    the rate limit of a request
+
+      * operations - by operationId
+      * the specification extension of the Operation
+      * default
+      * the specification extension of the description document
+
+    Operations with their own rate limit use their own bucket.
+    Without rate limit, the buckets adapt to the quota announced by the server only.
+    """
+
+    def __init__(
+        self,
+        default: Optional[RateLimit] = None,
+        per: Union[
+            Literal["operation", "server", "identity"], Callable[["RequestBase", httpx.Request], Hashable]
+        ] = "server",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        asleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if not callable(per) and per not in ("operation", "server", "identity"):
+            raise ValueError(f"rate limit per {per}")
+
+        self.default: Optional[RateLimit] = default
+        """
+        the rate limit for requests without rate limit
+        """
+
+        self.per: Union[str, Callable[["RequestBase", httpx.Request], Hashable]] = per
+        """
+        the key of the buckets
+
+          * operation - per Operation
+          * server - per scheme, host & port
+          * identity - per server & credentials - c.f. :meth:`aiopenapi3.OpenAPI.authenticate`
+          * a callable returning the key for the request
+        """
+
+        self.operations: dict[str, RateLimit] = dict()
+        """
+        the rate limit of an Operation by operationId - precedes the specification extension
+        """
+
+        self.buckets: dict[Hashable, TokenBucket] = dict()
+        """
+        the buckets by key
+        """
+
+        self.clock: Callable[[], float] = clock
+        """
+        the monotonic clock of the buckets - time.monotonic
+        """
+
+        self.sleep: Callable[[float], None] = sleep
+        """
+        wait for the token - time.sleep
+        """
+
+        self.asleep: Callable[[float], Awaitable[None]] = asleep
+        """
+        wait for the token of asynchronous requests - asyncio.sleep
+        """
+
+        self._extensions: dict[int, tuple[Any, Optional[RateLimit]]] = dict()
+        self._lock = threading.Lock()
+
+    def _extension(self, obj: Any) -> Optional[RateLimit]:
+        if (e := self._extensions.get(id(obj), None)) is None or e[0] is not obj:
+            value = (obj.extensions or dict()).get(EXTENSION, None)
+            e = self._extensions[id(obj)] = (obj, RateLimit.from_extension(value) if value is not None else None)
+        return e[1]
+
+    def limit(self, request: "RequestBase") -> tuple[Optional[RateLimit], bool]:
+        """
+        the rate limit of the request
+
+        :return: the rate limit, the rate limit is the Operations own
+        """
+        operation: "OperationType" = request.operation
+        if operation.operationId is not None and (r := self.operations.get(operation.operationId, None)) is not None:
+            return r, True
+        if (r := self._extension(operation)) is not None:
+            return r, True
+        if self.default is not None:
+            return self.default, False
+        return self._extension(request.root), False
+
+    @staticmethod
+    def _operation(request: "RequestBase") -> Hashable:
+        return request.operation.operationId or (request.method, request.path)
+
+    @staticmethod
+    def _identity(request: "RequestBase") -> tuple[tuple[str, ...], str]:
+        """
+        the security schemes authenticated & the digest of the credentials - the key does not retain the credentials
+        """
+        security = request.api._security
+        digest = hashlib.sha256(repr(sorted((k, repr(v)) for k, v in security.items())).encode()).hexdigest()
+        return tuple(sorted(security.keys())), digest
+
+    def key(self, request: "RequestBase", req: httpx.Request, own: bool = False) -> Hashable:
+        """
+        the key of the bucket for the request
+
+        :param own: the Operation has its own rate limit
+        """
+        if callable(self.per):
+            key = self.per(request, req)
+        elif self.per == "operation":
+            return ("operation", self._operation(request))
+        else:
+            key = ("server", req.url.scheme, req.url.host, req.url.port)
+            if self.per == "identity":
+                key = ("identity", key, self._identity(request))
+        if own:
+            key = (key, self._operation(request))
+        return key
+
+    def bucket(self, request: "RequestBase", req: httpx.Request) -> TokenBucket:
+        """
+        the bucket for the request - created on demand
+        """
+        limit, own = self.limit(request)
+        key = self.key(request, req, own)
+        if (bucket := self.buckets.get(key, None)) is None:
+            with self._lock:
+                if (bucket := self.buckets.get(key, None)) is None:
+                    bucket = self.buckets[key] = TokenBucket(limit, self.clock)
+        return bucket
+
+    def acquire(self, request: "RequestBase", req: httpx.Request) -> TokenBucket:
+        """
+        wait for the token of the request - blocking
+
+        :return: the bucket to update with the response
+        """
+        bucket = self.bucket(request, req)
+        if (delay := bucket.reserve()) > 0:
+            log.debug("rate limit - %s waits %.3fs", req.url, delay)
+            self.sleep(delay)
+        return bucket
+
+    async def aacquire(self, request: "RequestBase", req: httpx.Request) -> TokenBucket:
+        """
+        wait for the token of the request - asynchronous
+
+        :return: the bucket to update with the response
+        """
+        bucket = self.bucket(request, req)
+        if (delay := bucket.reserve()) > 0:
+            log.debug("rate limit - %s waits %.3fs", req.url, delay)
+            await self.asleep(delay)
+        return bucket
+
+    @staticmethod
+    def update(bucket: TokenBucket, result: httpx.Response) -> None:
+        """
+        adapt the bucket to the quota announced in the headers of the response
+        """
+        headers = result.headers
+        remaining = reset = None
+        if (value := headers.get("RateLimit", None)) is not None:
+            fields = dict(_FIELDS.findall(value.lower()))
+            remaining = _float(fields.get("remaining", fields.get("r", None)))
+            reset = _float(fields.get("reset", fields.get("t", None)))
+        for prefix in ("RateLimit-", "X-RateLimit-"):
+            if remaining is None:
+                remaining = _float(headers.get(f"{prefix}Remaining", None))
+            if reset is None:
+                reset = _float(headers.get(f"{prefix}Reset", None))
+        if reset is not None and reset > 1e9:
+            # X-RateLimit-Reset as epoch timestamp
+            reset = max(0.0, reset - time.time())
+
+        retry_after = None
+        if (value := headers.get("Retry-After", None)) is not None:
+            if (retry_after := _float(value)) is None:
+                try:
+                    retry_after = max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    retry_after = None
+
+        if remaining is not None or reset is not None or retry_after is not None:
+            bucket.update(remaining, reset, retry_after)
+
+
+def _float(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        r = float(value)
+    except ValueError:
+        return None
+    return max(0.0, r) if math.isfinite(r) else None
@@ -1,15 +1,17 @@
 import abc
 import collections
+import contextlib
+import time
 import typing
 from contextlib import closing
-from typing import Any, NamedTuple, Optional, Union, cast
-from collections.abc import Iterator
+from typing import Any, NamedTuple, Optional, TypeVar, Union, cast
+from collections.abc import AsyncIterator, Coroutine, Iterator, Sequence
 
 import httpx
 import pydantic
 import yarl
 
-from aiopenapi3.errors import ContentLengthExceededError
+from aiopenapi3.errors import ContentLengthExceededError, ResponseDecodingError, ResponseSchemaError
 
 
 try:
@@ -27,8 +29,13 @@ except:  # <= Python 3.10
 
 from .base import HTTP_METHODS, ReferenceBase
 from .version import __version__
+from .tls import session_factory
+from .circuitbreaker import Call
+from .concurrency import Slot
 from .errors import RequestError, OperationIdDuplicationError, HTTPServerError, HTTPClientError
 
+_T = TypeVar("_T")
+
 if typing.TYPE_CHECKING:
     from ._types import (
         RequestParameters,
@@ -49,6 +56,24 @@ if typing.TYPE_CHECKING:
         HTTPMethodType,
     )
     from aiopenapi3 import OpenAPI
+    from .arrow import Columnar, Splitter
+    from .pagination import Paginator
+    import pyarrow
+
+
+def complete(coro: Coroutine[Any, Any, _T]) -> _T:
+    """
+    run a coroutine which does not suspend to completion
+
+    the processing of synchronous and asynchronous requests is shared, the synchronous requests call the plugins
+    synchronously, therefore the coroutine completes without suspending
+    """
+    try:
+        coro.send(None)
+    except StopIteration as e:
+        return e.value
+    coro.close()
+    raise RuntimeError("synchronous request suspended")
 
 
 class RequestParameter:
@@ -65,6 +90,32 @@ class RequestParameter:
         self.cert: Any = None
 
 
+class Authorization(NamedTuple):
+    """
+    the authorization of requests resolved from the security requirements of an Operation & the credentials,
+    c.f. :meth:`aiopenapi3.OpenAPI.authenticate`
+    """
+
+    auth: Optional["AuthTypes"]
+    cert: Any
+    headers: dict[str, str]
+    params: dict[str, str]
+    cookies: dict[str, str]
+
+    @classmethod
+    def of(cls, req: RequestParameter) -> "Authorization":
+        return cls(req.auth, req.cert, req.headers, req.params, req.cookies)
+
+    def apply(self, req: RequestParameter) -> None:
+        if self.auth is not None:
+            req.auth = self.auth
+        if self.cert is not None:
+            req.cert = self.cert
+        req.headers.update(self.headers)
+        req.params.update(self.params)
+        req.cookies.update(self.cookies)
+
+
 class RequestBase:
     class StreamResponse(NamedTuple):
         headers: "ResponseHeadersType"
@@ -84,6 +135,14 @@ class RequestBase:
         """
         call provided context data for use in :func:`aiopenapi3.plugin.Message`
         """
+        fields: Optional[Sequence[str]] = None
+        """
+        the paths of the properties of the response selected, c.f. :meth:`aiopenapi3.base.SchemaBase.model`
+        """
+        plain: bool = False
+        """
+        return the data of the response as plain dicts & lists instead of models
+        """
 
     """
     A Request compiles all required information to call an Operation
@@ -169,15 +228,64 @@ class RequestBase:
         """
         return {"cert": self.req.cert, "auth": self.req.auth, "headers": {"user-agent": f"aiopenapi3/{__version__}"}}
 
+    def _session(self) -> Union[httpx.Client, httpx.AsyncClient]:
+        """
+        create the session for the request - httpx.Client & httpx.AsyncClient share the SSLContext, c.f. aiopenapi3.tls
+        """
+        return session_factory(self.api._session_factory)(**self._session_factory_default_args)
+
+    def _call(self, req: httpx.Request) -> Call:
+        """
+        permit the request - c.f. aiopenapi3.circuitbreaker
+
+        :raises CircuitOpenError: the circuit of the request is open
+        """
+        if (breaker := self.api.circuit_breaker) is None:
+            return Call(None)
+        return breaker.call(self, req)
+
+    def _slot(self, req: httpx.Request) -> Slot:
+        """
+        wait for the slot of the request - c.f. aiopenapi3.concurrency
+
+        :raises ConcurrencyLimitError: the slot was not acquired within the deadline
+        """
+        if (limiter := self.api.concurrency_limit) is None:
+            return Slot(None)
+        return limiter.acquire(self, req)
+
+    @contextlib.contextmanager
+    def _sending(
+        self, session: httpx.Client, data: Optional["RequestData"], parameters: Optional["RequestParameters"]
+    ) -> Iterator[httpx.Response]:
+        """
+        send the request - the circuit is checked first, the rate limit token taken next & the slot acquired last
+        the slot is not held while waiting for the token
+        the circuit & the slot record the outcome once the block exits, e.g. the body was read
+        """
+        req = self._build_req(session)
+        with self._call(req) as call:
+            if (limiter := self.api.rate_limit) is not None:
+                bucket = limiter.acquire(self, req)
+            with self._slot(req) as slot:
+                call.started, slot.started = time.monotonic(), slot.clock()
+                try:
+                    result = session.send(req, stream=True)
+                except Exception as e:
+                    raise RequestError(self.operation, self, data, parameters) from e
+                slot.status_code = call.status_code = result.status_code
+                if limiter is not None:
+                    limiter.update(bucket, result)
+                yield result
+
     def _send(
         self, session: httpx.Client, data: Optional["RequestData"], parameters: Optional["RequestParameters"]
     ) -> httpx.Response:
-        req = self._build_req(session)
-        try:
-            result = session.send(req, stream=True)
-        except Exception as e:
-            raise RequestError(self.operation, self, data, parameters) from e
-        return result
+        """
+        :meth:`_sending` - the outcome is recorded once the headers were received
+        """
+        with self._sending(session, data, parameters) as result:
+            return result
 
     @abc.abstractmethod
     def _process_stream(self, result: httpx.Response) -> tuple["ResponseHeadersType", Optional["SchemaType"]]:
@@ -195,9 +303,59 @@ class RequestBase:
         """
         ...
 
+    async def _aprocess_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
+        """
+        :meth:`_process_request` for asynchronous requests - awaiting coroutine Message hooks
+        """
+        return self._process_request(result)
+
+    def _prepare_security_requirements(self, security: Optional[list[Any]]) -> None:
+        """
+        satisfy one of the security requirements using the credentials provided - sets self.req
+
+        the default does not authorize the request
+        """
+        pass
+
+    def _prepare_authorization(self, security: Optional[list[Any]]) -> None:
+        """
+        apply the authorization for the security requirements
+        resolved once per security requirements, servers & request class - cached until the credentials change
+
+        :param security: the security requirements of the Operation
+        """
+        key = (id(security), str(self.api._base_url), id(self.servers), type(self))
+        if (r := self.api._authorizations.get(key, None)) is None or r[0] is not security:
+            req, self.req = self.req, RequestParameter(self.req.url)
+            try:
+                self._prepare_security_requirements(security)
+                authorization = Authorization.of(self.req)
+            finally:
+                self.req = req
+            r = self.api._authorizations[key] = (security, authorization)
+
+        authorization = r[1]
+        if (refresh := self.api.token_refresh) is not None and authorization.auth is not None:
+            refresh.register(authorization.auth)
+        authorization.apply(self.req)
+
     @abc.abstractmethod
     def _prepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]) -> None: ...
 
+    async def _aprepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]) -> None:
+        """
+        :meth:`_prepare` for asynchronous requests - awaiting coroutine Message hooks
+        """
+        self._prepare(data, parameters)
+
+    async def _message(self, hook, **kwargs):
+        """
+        call the :class:`aiopenapi3.plugin.Message` hook
+
+        synchronous requests run coroutine hooks to completion
+        """
+        return hook(**kwargs)
+
     def _build_req(self, session: Union[httpx.Client, httpx.AsyncClient]) -> httpx.Request:
         url: yarl.URL = self.api.url
 
@@ -227,6 +385,8 @@ class RequestBase:
         data: Optional["RequestData"] = None,
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
+        fields: Optional[Sequence[str]] = None,
+        plain: Optional[bool] = None,
     ) -> "RequestBase.Response":
         """
         Sends an HTTP request as described by this Path
@@ -237,13 +397,15 @@ class RequestBase:
         :type parameters: dict{str: str}
         :param context: The request context for use in aiopenapi3.plugin.Message
         :type context: Any
+        :param fields: Only validate & return the properties of the paths given, e.g. ["id", "owner.name"]
+        :type fields: list[str]
+        :param plain: Return the data as plain dicts & lists instead of models, defaults to OpenAPI.plain
+        :type plain: bool
         :return: headers, data, response
         """
-        self.vars = RequestBase.Vars(parameters, data, context)
+        self.vars = RequestBase.Vars(parameters, data, context, fields, self.api.plain if plain is None else plain)
         self._prepare(data, parameters)
-        with closing(self.api._session_factory(**self._session_factory_default_args)) as session:
-            result = self._send(session, data, parameters)
-
+        with closing(self._session()) as session, self._sending(session, data, parameters) as result:
             if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
                 raise ContentLengthExceededError(
                     self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
@@ -278,11 +440,133 @@ class RequestBase:
 
         self.vars = RequestBase.Vars(parameters, data, context)
         self._prepare(data, parameters)
-        session = self.api._session_factory(**self._session_factory_default_args)
+        session = self._session()
         result = self._send(session, data, parameters)
         headers, schema_ = self._process_stream(result)
         return RequestBase.StreamResponse(headers, schema_, session, result)
 
+    def arrow(
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        validate: bool = True,
+    ) -> "pyarrow.Table":
+        """
+        Sends an HTTP request as described by this Path - returns the array of objects of the response as Arrow table
+          * the Arrow schema is derived from the Schema of the items of the array
+          * the JSON document is decoded into columns, without creating models
+          * requires pyarrow
+
+        :param data: The request body to send.
+        :param parameters: The path/header/query/cookie parameters required for the operation
+        :param validate: validate the constraints of the Schema column-wise
+        :return: the table
+        """
+        from .arrow import pa
+
+        headers, schema_, session, result = self.stream(data, parameters, context)
+        with closing(session), closing(result):
+            if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
+                raise ContentLengthExceededError(
+                    self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
+                )
+            result.read()
+        self._raise_on_http_status(result.status_code, headers, result.content)
+        columnar = self._get_columnar(schema_)
+        return pa.Table.from_batches([self._arrow(columnar, schema_, result, result.content, True, validate)])
+
+    def arrow_batches(
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        validate: bool = True,
+        block_size: int = 1 << 20,
+    ) -> Iterator["pyarrow.RecordBatch"]:
+        """
+        Sends an HTTP request as described by this Path - decodes the array of objects of the response while receiving
+          * a record batch per block of items of block_size bytes
+          * the response is not required to be in memory at once - intended for large results
+
+        :param validate: validate the constraints of the Schema column-wise
+        :param block_size: the size of the blocks of items decoded at once
+        :return: the record batches
+        """
+        from .arrow import Splitter
+
+        headers, schema_, session, result = self.stream(data, parameters, context)
+        with closing(session), closing(result):
+            if not result.is_success:
+                self._raise_on_http_status(result.status_code, headers, result.read())
+            columnar = self._get_columnar(schema_)
+            splitter = Splitter(block_size)
+            for chunk in result.iter_bytes():
+                for block in splitter.feed(chunk):
+                    yield self._arrow(columnar, schema_, result, block, False, validate)
+            self._arrow_close(splitter, result)
+
+    def paginate(
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        paginator: Optional["Paginator"] = None,
+        prefetch: int = 0,
+    ) -> Iterator[Any]:
+        """
+        Sends HTTP requests as described by this Path for the pages - returns the validated items of the pages
+          * the paginator defaults to the paginator of the Operation - c.f. :class:`aiopenapi3.pagination.Paginations`
+          * the pages of offset & page pagination are requested concurrently, prefetch pages ahead
+
+        :param data: The request body to send.
+        :param parameters: The path/header/query/cookie parameters required for the operation
+        :param paginator: the paginator - c.f. aiopenapi3.pagination
+        :param prefetch: the number of pages to request ahead
+        :return: the items
+        """
+        from .pagination import paginate
+
+        return paginate(self, data, parameters, context, paginator, prefetch)
+
+    def _get_columnar(self, schema_: Optional["SchemaType"]) -> "Columnar":
+        """
+        the Arrow schema of the response Schema - cached per Schema
+        """
+        from .arrow import Columnar
+
+        if (r := self.api._columnar.get(id(schema_), None)) is None:
+            r = self.api._columnar[id(schema_)] = (schema_, Columnar(schema_))
+        return r[1]
+
+    def _arrow(
+        self,
+        columnar: "Columnar",
+        schema_: Optional["SchemaType"],
+        result: httpx.Response,
+        data: bytes,
+        document: bool,
+        validate: bool,
+    ) -> "pyarrow.RecordBatch":
+        """
+        decode the JSON document - or a block of items of the document
+        """
+        try:
+            batch = columnar.read(data) if document else columnar.block(data)
+            if validate:
+                columnar.validate(batch)
+        except ValueError as e:
+            if columnar.invalid_json(e):
+                raise ResponseDecodingError(self.operation, data.decode(errors="replace"), result)
+            raise ResponseSchemaError(self.operation, None, schema_, result, e)
+        return batch
+
+    def _arrow_close(self, splitter: "Splitter", result: httpx.Response) -> None:
+        try:
+            splitter.close()
+        except ValueError:
+            raise ResponseDecodingError(self.operation, "", result)
+
     @property
     @abc.abstractmethod
     def data(self) -> Optional["SchemaType"]:
@@ -315,27 +599,61 @@ class AsyncRequestBase(RequestBase):
             return headers, data
         return data
 
+    @contextlib.asynccontextmanager
+    async def _asending(
+        self, session: httpx.AsyncClient, data: Optional["RequestData"], parameters: Optional["RequestParameters"]
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        :meth:`_sending` for asynchronous requests
+        """
+        req = self._build_req(session)
+        with self._call(req) as call:
+            if (limiter := self.api.rate_limit) is not None:
+                bucket = await limiter.aacquire(self, req)
+            with await self._aslot(req) as slot:
+                call.started, slot.started = time.monotonic(), slot.clock()
+                try:
+                    result = await session.send(req, stream=True)
+                except Exception as e:
+                    raise RequestError(self.operation, self, data, parameters or dict()) from e
+                slot.status_code = call.status_code = result.status_code
+                if limiter is not None:
+                    limiter.update(bucket, result)
+                yield result
+
     async def _send(
         self, session: httpx.AsyncClient, data: Optional["RequestData"], parameters: Optional["RequestParameters"]
     ) -> httpx.Response:  # type: ignore[override]
-        req = self._build_req(session)
-        try:
-            result = await session.send(req, stream=True)
-        except Exception as e:
-            raise RequestError(self.operation, self, data, parameters or dict()) from e
-        return result
+        """
+        :meth:`_asending` - the outcome is recorded once the headers were received
+        """
+        async with self._asending(session, data, parameters) as result:
+            return result
+
+    async def _aslot(self, req: httpx.Request) -> Slot:
+        if (limiter := self.api.concurrency_limit) is None:
+            return Slot(None)
+        return await limiter.aacquire(self, req)
+
+    async def _message(self, hook, **kwargs):
+        """
+        call the :class:`aiopenapi3.plugin.Message` hook
+
+        asynchronous requests await coroutine hooks
+        """
+        return await hook.acall(**kwargs)
 
     async def request(  # type: ignore[override]
         self,
         data: Optional["RequestData"] = None,
         parameters: Optional["RequestParameters"] = None,
         context: Any = None,
+        fields: Optional[Sequence[str]] = None,
+        plain: Optional[bool] = None,
     ) -> "RequestBase.Response":
-        self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        async with aclosing(self.api._session_factory(**self._session_factory_default_args)) as session:
-            result = await self._send(session, data, parameters)
-
+        self.vars = RequestBase.Vars(parameters, data, context, fields, self.api.plain if plain is None else plain)
+        await self._aprepare(data, parameters)
+        async with aclosing(self._session()) as session, self._asending(session, data, parameters) as result:
             if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
                 raise ContentLengthExceededError(
                     self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
@@ -343,7 +661,7 @@ class AsyncRequestBase(RequestBase):
 
             await result.aread()
 
-        headers, data = self._process_request(result)
+        headers, data = await self._aprocess_request(result)
         return RequestBase.Response(headers, data, result)
 
     async def stream(  # type: ignore[override]
@@ -353,12 +671,68 @@ class AsyncRequestBase(RequestBase):
         context: Any = None,
     ) -> "AsyncRequestBase.StreamResponse":
         self.vars = RequestBase.Vars(parameters, data, context)
-        self._prepare(data, parameters)
-        session = self.api._session_factory(**self._session_factory_default_args)
+        await self._aprepare(data, parameters)
+        session = self._session()
         result = await self._send(session, data, parameters)
         headers, schema_ = self._process_stream(result)
         return AsyncRequestBase.StreamResponse(headers, schema_, session, result)
 
+    async def arrow(  # type: ignore[override]
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        validate: bool = True,
+    ) -> "pyarrow.Table":
+        from .arrow import pa
+
+        headers, schema_, session, result = await self.stream(data, parameters, context)
+        async with aclosing(session), aclosing(result):
+            if (cl := int(result.headers.get("Content-Length", 0))) > (m := self.api._max_response_content_length):
+                raise ContentLengthExceededError(
+                    self.operation, cl, f"Content-Length ({cl}) exceeds maximum ({m})", result
+                )
+            await result.aread()
+        self._raise_on_http_status(result.status_code, headers, result.content)
+        columnar = self._get_columnar(schema_)
+        return pa.Table.from_batches([self._arrow(columnar, schema_, result, result.content, True, validate)])
+
+    async def arrow_batches(  # type: ignore[override]
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        validate: bool = True,
+        block_size: int = 1 << 20,
+    ) -> AsyncIterator["pyarrow.RecordBatch"]:
+        from .arrow import Splitter
+
+        headers, schema_, session, result = await self.stream(data, parameters, context)
+        async with aclosing(session), aclosing(result):
+            if not result.is_success:
+                self._raise_on_http_status(result.status_code, headers, await result.aread())
+            columnar = self._get_columnar(schema_)
+            splitter = Splitter(block_size)
+            async for chunk in result.aiter_bytes():
+                for block in splitter.feed(chunk):
+                    yield self._arrow(columnar, schema_, result, block, False, validate)
+            self._arrow_close(splitter, result)
+
+    def paginate(  # type: ignore[override]
+        self,
+        data: Optional["RequestData"] = None,
+        parameters: Optional["RequestParameters"] = None,
+        context: Any = None,
+        paginator: Optional["Paginator"] = None,
+        prefetch: int = 0,
+    ) -> AsyncIterator[Any]:
+        """
+        :meth:`RequestBase.paginate` for asynchronous requests - the items are returned by an asynchronous iterator
+        """
+        from .pagination import apaginate
+
+        return apaginate(self, data, parameters, context, paginator, prefetch)
+
 
 class OperationIndex:
     class OperationTag:
@@ -0,0 +1,123 @@
+"""
+sharing the SSLContext of the sessions
+
+a session is created per request - creating the SSLContext of the session loads the CA bundle (~20ms)
+the SSLContext is created once per process for each combination of verify setting, client certificate, http2 & TLS
+options
+"""
+
+import functools
+import os
+import ssl
+from typing import Any, Optional, Union
+
+import certifi
+import httpx
+
+
+CertTypes = Union[str, tuple[str], tuple[str, Optional[str]], tuple[str, Optional[str], Optional[str]]]
+
+
+@functools.lru_cache(maxsize=32)
+def _ssl_context(
+    verify: Union[bool, str],
+    cert: Optional[tuple[Optional[str], ...]],
+    env: tuple[Optional[str], Optional[str]],
+    http2: bool,
+    options: tuple[tuple[str, Any], ...],
+) -> ssl.SSLContext:
+    if verify is False:
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str):
+        if os.path.isdir(verify):
+            ctx = ssl.create_default_context(capath=verify)
+        else:
+            ctx = ssl.create_default_context(cafile=verify)
+    elif env[0]:
+        ctx = ssl.create_default_context(cafile=env[0])
+    elif env[1]:
+        ctx = ssl.create_default_context(capath=env[1])
+    else:
+        ctx = ssl.create_default_context(cafile=certifi.where())
+
+    if cert:
+        ctx.load_cert_chain(*cert)
+
+    # httpcore sets the ALPN protocols of the SSLContext for each connection - c.f. httpcore.HTTPConnection
+    ctx.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+
+    for name, value in options:
+        setattr(ctx, name, value)
+    return ctx
+
+
+def ssl_context(
+    verify: Union[bool, str] = True,
+    cert: Optional[CertTypes] = None,
+    trust_env: bool = True,
+    http2: bool = False,
+    **options: Any,
+) -> ssl.SSLContext:
+    """
+    the shared SSLContext - c.f. httpx.create_ssl_context
+
+    the SSLContext returned is shared, it must not be modified - http2 must match the http2 setting of the session
+
+    .. code:: python
+
+        def session_factory(*args, **kwargs) -> httpx.AsyncClient:
+            verify = ssl_context("/etc/ssl/my-ca.pem", kwargs.pop("cert", None), minimum_version=ssl.TLSVersion.TLSv1_3)
+            return httpx.AsyncClient(*args, verify=verify, **kwargs)
+
+    :param verify: verify the certificate of the server - or the CA file/directory to verify with
+    :param cert: the client certificate for mutualTLS - certfile or (certfile, keyfile[, password])
+    :param trust_env: use the CA file/directory from the environment - SSL_CERT_FILE/SSL_CERT_DIR
+    :param http2: the session uses http2 - the ALPN protocols of the SSLContext
+    :param options: attributes of the SSLContext to set, e.g. minimum_version
+    :return: the SSLContext
+    """
+    if isinstance(cert, str):
+        cert = (cert,)
+    elif cert is not None:
+        cert = tuple(cert)
+    env = (os.environ.get("SSL_CERT_FILE"), os.environ.get("SSL_CERT_DIR")) if trust_env else (None, None)
+    return _ssl_context(verify, cert or None, env, http2, tuple(sorted(options.items())))
+
+
+ssl_context.cache_clear = _ssl_context.cache_clear  # type: ignore[attr-defined]
+"""drop the SSLContexts cached - e.g. after renewing a client certificate"""
+
+
+def _shared(kwargs: dict[str, Any]) -> dict[str, Any]:
+    verify = kwargs.pop("verify", True)
+    if isinstance(verify, ssl.SSLContext):
+        return dict(verify=verify, **kwargs)
+    verify = ssl_context(verify, kwargs.pop("cert", None), kwargs.get("trust_env", True), kwargs.get("http2", False))
+    return dict(verify=verify, **kwargs)
+
+
+def Client(*args, **kwargs) -> httpx.Client:
+    """
+    httpx.Client using the shared SSLContext - the default session factory for httpx.Client
+    """
+    return httpx.Client(*args, **_shared(kwargs))
+
+
+def AsyncClient(*args, **kwargs) -> httpx.AsyncClient:
+    """
+    httpx.AsyncClient using the shared SSLContext - the default session factory for httpx.AsyncClient
+    """
+    return httpx.AsyncClient(*args, **_shared(kwargs))
+
+
+def session_factory(factory: Any) -> Any:
+    """
+    the session factory sharing the SSLContext for httpx.Client & httpx.AsyncClient, custom session factories unchanged
+    """
+    if factory is httpx.Client:
+        return Client
+    elif factory is httpx.AsyncClient:
+        return AsyncClient
+    return factory
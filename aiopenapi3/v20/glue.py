@@ -14,8 +14,9 @@ import httpx
 import pydantic
 
 from ..base import SchemaBase, ParameterBase, ReferenceBase
-from ..request import RequestBase, AsyncRequestBase
+from ..request import RequestBase, AsyncRequestBase, complete
 from ..errors import HTTPStatusError, ContentTypeError, ResponseSchemaError, ResponseDecodingError, HeadersMissingError
+from ..mediatype import parse_content_type
 
 
 from .parameter import Parameter
@@ -53,6 +54,52 @@ def in_not_body(x: Union["Parameter", "Reference"]) -> TypeGuard["Parameter"]:
     return in_not_body(x._target)
 
 
+class DispatchResponse:
+    """
+    a Response of an Operation precompiled for processing the responses received
+    """
+
+    __slots__ = ("response", "required", "headers")
+
+    def __init__(self, response: "v20ResponseType") -> None:
+        self.response: "v20ResponseType" = response
+        self.required: dict[str, "HeaderType"] = {name.lower(): header for name, header in response.headers.items()}
+        """
+        the required headers - lowercase names
+
+        Swagger 2.0 does not have optional header - all defined headers are required
+        https://github.com/OAI/OpenAPI-Specification/blob/main/versions/2.0.md#header-object
+        """
+        self.headers: list[tuple[str, "HeaderType", "Schema"]] = [
+            (name, header, header._schema) for name, header in response.headers.items()
+        ]
+        """the headers to decode - name, Header & Schema"""
+
+
+class Dispatch:
+    """
+    the Responses of an Operation precompiled for processing the responses received - cached per Operation
+    """
+
+    __slots__ = ("_responses", "_status", "produces")
+
+    def __init__(self, responses: dict[str, "v20ResponseType"], produces: Optional[list[str]]) -> None:
+        self._responses: dict[str, DispatchResponse] = {
+            code: DispatchResponse(response) for code, response in responses.items()
+        }
+        self._status: dict[str, Optional[DispatchResponse]] = dict()
+        self.produces: frozenset[str] = frozenset(parse_content_type(i).media_type for i in produces or [])
+        """the media types the Operation produces - lowercase, without parameters"""
+
+    def __getitem__(self, status_code: str) -> Optional[DispatchResponse]:
+        try:
+            return self._status[status_code]
+        except KeyError:
+            pass
+        r = self._status[status_code] = self._responses.get(status_code) or self._responses.get("default")
+        return r
+
+
 class Request(RequestBase):
     root: Root
 
@@ -94,7 +141,9 @@ class Request(RequestBase):
 
     def _prepare_security(self):
         security = self.operation.security if self.operation.security is not None else self.api._root.security
+        self._prepare_authorization(security)
 
+    def _prepare_security_requirements(self, security) -> None:
         if not security:
             return
 
@@ -216,7 +265,7 @@ class Request(RequestBase):
 
         self.req.url = self.req.url.format(**path_parameters)
 
-    def _prepare_body(self, data: Optional["RequestData"]):
+    async def _prepare_body(self, data: Optional["RequestData"]):
         try:
             required = self._data_parameter.required
         except ValueError:
@@ -233,13 +282,20 @@ class Request(RequestBase):
                 data = data.model_dump(mode="json")
             else:
                 raise TypeError(data)
-            data = self.api.plugins.message.marshalled(
-                request=self, operationId=self.operation.operationId, marshalled=data
+            data = (
+                await self._message(
+                    self.api.plugins.message.marshalled,
+                    request=self,
+                    operationId=self.operation.operationId,
+                    marshalled=data,
+                )
             ).marshalled
             data = json.dumps(data)
             data = data.encode()
-            data = self.api.plugins.message.sending(
-                request=self, operationId=self.operation.operationId, sending=data
+            data = (
+                await self._message(
+                    self.api.plugins.message.sending, request=self, operationId=self.operation.operationId, sending=data
+                )
             ).sending
             self.req.content = data
             self.req.headers["Content-Type"] = "application/json"
@@ -247,17 +303,26 @@ class Request(RequestBase):
             raise NotImplementedError(f"unsupported mime types {consumes}")
 
     def _prepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]):
+        complete(self._aprepare(data, parameters))
+
+    async def _aprepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]):
         self._prepare_security()
         self._prepare_parameters(parameters)
-        self._prepare_body(data)
+        await self._prepare_body(data)
 
-    def _process__status_code(self, result: httpx.Response, status_code: str) -> "v20ResponseType":
+    @property
+    def _dispatch(self) -> Dispatch:
+        """
+        the precompiled Responses of the Operation
+        """
+        if (r := self.api._dispatch.get(id(self.operation), None)) is None:
+            dispatch = Dispatch(self.operation.responses, self.operation.produces)
+            r = self.api._dispatch[id(self.operation)] = (self.operation, dispatch)
+        return r[1]
+
+    def _process__status_code(self, result: httpx.Response, status_code: str) -> DispatchResponse:
         # find the response model in spec we received
-        expected_response = None
-        if status_code in self.operation.responses:
-            expected_response = self.operation.responses[status_code]
-        elif "default" in self.operation.responses:
-            expected_response = self.operation.responses["default"]
+        expected_response = self._dispatch[status_code]
 
         if expected_response is None:
             options = ",".join(self.operation.responses.keys())
@@ -270,38 +335,36 @@ class Request(RequestBase):
         return expected_response
 
     def _process__headers(
-        self, result: httpx.Response, headers: dict[str, str], expected_response: "v20ResponseType"
+        self, result: httpx.Response, headers: dict[str, str], expected_response: DispatchResponse
     ) -> "ResponseHeadersType":
         rheaders = dict()
         if expected_response.headers:
-            required = dict(map(lambda x: (x[0].lower(), x[1]), expected_response.headers.items()))
-            """
-            Swagger 2.0 does not have optional header - all defined headers are required
-            https://github.com/OAI/OpenAPI-Specification/blob/main/versions/2.0.md#header-object
-            """
-            available = frozenset(result.headers.keys())
-            if missing := (required.keys() - available):
-                report: dict[str, "HeaderType"] = {k: required[k] for k in missing}
+            if missing := (expected_response.required.keys() - result.headers.keys()):
+                report: dict[str, "HeaderType"] = {k: expected_response.required[k] for k in missing}
                 raise HeadersMissingError(self.operation, report, result)
-            for name, header in expected_response.headers.items():
+            for name, header, schema_ in expected_response.headers:
                 data = headers.get(name, None)
                 if data:
-                    rheaders[name] = header._schema.model(header._decode(data))
+                    rheaders[name] = schema_.model(header._decode(data))
         return rheaders
 
     def _process_stream(self, result: httpx.Response) -> tuple["ResponseHeadersType", Optional["Schema"]]:
         status_code = str(result.status_code)
         expected_response = self._process__status_code(result, status_code)
         headers = self._process__headers(result, result.headers, expected_response)
-        return headers, expected_response.schema_
+        return headers, expected_response.response.schema_
 
     def _process_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
+        return complete(self._aprocess_request(result))
+
+    async def _aprocess_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
         rheaders: "ResponseHeadersType"
         # spec enforces these are strings
         status_code = str(result.status_code)
         content_type = result.headers.get("Content-Type", None)
 
-        ctx = self.api.plugins.message.received(
+        ctx = await self._message(
+            self.api.plugins.message.received,
             request=self,
             operationId=self.operation.operationId,
             received=result.content,
@@ -313,9 +376,10 @@ class Request(RequestBase):
         content_type = ctx.content_type
         headers = ctx.headers
 
-        expected_response = self._process__status_code(result, status_code)
+        dispatch = self._process__status_code(result, status_code)
+        expected_response = dispatch.response
 
-        rheaders = self._process__headers(result, headers, expected_response)
+        rheaders = self._process__headers(result, headers, dispatch)
 
         if expected_response.schema_ is None:
             """Swagger treats no schema as a response without a body."""
@@ -324,36 +388,68 @@ class Request(RequestBase):
         if status_code == "204":
             return rheaders, None
 
-        if content_type and content_type.lower().partition(";")[0] == "application/json":
+        media_type = parse_content_type(content_type).media_type if content_type else None
+
+        if media_type == "application/json":
             data = ctx.received.decode()
-            try:
-                data = json.loads(data)
-            except json.decoder.JSONDecodeError:
-                raise ResponseDecodingError(self.operation, data, result)
-
-            data = self.api.plugins.message.parsed(
-                request=self,
-                operationId=self.operation.operationId,
-                parsed=data,
-                expected_type=getattr(expected_response.schema_, "_target", expected_response.schema_),
-            ).parsed
-
-            if expected_response.schema_ is None:
-                raise ResponseSchemaError(self.operation, expected_response, None, result, None)
-
-            try:
-                data = expected_response.schema_.model(data)
-            except pydantic.ValidationError as e:
-                raise ResponseSchemaError(self.operation, expected_response, expected_response.schema_, result, e)
-
-            data = self.api.plugins.message.unmarshalled(
-                request=self, operationId=self.operation.operationId, unmarshalled=data
+            if not self.api.plugins.message.parsed.methods:
+                """
+                no plugin to modify the parsed data - parse & validate the JSON document in one step
+                """
+                backend = self.api.backend
+                try:
+                    data = self.api.validation[self.operation].model(
+                        expected_response.schema_,
+                        data,
+                        json=True,
+                        fields=self.vars.fields,
+                        plain=self.vars.plain,
+                        backend=backend,
+                    )
+                except backend.errors as e:
+                    if backend.invalid_json(e):
+                        raise ResponseDecodingError(self.operation, data, result)
+                    raise ResponseSchemaError(self.operation, expected_response, expected_response.schema_, result, e)
+            else:
+                try:
+                    data = json.loads(data)
+                except json.decoder.JSONDecodeError:
+                    raise ResponseDecodingError(self.operation, data, result)
+
+                data = (
+                    await self._message(
+                        self.api.plugins.message.parsed,
+                        request=self,
+                        operationId=self.operation.operationId,
+                        parsed=data,
+                        expected_type=getattr(expected_response.schema_, "_target", expected_response.schema_),
+                    )
+                ).parsed
+
+                if expected_response.schema_ is None:
+                    raise ResponseSchemaError(self.operation, expected_response, None, result, None)
+
+                backend = self.api.backend
+                try:
+                    data = self.api.validation[self.operation].model(
+                        expected_response.schema_, data, fields=self.vars.fields, plain=self.vars.plain, backend=backend
+                    )
+                except backend.errors as e:
+                    raise ResponseSchemaError(self.operation, expected_response, expected_response.schema_, result, e)
+
+            data = (
+                await self._message(
+                    self.api.plugins.message.unmarshalled,
+                    request=self,
+                    operationId=self.operation.operationId,
+                    unmarshalled=data,
+                )
             ).unmarshalled
 
             self._raise_on_http_status(int(status_code), rheaders, data)
 
             return rheaders, data
-        elif self.operation.produces and content_type in self.operation.produces:
+        elif media_type in self._dispatch.produces:
             self._raise_on_http_status(result.status_code, rheaders, ctx.received)
             return rheaders, ctx.received
         else:
@@ -1,55 +1,62 @@
 import io
 import enum
-from typing import Union, Optional, Any
+from typing import Union, Optional, Any, ClassVar
+from collections.abc import Callable
 
 from pydantic import Field
 
 from .general import Reference
 from .schemas import Schema
-from ..base import ObjectExtended, ObjectBase, ParameterBase
+from ..base import ObjectExtended, ObjectBase, ParameterBase, ParameterCodecBase
 from ..errors import ParameterFormatError
 
 
-class _ParameterCodec:
-    SEPERATOR_VALUES = {"csv": ",", "ssv": " ", "tsv": "\t", "pipes": "|"}
+class _ParameterCodec(ParameterCodecBase):
+    SEPERATOR_VALUES: ClassVar[dict[str, str]] = {"csv": ",", "ssv": " ", "tsv": "\t", "pipes": "|"}
     """
     Describing Parameters
 
     https://swagger.io/docs/specification/2-0/describing-parameters/
     """
 
-    def _encode__collection(self, values):
+    def _compile__collection(self) -> Callable[[Any], Any]:
         sep = self.SEPERATOR_VALUES.get(self.collectionFormat, None)
         if sep:
             if self.type == "array":
-                values = [self.items._encode(None, i) for i in values]
-            return sep.join(map(str, values))
+                items = self.items._encode
+                return lambda values: sep.join(map(str, [items(None, i) for i in values]))
+            return lambda values: sep.join(map(str, values))
         elif self.collectionFormat == "multi":
             # foo=value&foo=another_value
-            return values
+            return lambda values: values
         else:
             raise ParameterFormatError(self)
 
-    def _encode(self, name, value):
+    def _compile_encoder(self) -> Callable[[Optional[str], Any], Any]:
         if self.type == "array":
-            value = self._encode__collection(value)
-        elif self.in_ == "formData":
-            if self.type == "file":
+            collection = self._compile__collection()
+            return lambda name, value: {name: collection(value)}
+        elif getattr(self, "in_", None) == "formData" and self.type == "file":
+
+            def encoder(name, value):
                 # https://www.python-httpx.org/quickstart/#sending-multipart-file-uploads
                 # we expect (filename, data, content-type)
                 assert isinstance(value, tuple) and len(value) == 3 and isinstance(value[1], io.IOBase)
+                return {name: value}
+
+            return encoder
 
-        return {name: value}
+        return lambda name, value: {name: value}
 
-    def _decode(self, value):
+    def _compile_decoder(self) -> Callable[[str], Any]:
         if self.type == "array":
             sep = _ParameterCodec.SEPERATOR_VALUES.get(self.collectionFormat or "csv", None)
             if sep:
-                return value.split(sep)
+                return lambda value: value.split(sep)
             else:
                 raise ValueError(self.collectionFormat)
         else:
-            return value
+            return lambda value: value
 
 
 class Items(ObjectExtended, _ParameterCodec):
@@ -75,11 +82,12 @@ class Items(ObjectExtended, _ParameterCodec):
     enum: Optional[Any] = Field(default=None)
     multipleOf: Optional[int] = Field(default=None)
 
-    def _encode(self, name, value):
+    def _compile_encoder(self) -> Callable[[Optional[str], Any], Any]:
         if self.type == "array":
-            value = self._encode__collection(value)
+            collection = self._compile__collection()
+            return lambda name, value: collection(value)
 
-        return value
+        return lambda name, value: value
 
 
 class Empty(ObjectExtended):
@@ -2,10 +2,10 @@ import base64
 import quopri
 from typing import Union, TYPE_CHECKING
 from email.mime import multipart, nonmultipart
-from email.message import _unquotevalue, Message
 import collections
 
 from .parameter import encode_parameter
+from ..mediatype import parse_content_type
 
 
 if TYPE_CHECKING:
@@ -187,12 +187,7 @@ def encode_multipart_parameters(
 
 def decode_content_type(value: str) -> tuple[str, str, list[tuple[str, str]]]:
     """
-    msg = Message._get_params_preserve({"content-type": value}, header="content-type", failobj=None)
-    ct, *params = list(map(lambda x: (x[0], _unquotevalue(x[1])) if x[0].lower() == x[0] else x, msg))
+    c.f. :func:`aiopenapi3.mediatype.parse_content_type`
     """
-    m = Message()
-    m.add_header("content-type", value)
-    ct, *params = m.get_params()
-
-    type_, _, subtype = ct[0].partition("/")
-    return type_, subtype, params
+    ct = parse_content_type(value)
+    return ct.type, ct.subtype, list(ct.parameters)
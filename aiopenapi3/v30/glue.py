@@ -26,14 +26,16 @@ import pydantic
 
 import aiopenapi3.v30.media
 from ..base import SchemaBase, ParameterBase
-from ..request import RequestBase, AsyncRequestBase
+from ..request import RequestBase, AsyncRequestBase, complete
 from ..errors import HTTPStatusError, ContentTypeError, ResponseDecodingError, ResponseSchemaError, HeadersMissingError
 from .formdata import parameters_from_multipart, parameters_from_urlencoded, encode_multipart_parameters
 
-from .root import Root as v30Root
-from ..v31.root import Root as v31Root
+from ..lazy import loaded
+from ..mediatype import parse_content_type
 
 if TYPE_CHECKING:
+    from .root import Root as v30Root
+    from ..v31.root import Root as v31Root
     from .._types import (
         SchemaType,
         RequestParameters,
@@ -47,13 +49,91 @@ if TYPE_CHECKING:
 
     from .paths import Response as v30Response, MediaType as v30MediaType
     from ..v31.paths import Response as v31Response, MediaType as v31MediaType
+    from .parameter import Header as v30Header
+    from ..v31.parameter import Header as v31Header
 
     v3xResponseType = Union[v30Response, v31Response]
     v3xMediaTypeType = Union[v30MediaType, v31MediaType]
+    v3xHeaderType = Union[v30Header, v31Header]
+
+
+class DispatchResponse:
+    """
+    a Response of an Operation precompiled for processing the responses received
+    """
+
+    __slots__ = ("response", "required", "headers", "_content", "_media")
+
+    def __init__(self, response: "v3xResponseType") -> None:
+        self.response: "v3xResponseType" = response
+        self.required: dict[str, "v3xHeaderType"] = {
+            name.lower(): header for name, header in response.headers.items() if header.required is True
+        }
+        """the required headers - lowercase names"""
+        self.headers: list[tuple[str, "v3xHeaderType", "SchemaType"]] = [
+            (name, header, header.schema_) for name, header in response.headers.items()
+        ]
+        """the headers to decode - name, Header & Schema"""
+        self._content: dict[str, "v3xMediaTypeType"] = dict()
+        """the MediaTypes by media type (range) - lowercase, without parameters"""
+        for key, media in response.content.items():
+            self._content.setdefault(parse_content_type(key).media_type, media)
+        self._media: dict[str, Optional[tuple["v3xMediaTypeType", Optional["SchemaType"]]]] = dict()
+        """the MediaType & the expected type per content type received"""
+
+    def media(self, content_type: str) -> Optional[tuple["v3xMediaTypeType", Optional["SchemaType"]]]:
+        """
+        the MediaType for the content type - c.f. media-range https://datatracker.ietf.org/doc/html/rfc7231#appendix-D
+
+        :param content_type: the media type received - c.f. :class:`aiopenapi3.mediatype.ContentType`
+        :return: the MediaType and the Schema of the MediaType
+        """
+        try:
+            return self._media[content_type]
+        except KeyError:
+            pass
+        content = self._content
+        media: Optional["v3xMediaTypeType"] = (
+            content.get(content_type, None)
+            or content.get(content_type.partition("/")[0] + "/*", None)
+            or content.get("*/*", None)
+        )
+        r = self._media[content_type] = (
+            None if media is None else (media, getattr(media.schema_, "_target", media.schema_))
+        )
+        return r
+
+
+class Dispatch:
+    """
+    the Responses of an Operation precompiled for processing the responses received - cached per Operation
+
+    a status code is resolved to the Response once, falling back to the range (e.g. 2XX) and the default Response
+    """
+
+    __slots__ = ("_responses", "_status")
+
+    def __init__(self, responses: dict[str, "v3xResponseType"]) -> None:
+        self._responses: dict[str, DispatchResponse] = {
+            code: DispatchResponse(response) for code, response in responses.items()
+        }
+        self._status: dict[str, Optional[DispatchResponse]] = dict()
+
+    def __getitem__(self, status_code: str) -> Optional[DispatchResponse]:
+        try:
+            return self._status[status_code]
+        except KeyError:
+            pass
+        r = self._status[status_code] = (
+            self._responses.get(status_code)
+            or self._responses.get(status_code[0] + "XX")
+            or self._responses.get("default")
+        )
+        return r
 
 
 class Request(RequestBase):
-    root: Union[v30Root, v31Root]
+    root: Union["v30Root", "v31Root"]
 
     @property
     def security(self):
@@ -95,7 +175,9 @@ class Request(RequestBase):
 
     def _prepare_security(self) -> None:
         security = self.operation.security if self.operation.security is not None else self.api._root.security
+        self._prepare_authorization(security)
 
+    def _prepare_security_requirements(self, security) -> None:
         if not security:
             return
 
@@ -143,10 +225,8 @@ class Request(RequestBase):
             and self.root.components.securitySchemes[scheme].root
         )
         ss = self.root.components.securitySchemes[scheme].root
-        from .. import v30, v31
-
         if ss.type == "http":
-            assert isinstance(ss, (v30.security._SecuritySchemes.http, v31.security._SecuritySchemes.http))
+            assert isinstance(ss, loaded("v30.security._SecuritySchemes.http", "v31.security._SecuritySchemes.http"))
             if ss.scheme_ == "basic":
                 self.req.auth = httpx.BasicAuth(*value)
             elif ss.scheme_ == "digest":
@@ -162,7 +242,9 @@ class Request(RequestBase):
         value = cast(str, value)
 
         if ss.type == "apiKey":
-            assert isinstance(ss, (v30.security._SecuritySchemes.apiKey, v31.security._SecuritySchemes.apiKey))
+            assert isinstance(
+                ss, loaded("v30.security._SecuritySchemes.apiKey", "v31.security._SecuritySchemes.apiKey")
+            )
             if ss.in_ == "query":
                 # apiKey in query parameter
                 self.req.params[ss.name] = value
@@ -184,10 +266,10 @@ class Request(RequestBase):
         ss = self.root.components.securitySchemes[scheme].root
         auths = []
 
-        from .. import v30, v31
-
         if ss.type == "oauth2":
-            assert isinstance(ss, (v30.security._SecuritySchemes.oauth2, v31.security._SecuritySchemes.oauth2))
+            assert isinstance(
+                ss, loaded("v30.security._SecuritySchemes.oauth2", "v31.security._SecuritySchemes.oauth2")
+            )
             # NOTE: refresh_url is not currently supported by httpx_auth
             # REF: https://github.com/Colin-b/httpx_auth/issues/17
             if flow := ss.flows.implicit:
@@ -229,7 +311,7 @@ class Request(RequestBase):
                 )
 
         if ss.type == "http":
-            assert isinstance(ss, (v30.security._SecuritySchemes.http, v31.security._SecuritySchemes.http))
+            assert isinstance(ss, loaded("v30.security._SecuritySchemes.http", "v31.security._SecuritySchemes.http"))
             if auth := HTTPX_AUTH_METHODS.get(ss.scheme_, None):
                 if isinstance(value, tuple):
                     auths.append(auth(*value))
@@ -246,7 +328,9 @@ class Request(RequestBase):
         value = cast(str, value)
 
         if ss.type == "apiKey":
-            assert isinstance(ss, (v30.security._SecuritySchemes.apiKey, v31.security._SecuritySchemes.apiKey))
+            assert isinstance(
+                ss, loaded("v30.security._SecuritySchemes.apiKey", "v31.security._SecuritySchemes.apiKey")
+            )
             if auth := HTTPX_AUTH_METHODS.get((ss.in_ + ss.type).lower(), None):
                 auths.append(auth(value, ss.name))
 
@@ -271,9 +355,7 @@ class Request(RequestBase):
         provided = provided or dict()
         possible = {_.name: _ for _ in self.operation.parameters + self.root.paths[self.path].parameters}
 
-        from .. import v30, v31
-
-        assert isinstance(self.operation, (v30.Operation, v31.Operation))
+        assert isinstance(self.operation, loaded("v30.Operation", "v31.Operation"))
 
         if self.operation.requestBody:
             rbq: dict[str, str] = dict()  # requestBody Parameters
@@ -317,7 +399,7 @@ class Request(RequestBase):
             values = spec._encode(name, value)
             assert isinstance(values, dict)
 
-            if isinstance(spec, (v30.parameter.Header, v31.parameter.Header)):
+            if isinstance(spec, loaded("v30.parameter.Header", "v31.parameter.Header")):
                 rbqh.update(values)
             elif spec.in_ == "header":
                 self.req.headers.update(values)
@@ -334,13 +416,12 @@ class Request(RequestBase):
         self.req.url = self.req.url.format(**path_parameters)
         return rbqh
 
-    def _prepare_body(self, data_: Optional["RequestData"], rbq: dict[str, str]) -> None:
-        from .. import v30, v31
-
-        assert isinstance(self.operation, (v30.Operation, v31.Operation))
+    async def _prepare_body(self, data_: Optional["RequestData"], rbq: dict[str, str]) -> None:
+        assert isinstance(self.operation, loaded("v30.Operation", "v31.Operation"))
 
         if not self.operation.requestBody:
-            ctx = self.api.plugins.message.sending(
+            ctx = await self._message(
+                self.api.plugins.message.sending,
                 request=self,
                 operationId=self.operation.operationId,
                 sending=None,
@@ -362,13 +443,19 @@ class Request(RequestBase):
                 data = data_.model_dump(mode="json")
             else:
                 raise TypeError(data_)
-            data = self.api.plugins.message.marshalled(
-                request=self, operationId=self.operation.operationId, marshalled=data
+            data = (
+                await self._message(
+                    self.api.plugins.message.marshalled,
+                    request=self,
+                    operationId=self.operation.operationId,
+                    marshalled=data,
+                )
             ).marshalled
             data: str = json.dumps(data)
             data: bytes = data.encode()  # type: ignore[union-attr]
             self.req.headers["Content-Type"] = "application/json"
-            ctx = self.api.plugins.message.sending(
+            ctx = await self._message(
+                self.api.plugins.message.sending,
                 request=self,
                 operationId=self.operation.operationId,
                 sending=data,
@@ -425,7 +512,8 @@ class Request(RequestBase):
                 raise TypeError((type(data_), media.schema_.get_type()))
 
             # sending is unset here
-            ctx = self.api.plugins.message.sending(
+            ctx = await self._message(
+                self.api.plugins.message.sending,
                 request=self,
                 operationId=self.operation.operationId,
                 sending=None,
@@ -447,7 +535,8 @@ class Request(RequestBase):
             content = urllib.parse.urlencode(params, doseq=True)
             self.req.content = content
 
-            ctx = self.api.plugins.message.sending(
+            ctx = await self._message(
+                self.api.plugins.message.sending,
                 request=self,
                 operationId=self.operation.operationId,
                 sending=self.req.content,
@@ -469,7 +558,8 @@ class Request(RequestBase):
             else:
                 raise TypeError(data_)
 
-            ctx = self.api.plugins.message.sending(
+            ctx = await self._message(
+                self.api.plugins.message.sending,
                 request=self,
                 operationId=self.operation.operationId,
                 sending=self.req.content,
@@ -484,16 +574,24 @@ class Request(RequestBase):
             raise NotImplementedError(self.operation.requestBody.content)
 
     def _prepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]) -> None:
+        complete(self._aprepare(data, parameters))
+
+    async def _aprepare(self, data: Optional["RequestData"], parameters: Optional["RequestParameters"]) -> None:
         self._prepare_security()
         rbq = self._prepare_parameters(parameters)
-        self._prepare_body(data, rbq)
+        await self._prepare_body(data, rbq)
 
-    def _process__status_code(self, result: httpx.Response, status_code: str) -> "v3xResponseType":
-        expected_response = (
-            self.operation.responses.get(status_code)
-            or self.operation.responses.get(status_code[0] + "XX")
-            or self.operation.responses.get("default")
-        )
+    @property
+    def _dispatch(self) -> Dispatch:
+        """
+        the precompiled Responses of the Operation
+        """
+        if (r := self.api._dispatch.get(id(self.operation), None)) is None:
+            r = self.api._dispatch[id(self.operation)] = (self.operation, Dispatch(self.operation.responses))
+        return r[1]
+
+    def _process__status_code(self, result: httpx.Response, status_code: str) -> DispatchResponse:
+        expected_response = self._dispatch[status_code]
         if expected_response is None:
             options = ",".join(self.operation.responses.keys())
             raise HTTPStatusError(
@@ -506,30 +604,23 @@ class Request(RequestBase):
         return expected_response
 
     def _process__headers(
-        self, result: httpx.Response, headers: dict[str, str], expected_response: "v3xResponseType"
+        self, result: httpx.Response, headers: dict[str, str], expected_response: DispatchResponse
     ) -> "ResponseHeadersType":
         rheaders = dict()
         if expected_response.headers:
-            required = dict(
-                map(
-                    lambda x: (x[0].lower(), x[1]),
-                    filter(lambda x: x[1].required is True, expected_response.headers.items()),
-                )
-            )
-            available = frozenset(headers.keys())
-            if missing := (required.keys() - available):
-                missed = {k: required[k] for k in missing}
+            if missing := (expected_response.required.keys() - headers.keys()):
+                missed = {k: expected_response.required[k] for k in missing}
                 raise HeadersMissingError(self.operation, missed, result)
-            for name, header in expected_response.headers.items():
+            for name, header, schema_ in expected_response.headers:
                 data = headers.get(name, None)
                 if data:
-                    assert header.schema_ is not None
-                    rheaders[name] = header.schema_.model(header._decode(data))
+                    assert schema_ is not None
+                    rheaders[name] = schema_.model(header._decode(data))
         return rheaders
 
     def _process__content_type(
-        self, result: httpx.Response, expected_response: "v3xResponseType", content_type: Optional[str]
-    ) -> tuple[str, "v3xMediaTypeType"]:
+        self, result: httpx.Response, expected_response: DispatchResponse, content_type: Optional[str]
+    ) -> tuple[str, "v3xMediaTypeType", Optional["SchemaType"]]:
         if content_type:
             """
             https://github.com/OAI/OpenAPI-Specification/blob/main/versions/3.0.3.md#response-object
@@ -537,17 +628,13 @@ class Request(RequestBase):
             https://datatracker.ietf.org/doc/html/rfc7231#appendix-D
             media-range = ( "*/*" / ( type "/*" ) / ( type "/" subtype ) ) *( OWS ";" OWS parameter )
             """
-            content_type, _, encoding = content_type.partition(";")
-            expected_media: Optional["v3xMediaTypeType"] = (
-                expected_response.content.get(content_type, None)
-                or expected_response.content.get(content_type.partition("/")[0] + "/*", None)
-                or expected_response.content.get("*/*", None)
-            )
+            content_type = parse_content_type(content_type).media_type
+            expected = expected_response.media(content_type)
         else:
-            expected_media = None
+            expected = None
 
-        if expected_media is None:
-            options = ",".join(expected_response.content.keys())
+        if expected is None:
+            options = ",".join(expected_response.response.content.keys())
             raise ContentTypeError(
                 self.operation,
                 content_type,
@@ -556,26 +643,30 @@ class Request(RequestBase):
                 result,
             )
         assert content_type is not None
-        return content_type, expected_media
+        return content_type, *expected
 
     def _process_stream(self, result: httpx.Response) -> tuple["ResponseHeadersType", Optional["SchemaType"]]:
         status_code = str(result.status_code)
         content_type = result.headers.get("Content-Type", None)
 
         expected_response = self._process__status_code(result, status_code)
-        content_type, expected_media = self._process__content_type(result, expected_response, content_type)
+        content_type, expected_media, _ = self._process__content_type(result, expected_response, content_type)
 
         headers = self._process__headers(result, result.headers, expected_response)
 
         return headers, expected_media.schema_
 
     def _process_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
+        return complete(self._aprocess_request(result))
+
+    async def _aprocess_request(self, result: httpx.Response) -> tuple["ResponseHeadersType", "ResponseDataType"]:
         rheaders = dict()
         # spec enforces these are strings
         status_code = str(result.status_code)
         content_type = result.headers.get("Content-Type", None)
 
-        ctx = self.api.plugins.message.received(
+        ctx = await self._message(
+            self.api.plugins.message.received,
             request=self,
             operationId=self.operation.operationId,
             received=result.content,
@@ -592,41 +683,65 @@ class Request(RequestBase):
         rheaders = self._process__headers(result, headers, expected_response)
 
         # status_code == 204 should match here
-        if len(expected_response.content) == 0:
+        if len(expected_response.response.content) == 0:
             return rheaders, None
 
-        content_type, expected_media = self._process__content_type(result, expected_response, content_type)
+        content_type, expected_media, expected_type = self._process__content_type(
+            result, expected_response, content_type
+        )
 
-        if content_type.lower() == "application/json":
+        if content_type == "application/json":
             data = ctx.received
-            expected_type = getattr(expected_media.schema_, "_target", expected_media.schema_)
-
-            try:
-                data = json.loads(data)
-            except json.decoder.JSONDecodeError:
-                raise ResponseDecodingError(self.operation, data, result)
-            ctx = self.api.plugins.message.parsed(
-                request=self,
-                operationId=self.operation.operationId,
-                headers=headers,
-                parsed=data,
-                expected_type=expected_type,
-                status_code=status_code,
-            )
 
-            data = ctx.parsed
-            expected_type = ctx.expected_type
+            if expected_type is not None and not self.api.plugins.message.parsed.methods:
+                """
+                no plugin to modify the parsed data - parse & validate the JSON document in one step
+                """
+                backend = self.api.backend
+                try:
+                    data = self.api.validation[self.operation].model(
+                        expected_type, data, json=True, fields=self.vars.fields, plain=self.vars.plain, backend=backend
+                    )
+                except backend.errors as e:
+                    if backend.invalid_json(e):
+                        raise ResponseDecodingError(self.operation, data, result)
+                    raise ResponseSchemaError(self.operation, expected_media, expected_type, result, e)
+            else:
+                try:
+                    data = json.loads(data)
+                except json.decoder.JSONDecodeError:
+                    raise ResponseDecodingError(self.operation, data, result)
+                ctx = await self._message(
+                    self.api.plugins.message.parsed,
+                    request=self,
+                    operationId=self.operation.operationId,
+                    headers=headers,
+                    parsed=data,
+                    expected_type=expected_type,
+                    status_code=status_code,
+                )
 
-            if expected_type is None:
-                raise ResponseSchemaError(self.operation, expected_media, expected_type, result, None)
+                data = ctx.parsed
+                expected_type = ctx.expected_type
 
-            try:
-                data = expected_type.model(data)
-            except pydantic.ValidationError as e:
-                raise ResponseSchemaError(self.operation, expected_media, expected_type, result, e)
+                if expected_type is None:
+                    raise ResponseSchemaError(self.operation, expected_media, expected_type, result, None)
 
-            data = self.api.plugins.message.unmarshalled(
-                request=self, operationId=self.operation.operationId, unmarshalled=data
+                backend = self.api.backend
+                try:
+                    data = self.api.validation[self.operation].model(
+                        expected_type, data, fields=self.vars.fields, plain=self.vars.plain, backend=backend
+                    )
+                except backend.errors as e:
+                    raise ResponseSchemaError(self.operation, expected_media, expected_type, result, e)
+
+            data = (
+                await self._message(
+                    self.api.plugins.message.unmarshalled,
+                    request=self,
+                    operationId=self.operation.operationId,
+                    unmarshalled=data,
+                )
             ).unmarshalled
 
             self._raise_on_http_status(int(status_code), rheaders, data)
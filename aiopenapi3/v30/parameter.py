@@ -5,25 +5,52 @@ import typing
 import uuid
 import json
 from typing import Union, Optional, Any
-from collections.abc import MutableMapping
+from collections.abc import Callable, MutableMapping
 
 from pydantic import BaseModel, Field, model_validator
 import more_itertools
 
-from ..base import ObjectExtended, ParameterBase as ParameterBase_, ReferenceBase
+from ..base import ObjectExtended, ParameterBase as ParameterBase_, ParameterCodecBase, ReferenceBase
 from ..errors import ParameterFormatError
 
 from .example import Example
 from .general import Reference
 from .schemas import Schema
-from ..model import TYPES_SCHEMA_MAP
+from ..model import Model, TYPES_SCHEMA_MAP
 
 if typing.TYPE_CHECKING:
     from .paths import MediaType
     from .._types import v3xSchemaType
 
 
-class _ParameterCodec:
+_PRIMITIVE_TYPES = {"string": str, "integer": int, "number": float, "boolean": bool}
+"""the Python type of values of primitive types which are encoded without validation"""
+
+_ANNOTATIONS = frozenset(
+    [
+        "type",
+        "nullable",
+        "title",
+        "description",
+        "default",
+        "example",
+        "examples",
+        "deprecated",
+        "readOnly",
+        "writeOnly",
+        "externalDocs",
+        "xml",
+        "extensions",
+    ]
+)
+"""the properties of a Schema which do not constrain the values"""
+
+
+class _ParameterCodec(ParameterCodecBase):
+    """
+    the codecs are compiled for the location, style, explode & the Schema of the Parameter
+    """
+
     def _codec(self):
         if self.in_ == "path":
             style = self.style or "simple"
@@ -50,11 +77,41 @@ class _ParameterCodec:
 
         return schema, style, explode
 
-    def _encode(self, name: str, value):
+    def _compile_encoder(self) -> Callable[[str, Any], dict[str, Any]]:
+        """
+        values of primitive types are encoded without validation if the Schema does not constrain the values
+        """
         schema, style, explode = self._codec()
-        value = schema.model(value)
+        encode = getattr(self, f"_encode__{style}")
+
+        primitive: Optional[type] = None
+        if (
+            len(types := [i for i in Model.types(schema) if i != "null"]) == 1
+            and (primitive := _PRIMITIVE_TYPES.get(type_ := types[0], None)) is not None
+            and not (schema.model_fields_set - _ANNOTATIONS)
+        ):
+
+            def encoder(name: str, value):
+                if type(value) is primitive:
+                    return encode(name, type_, value, schema, explode)
+                value = schema.model(value)
+                return encode(name, self._type(value), value, schema, explode)
+
+        else:
+
+            def encoder(name: str, value):
+                value = schema.model(value)
+                return encode(name, self._type(value), value, schema, explode)
+
+        return encoder
+
+    @staticmethod
+    def _type(value) -> str:
+        """
+        the type of the validated value
+        """
         if isinstance(value, BaseModel):
-            type_ = "object"
+            return "object"
         elif (t := type(value)) in (
             bytes,
             datetime.datetime,
@@ -63,18 +120,12 @@ class _ParameterCodec:
             datetime.timedelta,
             uuid.UUID,
         ):
-            type_ = "string"
+            return "string"
         elif t in TYPES_SCHEMA_MAP:
-            type_ = TYPES_SCHEMA_MAP[t]
+            return TYPES_SCHEMA_MAP[t]
         else:
             raise TypeError(f"Unsupported type {t}")
 
-        return self._encode_value(name, type_, value, schema, explode, style)
-
-    def _encode_value(self, name: str, type_: str, value, schema: "v3xSchemaType", explode: bool, style: str):
-        f = getattr(self, f"_encode__{style}")
-        return f(name, type_, value, schema, explode)
-
     def _encode__matrix(self, name: str, type_: str, value, schema: "v3xSchemaType", explode: bool):
         """
         3.2.7.  Path-Style Parameter Expansion: {;var}
@@ -260,26 +311,29 @@ class _ParameterCodec:
         values = {k: v for k, v in flatten_dict(values, name).items()}
         return values
 
-    def _decode(self, value):
+    def _compile_decoder(self) -> Callable[[str], Any]:
         schema, style, explode = self._codec()
         if style == "simple":
-            return self._decode_simple(value, schema, explode)
+            return self._decode_simple(schema, explode)
         else:
             raise ValueError(f"style {style} can not be decoded")
 
-    def _decode_simple(self, value, schema: "v3xSchemaType", explode: bool):
+    @staticmethod
+    def _decode_simple(schema: "v3xSchemaType", explode: bool) -> Callable[[str], Any]:
         if schema.type == "array":
-            return value.split(",")
+            return lambda value: value.split(",")
         elif schema.type == "object":
             if explode is False:
                 # R,100,G,200,B,150
-                return dict(more_itertools.chunked(value.split(","), 2))
+                return lambda value: dict(more_itertools.chunked(value.split(","), 2))
             else:
                 # R=100,G=200,B=150
-                return dict(map(lambda y: (y[0], y[2]), map(lambda x: x.partition("="), value.split(","))))
+                return lambda value: dict(
+                    map(lambda y: (y[0], y[2]), map(lambda x: x.partition("="), value.split(",")))
+                )
         else:
             # convert basic type
-            return value
+            return lambda value: value
 
 
 class ParameterBase(ObjectExtended, ParameterBase_):
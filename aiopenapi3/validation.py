@@ -0,0 +1,148 @@
+"""
+the validation policy for the data of responses
+
+  * full - validate each response (default)
+  * trusted - create the models without checking the constraints (pattern, minLength, maximum …)
+  * sampled - validate 1 in sample responses, create the models of the others without checking the constraints
+
+for upstreams which are trusted, checking the constraints of each response is not required
+"""
+
+import dataclasses
+import functools
+import logging
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
+from collections.abc import Sequence
+
+from .backend import Backend, PydanticBackend
+
+if TYPE_CHECKING:
+    from ._types import SchemaType, OperationType
+
+
+log = logging.getLogger("aiopenapi3.validation")
+
+_PYDANTIC = PydanticBackend()
+
+EXTENSION = "aiopenapi3-validation"
+"""
+the specification extension to configure the policy of an Operation
+
+  x-aiopenapi3-validation: trusted
+
+  x-aiopenapi3-validation:
+    mode: sampled
+    sample: 1000
+"""
+
+
+@dataclasses.dataclass
+class ValidationPolicy:
+    mode: Literal["full", "trusted", "sampled"] = "full"
+    """the validation mode"""
+    sample: int = 100
+    """sampled - validate 1 in sample responses"""
+
+    validated: int = 0
+    """the number of responses validated"""
+    trusted: int = 0
+    """the number of responses created without checking the constraints"""
+    violations: int = 0
+    """the number of sampled responses which failed validation"""
+
+    _count: int = dataclasses.field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.mode not in ("full", "trusted", "sampled"):
+            raise ValueError(f"validation mode {self.mode}")
+        if self.sample < 1:
+            raise ValueError(f"validation sample {self.sample}")
+
+    @classmethod
+    def from_extension(cls, value: Union[str, dict[str, Any]]) -> "ValidationPolicy":
+        if isinstance(value, str):
+            return cls(mode=value)  # type: ignore[arg-type]
+        return cls(**value)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """
+        the ratio of responses validated
+        """
+        if (total := self.validated + self.trusted) == 0:
+            return None
+        return self.validated / total
+
+    def _sampled(self) -> bool:
+        r = self._count % self.sample == 0
+        self._count += 1
+        return r
+
+    def model(
+        self,
+        schema: "SchemaType",
+        data: Any,
+        json: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        plain: bool = False,
+        backend: Optional[Backend] = None,
+    ) -> Any:
+        """
+        create the model for the data of a response according to the policy
+
+        :param schema: the Schema of the response
+        :param data: the data - or the JSON document if json
+        :param json: data is a JSON document
+        :param fields: the paths of the properties selected - c.f. :meth:`aiopenapi3.base.SchemaBase.model`
+        :param plain: plain dicts & lists instead of models
+        :param backend: the backend creating the data, defaults to pydantic
+        """
+        if backend is None:
+            backend = _PYDANTIC
+        validate = functools.partial(backend.model, schema, json=json, fields=fields, plain=plain)
+        if self.mode == "full" or (self.mode == "sampled" and self._sampled()):
+            try:
+                r = validate(data)
+                self.validated += 1
+                return r
+            except backend.errors as e:
+                if self.mode == "full" or backend.invalid_json(e):
+                    raise
+                self.violations += 1
+                log.warning("sampled response violates the schema %s\n%s", schema._get_identity(), e)
+        r = validate(data, trusted=True)
+        self.trusted += 1
+        return r
+
+
+class ValidationPolicies:
+    """
+    the validation policies of the Operations of an OpenAPI description document
+    """
+
+    def __init__(self) -> None:
+        self.default: ValidationPolicy = ValidationPolicy()
+        """
+        the policy for Operations without policy
+        """
+
+        self.operations: dict[str, ValidationPolicy] = dict()
+        """
+        the policy of an Operation by operationId - precedes the specification extension
+        """
+
+        self._extensions: dict[int, tuple["OperationType", Optional[ValidationPolicy]]] = dict()
+
+    def __getitem__(self, operation: "OperationType") -> ValidationPolicy:
+        if operation.operationId is not None and (r := self.operations.get(operation.operationId, None)) is not None:
+            return r
+        if (e := self._extensions.get(id(operation), None)) is None:
+            value = (operation.extensions or dict()).get(EXTENSION, None)
+            e = self._extensions[id(operation)] = (
+                operation,
+                ValidationPolicy.from_extension(value) if value is not None else None,
+            )
+        return e[1] or self.default
+
+    def __getstate__(self):
+        return {"default": self.default, "operations": self.operations, "_extensions": dict()}
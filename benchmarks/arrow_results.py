@@ -0,0 +1,84 @@
+"""
+decoding & validating JSON documents of arrays of objects - the pydantic models compared to Arrow tables
+
+reports the time to decode & validate a response of items as list of models and as Arrow table
+
+    pip install aiopenapi3[arrow]
+    python benchmarks/arrow_results.py [items] [repeat]
+"""
+
+import json
+import sys
+import time
+
+from aiopenapi3 import OpenAPI
+from aiopenapi3.arrow import Columnar
+
+
+def document() -> dict:
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "arrow results", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Item": {
+                    "type": "object",
+                    "required": ["id", "name", "status"],
+                    "properties": {
+                        "id": {"type": "integer", "minimum": 1},
+                        "created": {"type": "string", "format": "date-time"},
+                        "name": {"type": "string", "maxLength": 64},
+                        "status": {"type": "string", "enum": ["available", "pending", "sold"]},
+                        "price": {"type": "number", "nullable": True},
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                    },
+                },
+                "Items": {"type": "array", "items": {"$ref": "#/components/schemas/Item"}},
+            }
+        },
+    }
+
+
+def items(n: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": i + 1,
+                "created": "2024-01-01T00:00:00Z",
+                "name": f"item {i}",
+                "status": ("available", "pending", "sold")[i % 3],
+                "price": None if i % 5 == 0 else i * 1.5,
+                "tags": ["a", "b"],
+            }
+            for i in range(n)
+        ]
+    ).encode()
+
+
+def measure(name: str, n: int, repeat: int, f) -> None:
+    f()
+    r = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        f()
+        r.append(time.perf_counter() - begin)
+    print(f"{name:10s} {n} items {min(r) * 1000:10.1f} ms")
+
+
+def main(n: int = 100000, repeat: int = 10) -> None:
+    api = OpenAPI("/", document())
+    schema = api.components.schemas["Items"]
+    data = items(n)
+    columnar = Columnar(schema)
+
+    def arrow():
+        columnar.validate(batch := columnar.read(data))
+        return batch
+
+    measure("pydantic", n, repeat, lambda: schema.model_json(data))
+    measure("arrow", n, repeat, arrow)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
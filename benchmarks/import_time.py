@@ -0,0 +1,55 @@
+"""
+import time of aiopenapi3
+
+measures the time to import aiopenapi3 in a fresh interpreter,
+importing aiopenapi3 and parsing a description document of each version
+and lists the modules which take the longest to import (python -X importtime)
+
+    python benchmarks/import_time.py
+"""
+
+import subprocess
+import sys
+import time
+
+STATEMENTS = {
+    "import aiopenapi3": "import aiopenapi3",
+    "… + swagger 2.0": "import aiopenapi3; aiopenapi3.OpenAPI._parse_obj({'swagger':'2.0','info':{'title':'','version':''},'paths':{}})",
+    "… + openapi 3.0": "import aiopenapi3; aiopenapi3.OpenAPI._parse_obj({'openapi':'3.0.3','info':{'title':'','version':''},'paths':{}})",
+    "… + openapi 3.1": "import aiopenapi3; aiopenapi3.OpenAPI._parse_obj({'openapi':'3.1.0','info':{'title':'','version':''},'paths':{}})",
+}
+
+
+def measure(statement: str, repeat: int = 5) -> float:
+    r = []
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        r.append(time.perf_counter() - begin)
+    return min(r)
+
+
+def importtime(limit: int = 15) -> list[tuple[int, int, str]]:
+    p = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import aiopenapi3"], check=True, capture_output=True, text=True
+    )
+    r = []
+    for line in p.stderr.splitlines()[1:]:
+        own, cumulative, name = line.split(":", maxsplit=1)[1].split("|")
+        r.append((int(own), int(cumulative), name.rstrip()))
+    return sorted(r, key=lambda x: x[1], reverse=True)[:limit]
+
+
+def main() -> None:
+    floor = measure("pass")
+    print(f"{'python (floor)':24s} {floor * 1000:8.1f} ms")
+    for name, statement in STATEMENTS.items():
+        print(f"{name:24s} {measure(statement) * 1000:8.1f} ms")
+
+    print("\ncumulative import time (µs)")
+    for own, cumulative, name in importtime():
+        print(f"{cumulative:10d} {own:10d} {name}")
+
+
+if __name__ == "__main__":
+    main()
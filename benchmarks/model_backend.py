@@ -0,0 +1,107 @@
+"""
+decoding & validating JSON documents - the pydantic models compared to the msgspec backend
+
+creates a description document with objects, arrays, enums, nullable properties, allOf and a discriminated union
+and reports the time to decode & validate a response of items using each backend
+
+    pip install aiopenapi3[msgspec]
+    python benchmarks/model_backend.py [items] [repeat]
+"""
+
+import json
+import sys
+import time
+
+from aiopenapi3 import OpenAPI
+from aiopenapi3.backend import MsgspecBackend, PydanticBackend
+
+
+def document() -> dict:
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "model backend", "version": "1.0.0"},
+        "paths": {},
+        "components": {
+            "schemas": {
+                "Status": {"type": "string", "enum": ["available", "pending", "sold"]},
+                "Base": {
+                    "type": "object",
+                    "required": ["id"],
+                    "properties": {
+                        "id": {"type": "integer", "minimum": 1},
+                        "created": {"type": "string", "format": "date-time"},
+                    },
+                },
+                "Cat": {
+                    "type": "object",
+                    "required": ["petType"],
+                    "properties": {"petType": {"type": "string", "enum": ["cat"]}, "lives": {"type": "integer"}},
+                },
+                "Dog": {
+                    "type": "object",
+                    "required": ["petType"],
+                    "properties": {"petType": {"type": "string", "enum": ["dog"]}, "bark": {"type": "boolean"}},
+                },
+                "Pet": {
+                    "oneOf": [{"$ref": "#/components/schemas/Cat"}, {"$ref": "#/components/schemas/Dog"}],
+                    "discriminator": {
+                        "propertyName": "petType",
+                        "mapping": {"cat": "#/components/schemas/Cat", "dog": "#/components/schemas/Dog"},
+                    },
+                },
+                "Item": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Base"},
+                        {
+                            "type": "object",
+                            "required": ["name", "status"],
+                            "properties": {
+                                "name": {"type": "string", "maxLength": 64},
+                                "status": {"$ref": "#/components/schemas/Status"},
+                                "price": {"type": "number", "nullable": True},
+                                "tags": {"type": "array", "items": {"type": "string"}},
+                                "pet": {"$ref": "#/components/schemas/Pet"},
+                            },
+                        },
+                    ]
+                },
+                "Items": {"type": "array", "items": {"$ref": "#/components/schemas/Item"}},
+            }
+        },
+    }
+
+
+def items(n: int) -> str:
+    return json.dumps(
+        [
+            {
+                "id": i + 1,
+                "created": "2024-01-01T00:00:00Z",
+                "name": f"item {i}",
+                "status": ("available", "pending", "sold")[i % 3],
+                "price": None if i % 5 == 0 else i * 1.5,
+                "tags": ["a", "b"],
+                "pet": {"petType": "cat", "lives": 9} if i % 2 else {"petType": "dog", "bark": True},
+            }
+            for i in range(n)
+        ]
+    )
+
+
+def main(n: int = 10000, repeat: int = 10) -> None:
+    api = OpenAPI("/", document())
+    schema = api.components.schemas["Items"]
+    data = items(n)
+
+    for backend in (PydanticBackend(), MsgspecBackend()):
+        backend.model(schema, data, json=True)
+        r = []
+        for _ in range(repeat):
+            begin = time.perf_counter()
+            backend.model(schema, data, json=True)
+            r.append(time.perf_counter() - begin)
+        print(f"{backend.name:10s} {n} items {min(r) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
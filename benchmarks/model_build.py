@@ -0,0 +1,45 @@
+"""
+model creation time for a description document with many schemas
+
+creates a synthetic description document with schemas referencing each other (a tree) and a few cycles
+and reports the time spent per startup phase
+
+    python benchmarks/model_build.py [schemas]
+"""
+
+import sys
+import time
+
+from aiopenapi3 import OpenAPI
+
+
+def document(n: int, cycles: int = 10) -> dict:
+    schemas = {}
+    for i in range(n):
+        properties = {"id": {"type": "integer"}, "name": {"type": "string"}}
+        for j in (2 * i + 1, 2 * i + 2):
+            if j < n:
+                properties[f"s{j}"] = {"$ref": f"#/components/schemas/S{j}"}
+        if i < cycles:
+            properties["parent"] = {"$ref": f"#/components/schemas/S{i}"}
+        schemas[f"S{i}"] = {"type": "object", "properties": properties}
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": "model build", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": schemas},
+    }
+
+
+def main(n: int = 1000) -> None:
+    data = document(n)
+    begin = time.perf_counter()
+    api = OpenAPI("/", data)
+    print(f"{n} schemas {(time.perf_counter() - begin) * 1000:10.1f} ms")
+    for phase, duration in api.profile.totals().items():
+        print(f"  {duration * 1000:10.1f} ms  {phase}")
+    print(f"  {len(api.profile.report('model_rebuild')):10d} models rebuild")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
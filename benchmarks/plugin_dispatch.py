@@ -0,0 +1,64 @@
+"""
+plugin dispatch overhead per request
+
+compares the cost of the Message hooks of a request without plugins,
+with a plugin implementing a single hook, the cost of creating the Context for each hook
+and the cost of calling a function with the arguments of each hook
+
+    python benchmarks/plugin_dispatch.py
+"""
+
+import timeit
+
+from aiopenapi3.plugin import Plugins, Message
+
+
+class OnReceived(Message):
+    def received(self, ctx):
+        return ctx
+
+
+def request(plugins: Plugins) -> None:
+    message = plugins.message
+    message.marshalled(request=None, operationId="op", marshalled={})
+    message.sending(request=None, operationId="op", sending=b"", headers={}, cookies={})
+    message.received(request=None, operationId="op", received=b"", headers={}, status_code="200", content_type=None)
+    message.parsed(request=None, operationId="op", parsed={}, expected_type=None)
+    message.unmarshalled(request=None, operationId="op", unmarshalled=None)
+
+
+def noop(**kwargs):
+    return kwargs
+
+
+def floor() -> None:
+    noop(request=None, operationId="op", marshalled={})
+    noop(request=None, operationId="op", sending=b"", headers={}, cookies={})
+    noop(request=None, operationId="op", received=b"", headers={}, status_code="200", content_type=None)
+    noop(request=None, operationId="op", parsed={}, expected_type=None)
+    noop(request=None, operationId="op", unmarshalled=None)
+
+
+def context() -> None:
+    Message.Context(request=None, operationId="op", marshalled={})
+    Message.Context(request=None, operationId="op", sending=b"", headers={}, cookies={})
+    Message.Context(request=None, operationId="op", received=b"", headers={}, status_code="200", content_type=None)
+    Message.Context(request=None, operationId="op", parsed={}, expected_type=None)
+    Message.Context(request=None, operationId="op", unmarshalled=None)
+
+
+def main(number: int = 100_000) -> None:
+    none = Plugins([])
+    one = Plugins([OnReceived()])
+    for name, f in [
+        ("no plugins", lambda: request(none)),
+        ("one plugin, one hook", lambda: request(one)),
+        ("Context creation only", context),
+        ("function call (floor)", floor),
+    ]:
+        t = min(timeit.repeat(f, number=number, repeat=5)) / number
+        print(f"{name:24s} {t * 1e6:8.3f} µs/request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import datetime
+import json
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI, ResponseSchemaError, ResponseDecodingError
+
+pa = pytest.importorskip("pyarrow")
+
+from aiopenapi3.arrow import Columnar, Splitter
+
+ITEMS = [
+    {
+        "id": i + 1,
+        "status": ("available", "sold")[i % 2],
+        "price": None if i % 3 == 0 else i * 1.5,
+        "created": "2024-01-01T12:00:00Z",
+        "owner": {"name": f"o{i}", "since": "2020-01-01"},
+        "tags": ["a", "b"],
+        "unknown": {"ignored": True},
+    }
+    for i in range(100)
+]
+
+
+def test_arrow_schema(with_paths_response_arrow):
+    api = OpenAPI("http://example.org/", with_paths_response_arrow)
+    columnar = Columnar(api.components.schemas["Items"])
+    assert columnar.schema == pa.schema(
+        [
+            pa.field("id", pa.int64(), nullable=False),
+            pa.field("status", pa.string()),
+            pa.field("price", pa.float64()),
+            pa.field("created", pa.timestamp("us", tz="UTC")),
+            pa.field("owner", pa.struct([("name", pa.string()), ("since", pa.date32())])),
+            pa.field("tags", pa.list_(pa.string())),
+        ]
+    )
+    assert {(i.path, i.constraint) for i in columnar.checks} == {
+        (("id",), "minimum"),
+        (("status",), "enum"),
+        (("owner",), "required"),
+        (("owner", "name"), "max_length"),
+        (("tags", "[]"), "pattern"),
+    }
+
+    with pytest.raises(TypeError, match="not an array"):
+        Columnar(api.components.schemas["Item"])
+
+
+def test_arrow_split():
+    data = json.dumps([{"a": 'x\\"}]{[', "b": [{"c": 1}, {"c": 2}]}] * 50).encode()
+    for chunk in (1, 7, 4096):
+        splitter = Splitter(64)
+        blocks = [b for i in range(0, len(data), chunk) for b in splitter.feed(data[i : i + chunk])]
+        splitter.close()
+        assert len(blocks) > 1 and json.loads(b"[" + b",".join(blocks) + b"]") == json.loads(data)
+
+    splitter = Splitter(64)
+    list(splitter.feed(data[:-10]))
+    with pytest.raises(ValueError, match="incomplete"):
+        splitter.close()
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_arrow_request(httpx_mock, with_paths_response_arrow):
+    api = OpenAPI("http://example.org/", with_paths_response_arrow, session_factory=httpx.Client)
+    httpx_mock.add_response(url="http://example.org/items", json=ITEMS)
+
+    table = api._.items.arrow()
+    assert table.num_rows == 100 and "unknown" not in table.column_names
+    row = table.slice(1, 1).to_pylist()[0]
+    assert row["created"] == datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+    assert row["owner"] == {"name": "o1", "since": datetime.date(2020, 1, 1)} and row["price"] == 1.5
+    assert table.column("price").null_count == 34
+
+    batches = list(api._.items.arrow_batches(block_size=1024))
+    assert len(batches) > 1 and pa.Table.from_batches(batches).equals(table)
+
+    httpx_mock.add_response(url="http://example.org/item", json=ITEMS[0])
+    with pytest.raises(TypeError):
+        api._.item.arrow()
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_arrow_invalid(httpx_mock, with_paths_response_arrow):
+    api = OpenAPI("http://example.org/", with_paths_response_arrow, session_factory=httpx.Client)
+
+    for item, match in [
+        ({"id": 0}, "id: 1 values violate minimum"),
+        ({"id": 1, "status": "lost"}, "status: 1 values violate enum"),
+        ({"id": 1, "owner": {"name": "too long a name"}}, "owner.name: 1 values violate max_length"),
+        ({"id": 1, "tags": ["a", "B"]}, r"tags\.\[\]: 1 values violate pattern"),
+        ({"status": "sold"}, "Casting field 'id' with null values"),
+        ({"id": 1, "owner": {}}, "owner: 1 values violate required 'name'"),
+        ({"id": "x"}, "changed from number to string"),
+    ]:
+        httpx_mock.reset()
+        httpx_mock.add_response(url="http://example.org/items", json=[ITEMS[0], item])
+        with pytest.raises(ResponseSchemaError) as e:
+            api._.items.arrow()
+        assert e.match(match)
+
+    # validation is optional
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", json=[{"id": 0}])
+    assert api._.items.arrow(validate=False).num_rows == 1
+
+    httpx_mock.reset()
+    httpx_mock.add_response(
+        url="http://example.org/items", content=b'[{"id": 1}, {"id"', headers={"content-type": "application/json"}
+    )
+    with pytest.raises(ResponseDecodingError):
+        api._.items.arrow()
+    with pytest.raises(ResponseDecodingError):
+        list(api._.items.arrow_batches())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_arrow_async(httpx_mock, with_paths_response_arrow):
+    api = OpenAPI("http://example.org/", with_paths_response_arrow, session_factory=httpx.AsyncClient)
+    httpx_mock.add_response(url="http://example.org/items", json=ITEMS)
+    httpx_mock.add_response(url="http://example.org/items", json=ITEMS)
+
+    table = await api._.items.arrow()
+    batches = [batch async for batch in api._.items.arrow_batches(block_size=1024)]
+    assert table.num_rows == 100 and pa.Table.from_batches(batches).equals(table)
@@ -0,0 +1,88 @@
+import time
+import uuid
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI
+
+httpx_auth = pytest.importorskip("httpx_auth")
+
+from aiopenapi3.auth import TokenRefresh
+
+
+class TokenEndpoint:
+    def __init__(self, expires_in: int):
+        self.expires_in = expires_in
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        return httpx.Response(
+            200, json={"access_token": f"t{self.requests}", "token_type": "Bearer", "expires_in": self.expires_in}
+        )
+
+
+@pytest.fixture
+def api(with_paths_security_oauth2):
+    api = OpenAPI("http://example.org/", with_paths_security_oauth2, session_factory=httpx.Client)
+    # the tokens of httpx-auth are cached per client - unique per test
+    api.authenticate(oauth2={"client_id": str(uuid.uuid4()), "client_secret": "secret"})
+    return api
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_auth_cached(httpx_mock, api):
+    httpx_mock.add_callback(token := TokenEndpoint(3600), url="http://example.org/token")
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+
+    def authorization():
+        return httpx_mock.get_requests(url="http://example.org/items")[-1].headers["Authorization"]
+
+    api._.items()
+    assert authorization() == "Bearer t1"
+    api._.items()
+    assert authorization() == "Bearer t1"
+    assert token.requests == 1
+
+    # the authorizations are resolved again for new credentials
+    api.authenticate(oauth2={"client_id": str(uuid.uuid4()), "client_secret": "secret"})
+    api._.items()
+    assert authorization() == "Bearer t2"
+    assert token.requests == 2
+
+
+def test_auth_token_refresh_unsupported(monkeypatch):
+    # the tokens refreshed are stored using the private interface of the token cache
+    monkeypatch.delattr(type(httpx_auth.OAuth2.token_cache), "_add_access_token")
+    with pytest.raises(ImportError, match="_add_access_token"):
+        TokenRefresh()
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True, assert_all_responses_were_requested=False)
+def test_auth_token_refresh(httpx_mock, api):
+    httpx_mock.add_callback(token := TokenEndpoint(3600), url="http://example.org/token")
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+
+    # renew the token right after it was received
+    api.token_refresh = TokenRefresh(margin=3600 - 0.2, retry=0.1)
+    try:
+        api._.items()
+        assert token.requests == 1
+
+        for _ in range(50):
+            if token.requests > 1:
+                break
+            time.sleep(0.05)
+        assert token.requests > 1
+
+        # the request uses the token refreshed in the background
+        api._.items()
+        assert httpx_mock.get_requests(url="http://example.org/items")[-1].headers["Authorization"] != "Bearer t1"
+    finally:
+        api.token_refresh.close()
+
+    assert api.token_refresh._timers == dict()
+
+    # closed - the tokens are not refreshed any longer
+    api._.items()
+    assert api.token_refresh._timers == dict()
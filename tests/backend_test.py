@@ -0,0 +1,125 @@
+import datetime
+
+import httpx
+import pydantic
+import pytest
+
+from aiopenapi3 import OpenAPI, ResponseSchemaError, ResponseDecodingError
+from aiopenapi3.backend import PydanticBackend
+
+msgspec = pytest.importorskip("msgspec")
+
+from aiopenapi3.backend import MsgspecBackend
+
+ITEMS = [
+    {
+        "id": 1,
+        "status": "sold",
+        "created": "2020-01-01T00:00:00Z",
+        "owner": {"name": "alice", "mail": None},
+        "pet": {"petType": "cat"},
+        "tags": ["a"],
+        "children": [{"id": 2, "status": "available", "pet": {"petType": "dog", "bark": True}}],
+    }
+]
+
+
+@pytest.fixture
+def api(with_schema_backend):
+    api = OpenAPI("http://example.org/", with_schema_backend, session_factory=httpx.Client)
+    api.backend = MsgspecBackend()
+    return api
+
+
+def test_backend_types(api):
+    backend = api.backend
+    schemas = api.components.schemas
+
+    Items = backend.get_type(schemas["Items"])
+    (Item,) = Items.__args__
+    assert issubclass(Item, msgspec.Struct)
+    assert {"id", "created", "status", "owner", "pet", "tags", "children"} == set(Item.__struct_fields__)
+
+    # the discriminator is the tag of the union members
+    Pet = backend.get_type(schemas["Pet"])
+    assert [(i.__struct_config__.tag_field, i.__struct_config__.tag) for i in Pet.__args__] == [
+        ("petType", "cat"),
+        ("petType", "dog"),
+    ]
+
+    # not is not supported - the pydantic model is used
+    assert backend.supports(schemas["Items"]) and not backend.supports(schemas["Unsupported"])
+    assert backend.get_type(schemas["Unsupported"]) is schemas["Unsupported"].get_type()
+
+
+def test_backend_model(api):
+    backend = api.backend
+    schema = api.components.schemas["Items"]
+
+    for r in (backend.model(schema, ITEMS), backend.model(schema, msgspec.json.encode(ITEMS), json=True)):
+        (item,) = r
+        assert item.created == datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
+        assert item.owner.name == "alice" and item.owner.mail is None
+        assert item.pet.petType == "cat" and item.pet.lives == 9
+        assert item.children[0].pet.bark is True and item.children[0].owner is None
+
+    # same result as the pydantic backend
+    assert msgspec.to_builtins(r) == [
+        i.model_dump(mode="json", by_alias=True) for i in PydanticBackend().model(schema, ITEMS)
+    ]
+
+    for invalid in [
+        [{"id": 0, "status": "sold"}],
+        [{"id": 1, "status": "lost"}],
+        [{"id": 1, "status": "sold", "owner": {"name": "alice", "unknown": 1}}],
+        [{"id": 1, "status": "sold", "pet": {"petType": "bird"}}],
+    ]:
+        with pytest.raises(msgspec.ValidationError):
+            backend.model(schema, invalid)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_backend_request(httpx_mock, api):
+    httpx_mock.add_response(url="http://example.org/items", json=ITEMS)
+    r = api._.items()
+    assert isinstance(r[0], msgspec.Struct) and r[0].children[0].id == 2
+
+    # selecting fields & plain results use the pydantic backend
+    assert api._.items(fields=["id"])[0].model_dump(exclude_unset=True) == {"id": 1}
+    assert type(r := api._.items(plain=True)[0]) is dict and r["children"] == ITEMS[0]["children"]
+
+    httpx_mock.add_response(url="http://example.org/unsupported", json={"name": "x"})
+    assert isinstance(api._.unsupported(), pydantic.BaseModel)
+
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", json=[{"id": "x"}])
+    with pytest.raises(ResponseSchemaError) as e:
+        api._.items()
+    assert isinstance(e.value.exception, msgspec.ValidationError)
+
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", content=b"[{", headers={"content-type": "application/json"})
+    with pytest.raises(ResponseDecodingError):
+        api._.items()
+
+
+def test_backend_fallback(api):
+    backend = api.backend
+    schema = api.components.schemas["Partial"]
+
+    # the properties not supported use the pydantic models, the Struct is created by msgspec
+    assert backend.supports(schema)
+    data = {"name": "x", "meta": {"source": "a", "count": 1}, "aliases": ["y"]}
+    for r in (backend.model(schema, data), schema.model_json(msgspec.json.encode(data), backend=backend)):
+        assert isinstance(r, msgspec.Struct) and r.name == "x" and r.aliases == ["y"]
+        assert isinstance(r.meta, pydantic.BaseModel) and r.meta.source == "a" and r.meta.count == 1
+
+    for invalid in [{"name": 1}, {"meta": {"source": 1}}, {"aliases": [1]}]:
+        with pytest.raises(msgspec.ValidationError):
+            backend.model(schema, invalid)
+
+    # the values created by the pydantic models are returned unwrapped
+    names = api.components.schemas["Names"]
+    assert backend.model(names, ["x", "y"]) == names.model_json(b'["x", "y"]', backend=backend) == ["x", "y"]
+
+    assert schema.get_type(backend=backend) is backend.get_type(schema)
@@ -0,0 +1,122 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI, RequestError, HTTPStatusError
+from aiopenapi3.circuitbreaker import CircuitBreaker
+from aiopenapi3.errors import CircuitOpenError
+
+KEY = ("http://example.org", "items")
+
+
+@pytest.fixture
+def api(with_paths_circuitbreaker):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.Client)
+    api.circuit_breaker = CircuitBreaker(failure_rate=0.5, window=4, minimum_calls=4, wait=0.2, half_open_calls=2)
+    return api
+
+
+def test_circuitbreaker_states(httpx_mock, api):
+    transitions = list()
+    api.circuit_breaker.listeners.append(lambda circuit, previous, state: transitions.append((previous, state)))
+
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+    httpx_mock.add_response(url="http://example.org/items", status_code=503, json="")
+    httpx_mock.add_exception(httpx.ConnectTimeout("timeout"), url="http://example.org/items")
+    httpx_mock.add_response(url="http://example.org/items", status_code=500, json="")
+    httpx_mock.add_response(url="http://example.org/other", json="ok")
+
+    assert api._.items() == "ok"
+    with pytest.raises(HTTPStatusError):
+        api._.items()
+    with pytest.raises(RequestError):
+        api._.items()
+    circuit = api.circuit_breaker.circuits[KEY]
+    assert circuit.state == "closed" and circuit.failure_rate == 2 / 3
+    with pytest.raises(HTTPStatusError):
+        api._.items()
+
+    # 3 of 4 calls failed - the circuit is open, requests fail without being sent
+    assert circuit.state == "open" and transitions == [("closed", "open")]
+    with pytest.raises(CircuitOpenError) as e:
+        api._.items()
+    assert e.value.key == KEY and 0 < e.value.retry <= 0.2 and circuit.rejected == 1
+    assert isinstance(e.value, RequestError) and e.value.operation.operationId == "items"
+
+    # the circuits are per server & Operation
+    assert api._.other() == "ok"
+
+    # half-open - the trial calls succeed & close the circuit
+    time.sleep(0.2)
+    httpx_mock.add_response(url="http://example.org/items", json="ok", is_reusable=True)
+    assert api._.items() == "ok"
+    assert circuit.state == "half-open"
+    assert api._.items() == "ok"
+    assert circuit.state == "closed" and transitions == [
+        ("closed", "open"),
+        ("open", "half-open"),
+        ("half-open", "closed"),
+    ]
+
+
+def test_circuitbreaker_half_open(httpx_mock, api):
+    circuit = api.circuit_breaker.circuit(api._.items, httpx.Request("GET", "http://example.org/items"))
+    for _ in range(4):
+        circuit.record(0.1, 500)
+    assert circuit.state == "open"
+
+    # the trial calls are limited
+    time.sleep(0.2)
+    assert circuit.acquire() and circuit.acquire() and not circuit.acquire()
+    assert circuit.retry is None
+    circuit.release()
+    assert circuit.acquire()
+
+    # a trial call failed - open again
+    circuit.record(0.1, 200)
+    circuit.record(0.1, 500)
+    assert circuit.state == "open"
+
+
+def test_circuitbreaker_slow(api):
+    api.circuit_breaker = CircuitBreaker(
+        slow_call_rate=0.5, slow_call_duration=1.0, window=4, minimum_calls=4, half_open_calls=1
+    )
+    circuit = api.circuit_breaker.circuit(api._.items, httpx.Request("GET", "http://example.org/items"))
+    for duration in (0.1, 2.0, 0.1):
+        circuit.record(duration, 200)
+    assert circuit.state == "closed" and circuit.slow_call_rate == 1 / 3
+    circuit.record(2.0, 200)
+    assert circuit.state == "open"
+
+    with pytest.raises(ValueError):
+        CircuitBreaker(minimum_calls=10, window=5)
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_circuitbreaker_async(httpx_mock, with_paths_circuitbreaker):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.AsyncClient)
+    api.circuit_breaker = CircuitBreaker(window=2, minimum_calls=2, half_open_calls=1)
+    httpx_mock.add_exception(httpx.ConnectError("refused"), url="http://example.org/items", is_reusable=True)
+
+    for _ in range(2):
+        with pytest.raises(RequestError):
+            await api._.items()
+    with pytest.raises(CircuitOpenError):
+        await api._.items()
+
+    # cancelled requests are not recorded
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(1)
+        return httpx.Response(200, json="ok")
+
+    httpx_mock.add_callback(slow, url="http://example.org/other")
+    api.circuit_breaker = CircuitBreaker(window=2, minimum_calls=2, half_open_calls=1)
+    task = asyncio.create_task(api._.other())
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert all(len(c.calls) == 0 for c in api.circuit_breaker.circuits.values())
@@ -69,3 +69,13 @@ def test_call():
         )
     )
     auth.unlink()
+
+
+def test_validate_report(tmp_path):
+    main(shlex.split("validate --report text --report-limit 5 tests/fixtures/petstore-expanded.yaml"))
+
+    output = tmp_path / "report.json"
+    main(shlex.split(f"validate --report json --report-file {output} tests/fixtures/petstore-expanded.yaml"))
+    data = json.loads(output.read_text())
+    assert {"parse", "resolve", "operationindex", "get_type"} <= set(data["totals"].keys())
+    assert [i["own"] for i in data["samples"]] == sorted((i["own"] for i in data["samples"]), reverse=True)
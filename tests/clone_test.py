@@ -1,6 +1,12 @@
 from pathlib import Path
 
 from aiopenapi3 import OpenAPI
+from aiopenapi3.backend import PydanticBackend
+from aiopenapi3.circuitbreaker import CircuitBreaker
+from aiopenapi3.concurrency import ConcurrencyLimiter
+from aiopenapi3.pagination import Offset
+from aiopenapi3.ratelimit import RateLimit, RateLimiter
+from aiopenapi3.validation import ValidationPolicy
 
 import pytest
 
@@ -15,6 +21,26 @@ def test_clone(petstore_expanded):
     _ = api.clone("/v2")
 
 
+def test_clone_configuration(petstore_expanded):
+    api = OpenAPI("/", petstore_expanded)
+    api.validation.default = ValidationPolicy(mode="trusted")
+    api.pagination.operations["findPets"] = Offset()
+    api.plain = True
+    api.backend = PydanticBackend()
+    api.rate_limit = RateLimiter(RateLimit(rate=10))
+    api.circuit_breaker = CircuitBreaker()
+    api.concurrency_limit = ConcurrencyLimiter()
+
+    clone = api.clone("/v2")
+    assert str(clone._base_url) == "/v2"
+    for name in ["validation", "pagination", "plain", "backend", "rate_limit", "circuit_breaker", "concurrency_limit"]:
+        assert getattr(clone, name) is getattr(api, name), name
+    assert clone.validation.default.mode == "trusted" and clone.pagination.operations["findPets"] == Offset()
+
+    # the caches are keyed by id() of the objects of the api
+    assert clone._authorizations == clone._dispatch == clone._columnar == dict()
+
+
 def test_cache(petstore_expanded):
     api = OpenAPI("/", petstore_expanded)
 
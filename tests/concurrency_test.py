@@ -0,0 +1,163 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI, HTTPStatusError
+from aiopenapi3.circuitbreaker import CircuitBreaker
+from aiopenapi3.concurrency import AIMD, ConcurrencyLimiter, Gradient
+from aiopenapi3.errors import CircuitOpenError, ConcurrencyLimitError
+from aiopenapi3.ratelimit import RateLimit, RateLimiter
+
+
+def test_concurrency_algorithms():
+    aimd = AIMD(backoff=0.5)
+    assert aimd.update(10, 0.1, 5, False) == 11
+    assert aimd.update(10, 0.1, 1, False) == 10
+    assert aimd.update(10, 0.1, 5, True) == 5
+    assert aimd.update(10, 10.0, 5, False) == 5
+
+    gradient = Gradient(tolerance=1.0, smoothing=1.0)
+    assert gradient.update(16, 0.1, 16, False) == 20
+    # the latency doubled - the limit decreases
+    assert gradient.update(16, 0.2, 16, False) < 16
+    assert gradient.update(16, 0.1, 16, True) < 16
+
+    with pytest.raises(ValueError):
+        ConcurrencyLimiter(initial=10, maximum=5)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_concurrency_limit(httpx_mock, with_paths_circuitbreaker, upstream_factory):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.Client)
+    api.concurrency_limit = ConcurrencyLimiter(initial=2, maximum=2)
+    httpx_mock.add_callback(upstream := upstream_factory(0.05), url="http://example.org/items")
+
+    with ThreadPoolExecutor(8) as executor:
+        assert list(executor.map(lambda _: api._.items(), range(8))) == ["ok"] * 8
+
+    limit = api.concurrency_limit.limits["http://example.org"]
+    assert upstream.maximum == 2 and limit.limit == 2
+    assert limit.inflight == 0 and limit.queued == 0
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_concurrency_deadline(httpx_mock, with_paths_circuitbreaker):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.Client)
+    api.concurrency_limit = ConcurrencyLimiter(initial=1, maximum=1, timeout=0.05, per="operation")
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+
+    # the slot is held until the deadline passed
+    limit = api.concurrency_limit.limit(api._.items, httpx.Request("GET", "http://example.org/items"))
+    assert limit.acquire(None)
+    with pytest.raises(ConcurrencyLimitError) as e:
+        api._.items()
+    limit.release(0.0, None)
+    assert api._.items() == "ok"
+
+    assert limit.key == ("http://example.org", "items")
+    assert e.value.key == limit.key and e.value.limit == 1 and limit.rejected == 1
+    assert limit.inflight == 0 and limit.queued == 0
+
+    # the queue is full
+    api.concurrency_limit = ConcurrencyLimiter(initial=1, maximum=1, max_queue=0)
+    limit = api.concurrency_limit.limit(api._.items, httpx.Request("GET", "http://example.org/items"))
+    assert limit.acquire(None)
+    with pytest.raises(ConcurrencyLimitError):
+        api._.items()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrency_async(httpx_mock, with_paths_circuitbreaker, upstream_factory):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.AsyncClient)
+    api.concurrency_limit = ConcurrencyLimiter(AIMD, initial=4, maximum=8)
+    upstream = upstream_factory(0.02)
+    httpx_mock.add_callback(upstream.acall, url="http://example.org/items", is_reusable=True)
+
+    assert await asyncio.gather(*[api._.items() for _ in range(32)]) == ["ok"] * 32
+    limit = api.concurrency_limit.limits["http://example.org"]
+    assert 4 <= upstream.maximum <= 8 and limit.limit == 8
+
+    # the upstream is overloaded - the limit decreases
+    upstream.status_code = 503
+    for _ in range(8):
+        with pytest.raises(HTTPStatusError):
+            await api._.items()
+    assert limit.limit < 4 and limit.inflight == 0
+
+    # the deadline passed - the slot is held
+    api.concurrency_limit = ConcurrencyLimiter(initial=1, maximum=1, timeout=0.01)
+    upstream.status_code = 200
+    limit = api.concurrency_limit.limit(api._.items, httpx.Request("GET", "http://example.org/items"))
+    assert await limit.aacquire(None)
+    with pytest.raises(ConcurrencyLimitError):
+        await api._.items()
+    limit.release(0.0, None)
+    assert await api._.items() == "ok"
+    assert limit.inflight == 0 and limit.queued == 0 and limit.rejected == 1
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_concurrency_clock(httpx_mock, with_paths_circuitbreaker, clock):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.Client)
+    api.concurrency_limit = ConcurrencyLimiter(AIMD, initial=4, maximum=8, clock=clock)
+
+    def upstream(request):
+        clock.sleep(delay)
+        return httpx.Response(200, json="ok")
+
+    httpx_mock.add_callback(upstream, url="http://example.org/items")
+    limit = api.concurrency_limit.limit(api._.items, httpx.Request("GET", "http://example.org/items"))
+
+    # the latency is measured using the clock - exceeding the timeout of AIMD decreases the limit
+    delay = 10.0
+    assert api._.items() == "ok" and limit.limit == pytest.approx(4 * 0.9)
+
+    # the limit is not used - not increased
+    delay = 0.1
+    assert api._.items() == "ok" and limit.limit == pytest.approx(4 * 0.9)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_concurrency_layers(httpx_mock, with_paths_circuitbreaker):
+    api = OpenAPI("http://example.org/", with_paths_circuitbreaker, session_factory=httpx.Client)
+    api.concurrency_limit = ConcurrencyLimiter(initial=4, maximum=8)
+    api.circuit_breaker = CircuitBreaker(window=2, minimum_calls=2, half_open_calls=1)
+
+    class Body(httpx.SyncByteStream):
+        inflight = None
+
+        def __iter__(self):
+            # the slot is held while the body is read
+            Body.inflight = api.concurrency_limit.limits["http://example.org"].inflight
+            yield b'"ok"'
+
+    httpx_mock.add_callback(
+        lambda request: httpx.Response(200, headers={"Content-Type": "application/json"}, stream=Body()),
+        url="http://example.org/items",
+    )
+    assert api._.items() == "ok" and Body.inflight == 1
+
+    class Tokens(RateLimiter):
+        inflight = None
+
+        def acquire(self, request, req):
+            Tokens.inflight = api.concurrency_limit.limits["http://example.org"].inflight
+            return super().acquire(request, req)
+
+    # the rate limit token is taken before acquiring a slot - requests waiting for a token do not occupy a slot
+    api.rate_limit = Tokens(RateLimit(rate=100, burst=10))
+    assert api._.items() == "ok" and Tokens.inflight == 0
+    api.rate_limit = None
+
+    # the circuit is checked before acquiring a slot - requests failing fast are no sample of the limit
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", status_code=500, json="")
+    with pytest.raises(HTTPStatusError):
+        api._.items()
+    limit = api.concurrency_limit.limits["http://example.org"]
+    before = limit.limit
+    with pytest.raises(CircuitOpenError):
+        api._.items()
+    assert limit.limit == before and limit.inflight == 0
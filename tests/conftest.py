@@ -1,9 +1,13 @@
+import asyncio
 import os
 import dataclasses
+import threading
+import time
 
 from pathlib import Path
 
 from yaml import safe_load
+import httpx
 import pytest
 
 import aiopenapi3
@@ -69,6 +73,80 @@ def api_version(request):
     return request.param
 
 
+class _Upstream:
+    """
+    an upstream responding after delay seconds - records the requests & the requests in flight
+    """
+
+    def __init__(self, delay: float = 0.0, status_code: int = 200, json=lambda request: "ok"):
+        self.delay = delay
+        self.status_code = status_code
+        self.json = json
+        """the data of the response for the request"""
+        self.inflight = self.maximum = self.requests = 0
+        self.lock = threading.Lock()
+
+    def _enter(self):
+        with self.lock:
+            self.requests += 1
+            self.inflight += 1
+            self.maximum = max(self.maximum, self.inflight)
+
+    def _exit(self, request):
+        with self.lock:
+            self.inflight -= 1
+        return httpx.Response(self.status_code, json=self.json(request))
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        time.sleep(self.delay)
+        return self._exit(request)
+
+    async def acall(self, request: httpx.Request) -> httpx.Response:
+        self._enter()
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            r = self._exit(request)
+        return r
+
+
+@pytest.fixture
+def upstream_factory():
+    """
+    creates upstreams for httpx_mock callbacks - upstream_factory(delay, status_code, json)
+    """
+    return _Upstream
+
+
+class _Clock:
+    """
+    a monotonic clock advanced by sleeping - records the delays slept
+    """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.slept: list[float] = list()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, delay: float) -> None:
+        self.slept.append(delay)
+        self.now += delay
+
+    async def asleep(self, delay: float) -> None:
+        self.sleep(delay)
+
+
+@pytest.fixture
+def clock():
+    """
+    a fake monotonic clock - clock(), clock.sleep(delay), await clock.asleep(delay) & clock.slept
+    """
+    return _Clock()
+
+
 def _get_parsed_yaml(filename, version=None):
     """
     Returns a python dict that is a parsed yaml file from the tests/fixtures
@@ -187,6 +265,41 @@ def with_paths_security(openapi_version):
     yield _get_parsed_yaml("paths-security.yaml", openapi_version)
 
 
+@pytest.fixture
+def with_paths_response_validation():
+    yield _get_parsed_yaml("paths-response-validation.yaml")
+
+
+@pytest.fixture
+def with_paths_response_fields():
+    yield _get_parsed_yaml("paths-response-fields.yaml")
+
+
+@pytest.fixture
+def with_paths_response_arrow():
+    yield _get_parsed_yaml("paths-response-arrow.yaml")
+
+
+@pytest.fixture
+def with_paths_security_oauth2():
+    yield _get_parsed_yaml("paths-security-oauth2.yaml")
+
+
+@pytest.fixture
+def with_paths_ratelimit():
+    yield _get_parsed_yaml("paths-ratelimit.yaml")
+
+
+@pytest.fixture
+def with_paths_circuitbreaker():
+    yield _get_parsed_yaml("paths-circuitbreaker.yaml")
+
+
+@pytest.fixture
+def with_paths_pagination():
+    yield _get_parsed_yaml("paths-pagination.yaml")
+
+
 @pytest.fixture
 def with_paths_security_v20():
     yield _get_parsed_yaml("paths-security-v20.yaml")
@@ -345,6 +458,11 @@ def with_schema_discriminated_union_deep():
     yield _get_parsed_yaml("schema-discriminated-union-deep.yaml")
 
 
+@pytest.fixture
+def with_schema_union_inferred():
+    yield _get_parsed_yaml("schema-union-inferred.yaml")
+
+
 @pytest.fixture
 def with_schema_create_update_read():
     yield _get_parsed_yaml("schema-create-update-read.yaml")
@@ -370,6 +488,11 @@ def with_schema_extensions(openapi_version):
     yield _get_parsed_yaml("schema-extensions.yaml", openapi_version)
 
 
+@pytest.fixture
+def with_schema_structural(openapi_version):
+    yield _get_parsed_yaml("schema-structural.yaml", openapi_version)
+
+
 @pytest.fixture
 def with_schema_recursion(openapi_version):
     yield _get_parsed_yaml("schema-recursion.yaml", openapi_version)
@@ -561,3 +684,8 @@ def with_schema_oneOf_mixed():
 @pytest.fixture
 def with_schema_anyOf():
     yield _get_parsed_yaml("schema-anyOf.yaml")
+
+
+@pytest.fixture
+def with_schema_backend():
+    yield _get_parsed_yaml("schema-backend.yaml")
@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+VERSIONS = ("aiopenapi3.v20", "aiopenapi3.v30", "aiopenapi3.v31")
+
+
+def imported(statement: str) -> list[str]:
+    p = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{statement}\nprint(' '.join(sorted(m for m in sys.modules if m in {VERSIONS!r})))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return p.stdout.split()
+
+
+def test_import():
+    assert imported("import aiopenapi3") == []
+
+
+@pytest.mark.parametrize(
+    "version, expected",
+    [
+        ({"swagger": "2.0"}, ["aiopenapi3.v20"]),
+        ({"openapi": "3.0.3"}, ["aiopenapi3.v30"]),
+        ({"openapi": "3.1.0"}, ["aiopenapi3.v30", "aiopenapi3.v31"]),
+    ],
+)
+def test_parse(version, expected):
+    document = dict(info={"title": "", "version": ""}, paths={}, **version)
+    assert imported(f"import aiopenapi3\naiopenapi3.OpenAPI._parse_obj({document!r})") == expected
+
+
+def test_loaded():
+    from aiopenapi3.lazy import loaded
+    from aiopenapi3 import v30
+
+    assert v30.Root in loaded("v30.Root")
+    assert v30.paths.Response in loaded("v30.paths.Response")
+
+
+def test_field_class_to_schema():
+    from aiopenapi3.pydanticv2 import field_class_to_schema, field_class_schemas
+
+    assert field_class_to_schema is field_class_schemas()
+    assert dict(field_class_to_schema)[int] == {"type": "integer"}
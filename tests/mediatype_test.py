@@ -0,0 +1,33 @@
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI
+from aiopenapi3.mediatype import parse_content_type
+from aiopenapi3.v30.formdata import decode_content_type
+
+
+@pytest.mark.parametrize(
+    "value, media_type, parameters",
+    [
+        ("text/plain", "text/plain", ()),
+        ('Text/HTML; Charset="UTF-8"', "text/html", (("charset", "UTF-8"),)),
+        ("application/json;charset=utf-8 ", "application/json", (("charset", "utf-8"),)),
+        ('multipart/form-data; boundary="a;b\\"c"; x=1', "multipart/form-data", (("boundary", 'a;b"c'), ("x", "1"))),
+        ('a/b ;  x = 1 ; invalid; y=""', "a/b", (("x", "1"), ("y", ""))),
+        ("", "", ()),
+    ],
+)
+def test_mediatype_parse(value, media_type, parameters):
+    ct = parse_content_type(value)
+    assert ct.media_type == media_type and ct.parameters == parameters
+    assert parse_content_type(value) is ct
+    assert decode_content_type(value) == (ct.type, ct.subtype, list(parameters))
+
+
+def test_mediatype_response(httpx_mock, with_paths_response_status_pattern_default):
+    api = OpenAPI("/", with_paths_response_status_pattern_default, session_factory=httpx.Client)
+    api.raise_on_http_status = []
+
+    # media types are case-insensitive
+    httpx_mock.add_response(headers={"Content-Type": "Application/JSON; charset=UTF-8"}, status_code=200, json="good")
+    assert api._.test() == "good"
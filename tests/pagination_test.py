@@ -0,0 +1,122 @@
+import re
+import time
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI
+from aiopenapi3.pagination import Cursor, Link, Offset, Page, links
+
+ITEMS = [{"id": i} for i in range(25)]
+
+
+def page(request: httpx.Request) -> list[dict]:
+    """
+    the items using offset & limit
+    """
+    offset, limit = int(request.url.params["offset"]), int(request.url.params["limit"])
+    return ITEMS[offset : offset + limit]
+
+
+@pytest.fixture
+def api(with_paths_pagination):
+    return OpenAPI("http://example.org/", with_paths_pagination, session_factory=httpx.Client)
+
+
+def test_pagination_links():
+    assert links('<https://example.org/items?page=2>; rel="next", <https://example.org/items?page=5>; rel=last') == {
+        "next": "https://example.org/items?page=2",
+        "last": "https://example.org/items?page=5",
+    }
+    assert links('<a>; title="x, y"; rel="prev next"') == {"prev": "a", "next": "a"}
+    assert links("<a>; title=x") == {}
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_pagination_offset(httpx_mock, api, upstream_factory):
+    httpx_mock.add_callback(upstream := upstream_factory(json=page), url=re.compile(r"http://example.org/offset\?.*"))
+
+    items = list(api._.offset.paginate(paginator=Offset(size=10)))
+    assert [i.id for i in items] == list(range(25)) and upstream.requests == 3
+
+    # a page with less than size items is the last page - requesting the empty page following a full page
+    api.pagination.operations["offset"] = Offset(size=5)
+    assert len(list(api._.offset.paginate())) == 25 and upstream.requests == 3 + 6
+
+    # the items are validated
+    assert [i.id for i in api._.offset.paginate(paginator=Offset(size=10, start=20))] == list(range(20, 25))
+
+    # plain data
+    api.plain = True
+    assert list(api._.offset.paginate(paginator=Offset(size=10, start=20))) == ITEMS[20:]
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True, assert_all_requests_were_expected=False)
+def test_pagination_prefetch(httpx_mock, api, upstream_factory):
+    httpx_mock.add_callback(
+        upstream := upstream_factory(0.05, json=page), url=re.compile(r"http://example.org/offset\?.*")
+    )
+
+    start = time.monotonic()
+    items = list(api._.offset.paginate(paginator=Offset(size=2), prefetch=4))
+    assert [i.id for i in items] == list(range(25))
+    assert upstream.maximum == 5 and time.monotonic() - start < 13 * 0.05
+
+    # stop iterating - the pages prefetched are cancelled
+    upstream.requests = 0
+    paginate = api._.offset.paginate(paginator=Offset(size=2), prefetch=2)
+    assert next(paginate).id == 0
+    paginate.close()
+    assert upstream.requests <= 3
+
+
+@pytest.mark.httpx_mock(assert_all_responses_were_requested=False)
+def test_pagination_page(httpx_mock, api):
+    for page, items in [(1, ITEMS[:2]), (2, ITEMS[2:4]), (3, ITEMS[4:5]), (4, [])]:
+        httpx_mock.add_response(url=f"http://example.org/page?page={page}&per_page=2", json={"items": items})
+
+    # the specification extension
+    assert [i.id for i in api._.page.paginate(prefetch=1)] == [0, 1, 2, 3, 4]
+
+
+def test_pagination_cursor(httpx_mock, api):
+    httpx_mock.add_response(url="http://example.org/cursor", json={"data": ITEMS[:2], "meta": {"next-cursor": "a"}})
+    httpx_mock.add_response(url="http://example.org/cursor?cursor=a", json={"data": ITEMS[2:4], "meta": {}})
+
+    paginator = Cursor(parameter="cursor", field="meta.next-cursor", items="data")
+    assert [i.id for i in api._.cursor.paginate(paginator=paginator, prefetch=2)] == [0, 1, 2, 3]
+
+    with pytest.raises(ValueError, match="no paginator"):
+        list(api._.cursor.paginate())
+
+
+def test_pagination_link(httpx_mock, api):
+    httpx_mock.add_response(
+        url="http://example.org/link?offset=0&limit=2",
+        json=ITEMS[:2],
+        headers={"Link": '<http://example.org/link?offset=2&limit=2&unknown=1>; rel="next"'},
+    )
+    httpx_mock.add_response(url="http://example.org/link?offset=2&limit=2", json=ITEMS[2:3])
+
+    items = list(api._.link.paginate(parameters={"offset": 0, "limit": 2}, paginator=Link()))
+    assert [i.id for i in items] == [0, 1, 2]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_pagination_async(httpx_mock, with_paths_pagination, upstream_factory):
+    api = OpenAPI("http://example.org/", with_paths_pagination, session_factory=httpx.AsyncClient)
+    api.plain = True
+    upstream = upstream_factory(0.02, json=page)
+    httpx_mock.add_callback(upstream.acall, url=re.compile(r"http://example.org/offset\?.*"), is_reusable=True)
+
+    items = [i async for i in api._.offset.paginate(paginator=Offset(size=2), prefetch=4)]
+    assert items == ITEMS and upstream.maximum == 5
+
+    items = [i async for i in api._.offset.paginate(paginator=Offset(size=10))]
+    assert items == ITEMS and upstream.maximum == 5
+
+    # stop iterating - the pages prefetched are cancelled
+    paginate = api._.offset.paginate(paginator=Offset(size=2), prefetch=4)
+    assert await paginate.__anext__() == ITEMS[0]
+    await paginate.aclose()
+    assert upstream.inflight == 0
@@ -274,6 +274,44 @@ def test_paths_parameter_default(httpx_mock, with_paths_parameter_default):
     assert u.parts[3] == "path"
 
 
+def test_paths_parameter_codec():
+    import pickle
+    from aiopenapi3.errors import ParameterFormatError
+    from aiopenapi3.v30.parameter import Parameter
+    from aiopenapi3.v30.schemas import Schema
+
+    def parameter(**schema):
+        p = Parameter(name="x", **{"in": "query", "schema": None})
+        p.schema_ = Schema(**schema)
+        return p
+
+    # the encoder is compiled once
+    p = parameter(type="string")
+    assert p._encode("x", "a") == {"x": "a"} and (encoder := p._encoder) is not None
+    assert p._encode("x", "b") == {"x": "b"} and p._encoder is encoder
+
+    # values of other types & constrained Schemas are validated
+    with pytest.raises(ValueError):
+        p._encode("x", 1)
+    assert parameter(type="number")._encode("x", 1) == {"x": "1.0"}
+    with pytest.raises(ValueError):
+        parameter(type="string", maxLength=1)._encode("x", "ab")
+    with pytest.raises(ValueError):
+        parameter(type="integer", enum=[1, 2])._encode("x", 3)
+
+    # the compiled codecs are not pickled
+    p = pickle.loads(pickle.dumps(p))
+    assert p._encoder is None and p._encode("x", "a") == {"x": "a"}
+
+    from aiopenapi3.v20.parameter import Parameter as v20Parameter
+
+    p = v20Parameter(name="x", type="array", items={"type": "string"}, collectionFormat="pipes", **{"in": "query"})
+    assert p._encode("x", ["a", "b"]) == {"x": "a|b"} and p._decode("a|b") == ["a", "b"]
+    p = v20Parameter(name="x", type="array", items={"type": "string"}, collectionFormat="invalid", **{"in": "query"})
+    with pytest.raises(ParameterFormatError):
+        p._encode("x", ["a"])
+
+
 @pytest.mark.httpx_mock(can_send_already_matched_responses=True)
 def test_paths_parameter_format(httpx_mock, with_paths_parameter_format):
     httpx_mock.add_response(headers={"Content-Type": "application/json"}, json="test")
@@ -511,6 +549,14 @@ def test_paths_response_status_pattern_default(httpx_mock, with_paths_response_s
     with pytest.raises(ResponseSchemaError):
         api._.test()
 
+    # the Responses are precompiled once per Operation
+    dispatch = api._.test._dispatch
+    assert dispatch is api._.test._dispatch
+    responses = api._.test.operation.responses
+    for status_code, response in [("201", "201"), ("204", "2XX"), ("503", "5XX"), ("100", "default")]:
+        assert dispatch[status_code].response is responses[response]
+        assert dispatch[status_code] is dispatch[status_code]
+
 
 def test_paths_response_error(mocker, httpx_mock, with_paths_response_error_vXX):
     from aiopenapi3 import ResponseSchemaError, ContentTypeError, HTTPStatusError, ResponseDecodingError
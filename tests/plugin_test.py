@@ -1,7 +1,9 @@
+import asyncio
 import datetime
 from pathlib import Path
 
 import httpx
+import pytest
 import yarl
 
 from aiopenapi3 import FileSystemLoader, OpenAPI
@@ -96,3 +98,113 @@ def test_Plugins(httpx_mock, with_plugin_base):
     assert item.weight == None  # default does not apply as it it unsed
     assert item.color == "red"  # default does not apply
     assert item.created == datetime.datetime.fromtimestamp(4711, tz=datetime.timezone.utc)
+
+
+def test_Plugins_dispatch():
+    from aiopenapi3.plugin import Plugins, Passthrough
+
+    class OnSending(Message):
+        def sending(self, ctx):
+            ctx.sending = b"modified"
+            return ctx
+
+    plugins = Plugins([])
+    assert plugins.message.sending.methods == ()
+    r = plugins.message.sending(request=None, operationId="op", sending=b"data")
+    assert isinstance(r, Passthrough) and r.sending == b"data" and r.headers is None
+    assert plugins.message.sending is plugins.message.sending
+
+    plugins = Plugins([OnSending(), OnMessage()])
+    assert len(plugins.message.sending.methods) == 2
+    assert len(plugins.message.marshalled.methods) == 1
+    assert len(plugins.init.initialized.methods) == 0
+
+    r = plugins.message.sending(request=None, operationId="op", sending=b"data")
+    assert isinstance(r, Message.Context) and r.sending == b"modified"
+
+
+class OnMessageAsync(Message):
+    async def sending(self, ctx):
+        await asyncio.sleep(0)
+        ctx.headers["X-Signature"] = "signed"
+        return ctx
+
+    async def received(self, ctx):
+        await asyncio.sleep(0)
+        ctx.received = b"""[{"id":1,"name":"theanimal", "color": "red"}]"""
+        return ctx
+
+    def parsed(self, ctx):
+        ctx.parsed[0]["id"] = 2
+        return ctx
+
+    async def unmarshalled(self, ctx):
+        await asyncio.sleep(0)
+        ctx.unmarshalled[0].id = 3
+        return ctx
+
+
+def _api_plugin_async(with_plugin_base, session_factory):
+    api = OpenAPI.loads(
+        "plugin-base.yaml",
+        with_plugin_base,
+        plugins=[OnDocument("plugin-base.yaml"), OnMessageAsync()],
+        loader=FileSystemLoader(Path().cwd() / "tests/fixtures"),
+        session_factory=session_factory,
+    )
+    api._base_url = yarl.URL("http://127.0.0.1:80")
+    return api
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_Plugins_async(httpx_mock, with_plugin_base):
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, content=b"[]")
+    api = _api_plugin_async(with_plugin_base, httpx.AsyncClient)
+    r = await api._.xPets()
+    assert r[0].id == 3 and r[0].color == "red"
+    assert httpx_mock.get_request().headers["X-Signature"] == "signed"
+
+
+def test_Plugins_async_sync(httpx_mock, with_plugin_base):
+    httpx_mock.add_response(headers={"Content-Type": "application/json"}, content=b"[]")
+    api = _api_plugin_async(with_plugin_base, httpx.Client)
+    r = api._.xPets()
+    assert r[0].id == 3 and r[0].color == "red"
+    assert httpx_mock.get_request().headers["X-Signature"] == "signed"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_Plugins_async_sync_rejected(with_plugin_base):
+    api = _api_plugin_async(with_plugin_base, httpx.Client)
+    with pytest.raises(RuntimeError, match="coroutine plugin hooks"):
+        api._.xPets()
+
+
+def test_RequestBase_extension_points():
+    from aiopenapi3.request import RequestBase, AsyncRequestBase, complete
+
+    class Request(RequestBase):
+        def _process_stream(self, result):
+            return dict(), None
+
+        def _process_request(self, result):
+            return dict(), result.json()
+
+        def _prepare(self, data, parameters):
+            self.prepared = (data, parameters)
+
+        @property
+        def data(self):
+            return None
+
+        @property
+        def parameters(self):
+            return []
+
+    class AsyncRequest(Request, AsyncRequestBase):
+        pass
+
+    request = AsyncRequest.__new__(AsyncRequest)
+    complete(request._aprepare(b"data", {"a": 1}))
+    assert request.prepared == (b"data", {"a": 1})
+    assert complete(request._aprocess_request(httpx.Response(200, json=[1]))) == (dict(), [1])
@@ -0,0 +1,30 @@
+import tracemalloc
+
+from aiopenapi3 import OpenAPI
+
+
+def test_profile(petstore_expanded):
+    api = OpenAPI("/", petstore_expanded)
+
+    totals = api.profile.totals()
+    # no cycles - no model_rebuild
+    assert {"parse", "resolve", "operationindex", "get_type", "plugin"} == set(totals.keys())
+
+    names = {i.key for i in api.profile.report("get_type")}
+    assert {"Pet", "NewPet", "Error"} <= names
+
+    assert all(i.allocated is None for i in api.profile.samples)
+    assert all(0 <= i.own <= i.duration for i in api.profile.samples)
+
+    assert "get_type" in api.profile.format(limit=3)
+
+
+def test_profile_tracemalloc(petstore_expanded):
+    tracemalloc.start()
+    try:
+        api = OpenAPI("/", petstore_expanded)
+    finally:
+        tracemalloc.stop()
+
+    assert all(i.allocated is not None for i in api.profile.samples)
+    assert api.profile.as_dict()["samples"]
@@ -0,0 +1,122 @@
+import time
+
+import httpx
+import pytest
+
+from aiopenapi3 import OpenAPI
+from aiopenapi3.errors import HTTPStatusError
+from aiopenapi3.ratelimit import RateLimit, RateLimiter, TokenBucket
+
+
+def test_ratelimit_bucket(clock):
+    bucket = TokenBucket(RateLimit(rate=10, burst=2), clock)
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert [bucket.reserve() for _ in range(2)] == pytest.approx([0.1, 0.2])
+
+    # the tokens are refilled at the rate - up to burst
+    clock.sleep(0.5)
+    assert bucket.reserve() == 0 and bucket.tokens == pytest.approx(1)
+
+    # the remaining quota is spread until the reset
+    bucket = TokenBucket(None, clock)
+    assert bucket.reserve() == 0 and bucket.rate is None
+    bucket.update(remaining=10, reset=5, retry_after=None)
+    assert bucket.rate == 2 and bucket.tokens == 10
+    bucket.update(remaining=0, reset=5, retry_after=None)
+    assert bucket.reserve() == 5
+
+    # the rate configured is not exceeded
+    bucket = TokenBucket(RateLimit(rate=1))
+    bucket.update(remaining=100, reset=1, retry_after=None)
+    assert bucket.rate == 1
+
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+
+
+@pytest.mark.parametrize(
+    "headers, rate, blocked",
+    [
+        ({"RateLimit-Remaining": "10", "RateLimit-Reset": "5"}, 2, 0),
+        ({"X-RateLimit-Remaining": "200000", "X-RateLimit-Reset": str(int(time.time()) + 100000)}, 2, 0),
+        ({"RateLimit": "limit=100, remaining=50, reset=25"}, 2, 0),
+        ({"RateLimit": '"default";r=50;t=25'}, 2, 0),
+        ({"RateLimit-Remaining": "0", "RateLimit-Reset": "5"}, None, 5),
+        ({"Retry-After": "3"}, None, 3),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, None, 0),
+        ({"Retry-After": "invalid", "RateLimit-Reset": "inf"}, None, 0),
+    ],
+)
+def test_ratelimit_headers(headers, rate, blocked, clock):
+    bucket = TokenBucket(None, clock)
+    RateLimiter.update(bucket, httpx.Response(200, headers=headers))
+    assert bucket.rate == pytest.approx(rate, abs=0.2) if rate else bucket.rate is None
+    # epoch timestamps & dates are relative to time.time()
+    assert max(0, bucket.blocked - clock()) == pytest.approx(blocked, abs=1)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_ratelimit_request(httpx_mock, with_paths_ratelimit, clock):
+    api = OpenAPI("http://example.org/", with_paths_ratelimit, session_factory=httpx.Client)
+    api.rate_limit = RateLimiter(clock=clock, sleep=clock.sleep)
+    api.authenticate(key="a")
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+    httpx_mock.add_response(url="http://example.org/slow", json="ok")
+
+    # the specification extension of the Operation - in its own bucket
+    for _ in range(3):
+        api._.slow()
+    assert clock.slept == pytest.approx([0.2, 0.2])
+
+    # the specification extension of the description document
+    api._.items()
+    assert {(b.limit, b.rate) for b in api.rate_limit.buckets.values()} == {
+        (RateLimit(rate=5), 5),
+        (RateLimit(rate=50, burst=2), 50),
+    }
+
+    # operations precede the specification extension - for buckets created afterwards
+    api.rate_limit.operations["slow"] = RateLimit(rate=1000)
+    api.rate_limit.buckets.clear()
+    clock.slept.clear()
+    for _ in range(3):
+        api._.slow()
+    assert clock.slept == pytest.approx([0.001, 0.001])
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_ratelimit_retry_after(httpx_mock, with_paths_ratelimit, clock):
+    api = OpenAPI("http://example.org/", with_paths_ratelimit, session_factory=httpx.Client)
+    api.rate_limit = RateLimiter(RateLimit(rate=1000, burst=10), per="operation", clock=clock, sleep=clock.sleep)
+    api.authenticate(key="a")
+
+    httpx_mock.add_response(url="http://example.org/items", status_code=429, headers={"Retry-After": "0.3"}, json="")
+    with pytest.raises(HTTPStatusError):
+        api._.items()
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", json="ok")
+    assert api._.items() == "ok"
+    assert clock.slept == pytest.approx([0.3])
+    assert list(api.rate_limit.buckets.keys()) == [("operation", "items")]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_ratelimit_identity(httpx_mock, with_paths_ratelimit, clock):
+    api = OpenAPI("http://example.org/", with_paths_ratelimit, session_factory=httpx.AsyncClient)
+    api.rate_limit = RateLimiter(RateLimit(rate=5), per="identity", clock=clock, asleep=clock.asleep)
+    httpx_mock.add_response(url="http://example.org/items", json="ok", is_reusable=True)
+
+    # a bucket per identity - the requests of different identities do not wait for each other
+    for key in ("a", "b", "c"):
+        api.authenticate(key=key)
+        await api._.items()
+    assert clock.slept == []
+    assert len(api.rate_limit.buckets) == 3
+    # the credentials are not part of the key
+    assert [i[2][0] for i in api.rate_limit.buckets.keys()] == [("key",)] * 3
+    assert not any("'c'" in repr(i) for i in api.rate_limit.buckets.keys())
+
+    api.authenticate(key="a")
+    await api._.items()
+    assert clock.slept == pytest.approx([0.2])
+    assert len(api.rate_limit.buckets) == 3
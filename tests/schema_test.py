@@ -15,7 +15,7 @@ from pydantic import ValidationError
 import pydantic
 
 import aiopenapi3
-from aiopenapi3 import OpenAPI
+from aiopenapi3 import OpenAPI, FileSystemLoader
 from aiopenapi3.errors import ResponseSchemaError
 
 
@@ -84,6 +84,117 @@ def test_schema_recursion(with_schema_recursion):
     assert d.F[0].E == "esub"
 
 
+def test_schema_recursion_order(with_schema_recursion):
+    api = OpenAPI("/", with_schema_recursion)
+
+    rebuild = {i.key for i in api.profile.report("model_rebuild")}
+    assert {"A", "B", "D"} <= rebuild
+    assert "C" not in rebuild
+
+    for name in ["A", "B", "C", "D", "Expression"]:
+        assert api.components.schemas[name].get_type().__pydantic_complete__
+
+    c = api.components.schemas["C"].get_type().model_validate({"a": {"ofA": 1, "b": {"ofB": "b"}}})
+    assert c.a.b.ofB == "b"
+
+    # the TypedDicts of recursive models refer to each other by name
+    data = {"a": {"ofA": 1, "b": {"ofB": "b", "a": {"ofA": 2}}}}
+    assert api.components.schemas["C"].model(data, plain=True) == data
+    with pytest.raises(pydantic.ValidationError):
+        api.components.schemas["C"].model({"a": {"b": {"a": {"ofA": "x"}}}}, plain=True)
+
+
+def test_schema_structural(with_schema_structural):
+    api = OpenAPI("/", with_schema_structural)
+    A, B, C = (api.components.schemas[i] for i in "ABC")
+
+    # the inline page objects of A & B share the model, the one of C differs
+    assert A.properties["page"].get_type() is B.properties["page"].get_type()
+    assert A.properties["page"].get_type() is not C.properties["page"].get_type()
+
+    # the components A & B keep their own model
+    assert A.get_type() is not B.get_type()
+    assert A._get_identity() != B._get_identity()
+
+    b = B.get_type().model_validate({"page": {"next": "n", "count": 1}, "error": {"code": 1}})
+    assert isinstance(b, B.get_type()) and b.page.count == 1 and b.error.code == 1
+
+
+def test_schema_identity(with_schema_structural):
+    def identities():
+        api = OpenAPI("/", with_schema_structural)
+        return [api.components.schemas[i].properties["page"]._get_identity() for i in "ABC"]
+
+    a = identities()
+    assert a == identities()
+    # identical anonymous schemas are named alike
+    assert a[0] == a[1] != a[2]
+
+
+def test_schema_analysis(with_schema_structural):
+    from aiopenapi3.model import Model
+
+    api = OpenAPI("/", with_schema_structural)
+    schema = api.components.schemas["A"]
+
+    assert Model.types(schema) is not Model.types(schema)
+    with Model.analysis() as analysis:
+        assert Model.types(schema) is Model.types(schema)
+        assert analysis
+        analysis.clear()
+        assert not analysis
+
+
+def test_schema_analysis_discriminator(with_schema_union_inferred):
+    from aiopenapi3.model import Model
+
+    api = OpenAPI("/", with_schema_union_inferred)
+    t = (api.components.schemas["Key"].get_type(), api.components.schemas["Click"].get_type())
+
+    with patch.object(Model, "_discriminatorLiteral", wraps=Model._discriminatorLiteral) as literal:
+        with Model.analysis():
+            Model.createUnion(t)
+            Model.createUnion(t)
+        assert literal.call_count == 1
+
+
+def test_schema_model_root(with_schema_oneOf):
+    api = OpenAPI("/", with_schema_oneOf)
+    AL = api.components.schemas["AL"]
+    A = api.components.schemas["A"].get_type()
+
+    with patch.object(AL.get_type(), "model_validate") as model_validate:
+        r = AL.model([{"type": "a", "value": 1}])
+        assert model_validate.call_count == 0
+    assert isinstance(r, list) and isinstance(r[0], A)
+    assert AL.model_json(b'[{"type": "a", "value": 1}]') == r
+
+    with pytest.raises(ValidationError):
+        AL.model([{"type": "b"}])
+
+    with pytest.raises(ValidationError) as e:
+        AL.model_json(b"[")
+    assert e.value.errors()[0]["type"] == "json_invalid"
+
+    a = api.components.schemas["A"]
+    assert a.model_json('{"type": "a", "value": 1}') == a.model({"type": "a", "value": 1})
+
+
+def test_schema_identity_documents():
+    api = OpenAPI.load_file(
+        "schema-identity-documents.yaml",
+        "schema-identity-documents.yaml",
+        loader=FileSystemLoader(Path("tests/fixtures")),
+    )
+    A = api.components.schemas["A"]
+    B = api.components.schemas["B"]._target
+
+    # the same $ref refers to X of the respective document
+    assert A.properties["x"]._get_identity() != B.properties["x"]._get_identity()
+    assert A.get_type().model_validate({"x": {"x": {"a": "a"}}}).x.x.a == "a"
+    assert B.get_type().model_validate({"x": {"x": {"b": 1}}}).x.x.b == 1
+
+
 def test_schema_self_recursion(with_schema_self_recursion):
     api = OpenAPI("/", with_schema_self_recursion)
 
@@ -354,10 +465,82 @@ def test_schema_with_patternProperties(with_schema_patternProperties):
         O.model_validate({"X_5": {1: 2}})
 
 
+def test_schema_patternProperties_plain(with_schema_patternProperties):
+    import aiopenapi3.model
+
+    api = OpenAPI("/", with_schema_patternProperties)
+    A = api.components.schemas["A"]
+
+    # plain data is validated using the validators of the model
+    assert A.model({"I_5": 1, "S_5": "5"}, plain=True) == {"I_5": 1, "S_5": "5"}
+    with pytest.raises(ValidationError):
+        A.model({"I_5": "1", "X_5": "2"}, plain=True)
+
+    # the TypedDicts are not registered in the module
+    assert not [i for i in vars(aiopenapi3.model) if i.startswith("A_")]
+
+
+def test_schema_patternProperties_matcher(with_schema_patternProperties):
+    from aiopenapi3.model import Model
+
+    # combined alternation
+    match = Model.patternMatcher(("^I_", "^S_", "^I"))
+    assert [match(i) for i in ("I_5", "S_5", "I5", "X_5")] == ["^I_", "^S_", "^I", None]
+
+    # patterns using groups are matched one after another
+    match = Model.patternMatcher((r"^(a)\1", "^a"))
+    assert [match(i) for i in ("aa", "ab", "b")] == [r"^(a)\1", "^a", None]
+
+    assert Model.patternMatcher(tuple())("a") is None
+
+    api = OpenAPI("/", with_schema_patternProperties)
+    A = api.components.schemas["A"].get_type()
+    a = A.model_validate({"I_5": 100, "S_5": "5"})
+    assert a.aio3_patternProperties == {"^S_": [("S_5", "5")], "^I_": [("I_5", 100)]}
+
+    # properties added after validation
+    setattr(a, "S_6", "6")
+    assert a.aio3_patternProperties == {"^S_": [("S_5", "5"), ("S_6", "6")], "^I_": [("I_5", 100)]}
+    assert list(a.aio3_patternProperty("^S_")) == [("S_5", "5"), ("S_6", "6")]
+    assert list(a.aio3_patternProperty("^[IS]_5")) == [("I_5", 100), ("S_5", "5")]
+
+
 def test_schema_discriminated_union(with_schema_discriminated_union):
     api = OpenAPI("/", with_schema_discriminated_union)
 
 
+def test_schema_union_inferred(with_schema_union_inferred):
+    api = OpenAPI("/", with_schema_union_inferred)
+    schemas = api.components.schemas
+
+    def discriminator(m):
+        annotation = m.model_fields["root"].annotation
+        if typing.get_origin(annotation) is not typing.Annotated:
+            return None
+        return getattr(d := typing.get_args(annotation)[1], "discriminator", d)
+
+    # a required Literal property
+    Event = schemas["Event"].get_type()
+    assert discriminator(Event) == "kind"
+    assert isinstance(Event.model_validate({"kind": "key", "code": 1}).root, schemas["Key"].get_type())
+    with pytest.raises(ValidationError):
+        Event.model_validate({"kind": "drag"})
+
+    # a unique property if additional properties are forbidden
+    Shape = schemas["Shape"].get_type()
+    assert callable(discriminator(Shape))
+    assert isinstance(Shape.model_validate({"radius": 1}).root, schemas["Circle"].get_type())
+    assert isinstance(Shape.model_validate({"side": 1}).root, schemas["Square"].get_type())
+    assert isinstance(Shape.model_validate({}).root, (schemas["Circle"].get_type(), schemas["Square"].get_type()))
+    with pytest.raises(ValidationError):
+        Shape.model_validate({"radius": 1, "side": 1})
+
+    # not distinguishable
+    Any = schemas["Any"].get_type()
+    assert discriminator(Any) is None
+    assert isinstance(Any.model_validate({"radius": 1}).root, schemas["Circle"].get_type())
+
+
 def test_schema_discriminated_union_discriminator_name(with_schema_discriminated_union_discriminator_name):
     api = OpenAPI("/", with_schema_discriminated_union_discriminator_name)
 
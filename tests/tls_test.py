@@ -16,6 +16,7 @@ import cryptography
 
 import aiopenapi3
 from aiopenapi3.plugin import Document
+from aiopenapi3.tls import ssl_context, session_factory
 
 from fastapi import FastAPI, Request, Response
 
@@ -254,3 +255,27 @@ async def test_certificate_invalid(client):
     assert isinstance(e.value.__context__, FileNotFoundError) and e.value.__context__.args[0] == sorted(
         map(lambda x: Path(x), p)
     )
+
+
+def test_ssl_context_shared(certs):
+    c = certs["org"]["certs"]["client"]
+    cert = (str(c["certfile"]), str(c["keyfile"]))
+
+    assert ssl_context() is ssl_context(True)
+    assert ssl_context(cert=cert) is ssl_context(cert=list(cert)) is not ssl_context()
+    assert ssl_context(certs["org"]["issuer"]) is not ssl_context()
+    assert ssl_context(False).verify_mode == ssl.CERT_NONE
+    assert ssl_context(minimum_version=ssl.TLSVersion.TLSv1_3).minimum_version == ssl.TLSVersion.TLSv1_3
+    assert ssl_context(http2=True) is not ssl_context()
+
+    # the default session factories share the SSLContext, custom session factories are used as is
+    assert session_factory(httpx.Client) is aiopenapi3.tls.Client
+    assert session_factory(httpx.AsyncClient) is aiopenapi3.tls.AsyncClient
+    assert session_factory(self_signed := lambda *args, **kwargs: None) is self_signed
+    with aiopenapi3.tls.Client(cert=cert) as a, aiopenapi3.tls.Client(cert=cert) as b:
+        assert a._transport._pool._ssl_context is b._transport._pool._ssl_context is ssl_context(cert=cert)
+
+    # httpcore sets the ALPN protocols for each connection - http2 sessions use their own SSLContext
+    with aiopenapi3.tls.Client(http2=True) as a, aiopenapi3.tls.Client() as b:
+        assert a._transport._pool._ssl_context is ssl_context(http2=True)
+        assert b._transport._pool._ssl_context is ssl_context()
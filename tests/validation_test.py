@@ -0,0 +1,164 @@
+import logging
+
+import httpx
+import pydantic
+import pytest
+
+from aiopenapi3 import OpenAPI, ResponseSchemaError
+from aiopenapi3.validation import ValidationPolicy
+
+
+@pytest.fixture
+def api(with_paths_response_validation):
+    return OpenAPI("http://example.org/", with_paths_response_validation, session_factory=httpx.Client)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_validation_full(httpx_mock, api):
+    httpx_mock.add_response(json={"name": "invalid"})
+    with pytest.raises(ResponseSchemaError):
+        api._.full()
+
+    # configured on the OpenAPI object
+    api.validation.operations["full"] = policy = ValidationPolicy("trusted")
+    r = api._.full()
+    assert isinstance(r, api.components.schemas["Item"].get_type()) and r.name == "invalid"
+    assert (policy.validated, policy.trusted) == (0, 1)
+
+    api.validation.default = ValidationPolicy("trusted")
+    del api.validation.operations["full"]
+    assert api._.full().name == "invalid"
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_validation_trusted(httpx_mock, api):
+    httpx_mock.add_response(json={"name": "invalid"})
+    r = api._.trusted()
+    assert isinstance(r, api.components.schemas["Item"].get_type()) and r.name == "invalid"
+    policy = api.validation[api._["trusted"].operation]
+    assert (policy.mode, policy.validated, policy.trusted, policy.rate) == ("trusted", 0, 1, 0.0)
+
+    # the type is still checked
+    httpx_mock.add_response(json={"name": {}})
+    with pytest.raises(ResponseSchemaError):
+        api._.trusted()
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_validation_sampled(httpx_mock, api, caplog):
+    policy = api.validation[api._["sampled"].operation]
+    assert (policy.mode, policy.sample, policy.rate) == ("sampled", 2, None)
+
+    httpx_mock.add_response(json={"name": "abc"})
+    for _ in range(4):
+        api._.sampled()
+    assert (policy.validated, policy.trusted, policy.violations, policy.rate) == (2, 2, 0, 0.5)
+
+    httpx_mock.reset()
+    httpx_mock.add_response(json={"name": "invalid"})
+    with caplog.at_level(logging.WARNING, logger="aiopenapi3.validation"):
+        for _ in range(2):
+            assert api._.sampled().name == "invalid"
+    assert (policy.validated, policy.trusted, policy.violations) == (2, 4, 1)
+    assert "violates" in caplog.text
+
+
+def test_validation_policy():
+    with pytest.raises(ValueError):
+        ValidationPolicy("none")
+    with pytest.raises(ValueError):
+        ValidationPolicy("sampled", sample=0)
+    assert ValidationPolicy.from_extension({"mode": "sampled", "sample": 10}) == ValidationPolicy("sampled", 10)
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_validation_fields(httpx_mock, with_paths_response_fields):
+    api = OpenAPI("http://example.org/", with_paths_response_fields, session_factory=httpx.Client)
+    item = {
+        "id": 1,
+        "status": "ok",
+        "owner": {"name": "alice", "mail": "invalid"},
+        "children": [{"id": 2, "status": "ok", "owner": {"name": "bob"}}],
+    }
+
+    httpx_mock.add_response(url="http://example.org/item", json=item)
+    with pytest.raises(ResponseSchemaError):
+        api._.item()
+
+    r = api._.item(fields=["id", "owner.name", "children.owner.name"])
+    assert r.model_dump(exclude_unset=True) == {
+        "id": 1,
+        "owner": {"name": "alice"},
+        "children": [{"owner": {"name": "bob"}}],
+    }
+    assert not hasattr(r, "status") and not hasattr(r.owner, "mail")
+
+    # the reduced model is cached
+    schema = api.components.schemas["Item"]
+    assert schema._get_adapter(["owner.name", "id", "children.owner.name"], False) is schema._get_adapter(
+        ["id", "owner.name", "children.owner.name"], False
+    )
+
+    # the fields selected are validated
+    httpx_mock.add_response(url="http://example.org/items", json=[item, {"id": "x"}])
+    with pytest.raises(ResponseSchemaError):
+        api._.items(fields=["id"])
+
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/items", json=[item, item])
+    assert [i.id for i in api._.items(fields=["id"])] == [1, 1]
+
+    with pytest.raises(ValueError, match="no property name"):
+        api._.items(fields=["owner.mail", "name"])
+
+
+def test_validation_fields_schema(with_paths_response_fields):
+    api = OpenAPI("http://example.org/", with_paths_response_fields, session_factory=httpx.Client)
+
+    # the discriminator of the Union is kept
+    pet = api.components.schemas["Pet"]
+    r = pet.model({"petType": "cat", "name": "tom", "lives": 9}, fields=["name"])
+    assert r.name == "tom" and not hasattr(r, "lives")
+    assert pet.model({"petType": "dog", "name": "rex"}, fields=["name"], plain=True) == {
+        "petType": "dog",
+        "name": "rex",
+    }
+
+    # trusted does not check the constraints
+    item = {"id": 1, "status": "ok", "owner": {"name": "alice", "mail": "invalid"}}
+    schema = api.components.schemas["Item"]
+    with pytest.raises(pydantic.ValidationError):
+        schema.model(item, fields=["owner.mail"])
+    assert schema.model(item, fields=["owner.mail"], trusted=True).owner.mail == "invalid"
+    assert schema.model(item, plain=True, trusted=True)["owner"]["mail"] == "invalid"
+
+
+@pytest.mark.httpx_mock(can_send_already_matched_responses=True)
+def test_validation_plain(httpx_mock, with_paths_response_fields):
+    api = OpenAPI("http://example.org/", with_paths_response_fields, session_factory=httpx.Client)
+    item = {
+        "id": 1,
+        "status": "ok",
+        "owner": {"name": "alice"},
+        "children": [{"id": 2, "status": "ok", "owner": {"name": "bob", "mail": "b@x"}}],
+    }
+
+    httpx_mock.add_response(url="http://example.org/item", json=item)
+    r = api._.item(plain=True)
+    assert type(r) is dict and r == item
+
+    # the data is validated
+    httpx_mock.add_response(url="http://example.org/items", json=[item, {"id": 2, "status": "ok", "unknown": 1}])
+    with pytest.raises(ResponseSchemaError):
+        api._.items(plain=True)
+
+    httpx_mock.reset()
+    httpx_mock.add_response(url="http://example.org/item", json=item)
+    httpx_mock.add_response(url="http://example.org/items", json=[item, item])
+    r = api._.items(plain=True, fields=["id", "owner.name"])
+    assert r == [{"id": 1, "owner": {"name": "alice"}}] * 2
+
+    # the default
+    api.plain = True
+    assert api._.item() == item
+    assert isinstance(api._.item(plain=False), pydantic.BaseModel)